@@ -139,9 +139,17 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 ENABLE_ASR = config('ENABLE_ASR', default=True, cast=bool)
 WHISPER_MODEL_SIZE = config('WHISPER_MODEL_SIZE', default='base')  # Options: tiny, base, small, medium, large
 WHISPER_DEVICE = config('WHISPER_DEVICE', default='cpu')  # Options: cpu, cuda (if GPU available)
+WHISPER_FLASH_ATTENTION = config('WHISPER_FLASH_ATTENTION', default=False, cast=bool)  # CUDA only (Ampere+)
+WHISPER_DOWNLOAD_ROOT = config('WHISPER_DOWNLOAD_ROOT', default=None)  # Model directory (None: Hugging Face cache)
+WHISPER_PREWARM = config('WHISPER_PREWARM', default=False, cast=bool)  # Load and warm up the model at startup
+WHISPER_IDLE_TIMEOUT = config('WHISPER_IDLE_TIMEOUT', default=0, cast=int)  # Unload after N idle seconds (0 = never)
+TRANSCRIBE_QUALITY = config('TRANSCRIBE_QUALITY', default='accurate')  # Options: accurate (beam search), fast (greedy)
 MAX_VIDEO_DURATION = config('MAX_VIDEO_DURATION', default=14400, cast=int)  # 4 hours in seconds
 AUTO_CLEANUP_AUDIO = config('AUTO_CLEANUP_AUDIO', default=True, cast=bool)
 ASR_TIMEOUT = config('ASR_TIMEOUT', default=14400, cast=int)  # 240 minutes
+SPECULATIVE_ASR_PREFETCH = config('SPECULATIVE_ASR_PREFETCH', default=False, cast=bool)  # Download audio while probing subtitles
+TRANSCRIPTION_CACHE_SIZE = config('TRANSCRIPTION_CACHE_SIZE', default=32, cast=int)  # Cached transcripts (0 = off)
+BLOG_CONTENT_CACHE_SIZE = config('BLOG_CONTENT_CACHE_SIZE', default=256, cast=int)  # Cached generated articles (0 = off)
 
 # Media settings for temp files
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -1,15 +1,34 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from .models import BlogPost
 
+
+class BlogPostChangeList(ChangeList):
+    def get_queryset(self, request, *args, **kwargs):
+        # Skip the generated article body, which the changelist never renders.
+        # Only here, so the change and delete views still load the full row at once.
+        return super().get_queryset(request, *args, **kwargs).only(
+            'id', 'youtube_title', 'user__username', 'created_at'
+        )
+
+
 @admin.register(BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
     list_display = ('youtube_title', 'user', 'created_at')
     list_filter = ('created_at', 'user')
+    list_select_related = ('user',)
+    list_per_page = 50
+    show_full_result_count = False
+    ordering = ('-created_at',)
     search_fields = ('youtube_title', 'youtube_link')
     readonly_fields = ('created_at',)
-    
+
+    def get_changelist(self, request, **kwargs):
+        return BlogPostChangeList
+
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        # Join the user row up front so the 'user' column doesn't cost a query per row
+        qs = super().get_queryset(request).select_related('user')
         if request.user.is_superuser:
             return qs
         return qs.filter(user=request.user)
@@ -1,6 +1,20 @@
+import threading
+
 from django.apps import AppConfig
 
 
 class BlogGeneratorConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "blog_generator"
+
+    def ready(self):
+        from .transcription.config import ENABLE_ASR, WHISPER_PREWARM
+
+        # Opt-in, since it also runs for management commands. Warm up in the
+        # background so the worker starts serving right away; a request that
+        # needs the model meanwhile waits on the load instead of repeating it.
+        if ENABLE_ASR and WHISPER_PREWARM:
+            from .transcription.whisper_service import prewarm_whisper_model
+            threading.Thread(
+                target=prewarm_whisper_model, name='whisper-prewarm', daemon=True
+            ).start()
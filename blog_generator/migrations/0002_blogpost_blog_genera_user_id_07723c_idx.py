@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 17:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_generator', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['user', '-created_at'], name='blog_genera_user_id_07723c_idx'),
+        ),
+    ]
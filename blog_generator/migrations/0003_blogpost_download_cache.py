@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_generator', '0002_blogpost_blog_genera_user_id_07723c_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='download_filename',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='download_text',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -1,15 +1,39 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+# Fields the stored download is rendered from
+_DOWNLOAD_SOURCE_FIELDS = frozenset({'youtube_title', 'generated_content'})
+
 class BlogPost(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     youtube_title = models.CharField(max_length=300)
     youtube_link = models.URLField()
     generated_content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Plain-text download, rendered on first download (see download_blog)
+    download_text = models.TextField(null=True, blank=True, editable=False)
+    download_filename = models.CharField(max_length=64, null=True, blank=True, editable=False)
     
     def __str__(self):
         return self.youtube_title
     
+    def save(self, *args, **kwargs):
+        # An edited post renders a different download; rebuild it on next request
+        if self.pk is not None:
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None:
+                self.download_text = None
+                self.download_filename = None
+            elif _DOWNLOAD_SOURCE_FIELDS.intersection(update_fields):
+                self.download_text = None
+                self.download_filename = None
+                kwargs['update_fields'] = {
+                    *update_fields, 'download_text', 'download_filename'
+                }
+        super().save(*args, **kwargs)
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
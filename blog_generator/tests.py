@@ -1,3 +1,331 @@
+import json
+from unittest.mock import Mock, patch
+
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
 from django.test import TestCase
+from django.urls import reverse
+
+from . import views
+from .models import BlogPost
+from .views import generate_blog_from_transcript
+
+
+class BlogContentTests(TestCase):
+    """Tests for generate_blog_from_transcript()."""
+    
+    def test_filler_between_punctuation_keeps_sentence_ending(self):
+        """Test a filler removed between punctuation marks leaves them as one ending."""
+        transcript = (
+            "Hello there this is the first sentence here. "
+            "And now the second one really?um. "
+            "And the third sentence comes now okay. "
+            "This is the fourth sentence for sure."
+        )
+        
+        content = generate_blog_from_transcript(transcript)
+        
+        self.assertIn("And now the second one really?. And the third", content)
+    
+    def test_fillers_removed_across_whitespace(self):
+        """Test multi-word fillers split by odd whitespace are still removed."""
+        transcript = (
+            "Hello there this is the first sentence here. "
+            "And now the second one really?you\n\tknow uh. like. "
+            "And the third sentence comes now okay."
+        )
+        
+        content = generate_blog_from_transcript(transcript)
+        
+        self.assertIn("And now the second one really? And the third", content)
+        self.assertNotIn("know", content)
+    
+    def test_short_article_keeps_three_paragraphs(self):
+        """Test short articles stop at three paragraphs of three sentences."""
+        transcript = ' '.join(f"This is sentence number {i} of the talk." for i in range(20))
+        
+        content = generate_blog_from_transcript(transcript, {'article_length': 'short'})
+        
+        self.assertIn("sentence number 8 of", content)
+        self.assertNotIn("sentence number 9 of", content)
+
+
+class BlogViewTestCase(TestCase):
+    """Shared fixtures: two users, each owning one post."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', password='pass')
+        cls.other = User.objects.create_user('other', password='pass')
+        cls.post = BlogPost.objects.create(
+            user=cls.owner,
+            youtube_title='My Video: Part 1',
+            youtube_link='https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            generated_content='<p>Hello &amp; <strong>welcome</strong> to the article.</p>'
+        )
+        cls.other_post = BlogPost.objects.create(
+            user=cls.other,
+            youtube_title='Other Video',
+            youtube_link='https://www.youtube.com/watch?v=other',
+            generated_content='<p>Someone else\'s article.</p>'
+        )
+    
+    def setUp(self):
+        self.client.force_login(self.owner)
+
+
+class BlogOwnershipTests(BlogViewTestCase):
+    """Tests that posts are only reachable by their owner."""
+    
+    def test_blog_details_own_post(self):
+        """Test the owner can view their post."""
+        response = self.client.get(reverse('blog-details', args=[self.post.pk]))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['blog_article_detail'], self.post)
+    
+    def test_blog_details_other_users_post_is_404(self):
+        """Test another user's post is reported as not found."""
+        response = self.client.get(reverse('blog-details', args=[self.other_post.pk]))
+        
+        self.assertEqual(response.status_code, 404)
+    
+    def test_blog_details_missing_post_is_404(self):
+        """Test a post that doesn't exist is a 404 rather than a server error."""
+        response = self.client.get(reverse('blog-details', args=[999999]))
+        
+        self.assertEqual(response.status_code, 404)
+    
+    def test_delete_blog_own_post(self):
+        """Test the owner can delete their post."""
+        response = self.client.post(reverse('delete-blog', args=[self.post.pk]))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertFalse(BlogPost.objects.filter(pk=self.post.pk).exists())
+    
+    def test_delete_blog_other_users_post_is_404(self):
+        """Test deleting another user's post fails and leaves it in place."""
+        response = self.client.post(reverse('delete-blog', args=[self.other_post.pk]))
+        
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.json()['success'])
+        self.assertTrue(BlogPost.objects.filter(pk=self.other_post.pk).exists())
+    
+    def test_download_blog_other_users_post_is_404(self):
+        """Test another user's post can't be downloaded."""
+        response = self.client.get(reverse('download-blog', args=[self.other_post.pk]))
+        
+        self.assertEqual(response.status_code, 404)
+    
+    def test_all_blogs_lists_own_posts_with_preview(self):
+        """Test the list shows only the user's posts, with a content preview."""
+        response = self.client.get(reverse('all-blogs'))
+        
+        articles = list(response.context['blog_articles'])
+        self.assertEqual(articles, [self.post])
+        self.assertEqual(articles[0].content_preview, self.post.generated_content)
+        self.assertContains(response, 'to the article.')
+
+
+class DownloadBlogTests(BlogViewTestCase):
+    """Tests for the stored plain-text download."""
+    
+    def test_first_download_is_stored(self):
+        """Test the first download renders the text and stores it on the row."""
+        response = self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertEqual(
+            response['Content-Disposition'],
+            'attachment; filename="My-Video-Part-1-article.txt"'
+        )
+        body = response.content.decode()
+        self.assertIn('Hello', body)
+        self.assertIn('welcome to the article.', body)
+        self.assertNotIn('<p>', body)
+        
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.download_text, body)
+        self.assertEqual(self.post.download_filename, 'My-Video-Part-1-article.txt')
+    
+    def test_later_downloads_reuse_stored_text(self):
+        """Test later downloads send the stored text without rendering again."""
+        self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        # update() bypasses save(), so the stored download is left in place
+        BlogPost.objects.filter(pk=self.post.pk).update(generated_content='<p>Changed</p>')
+        with patch.object(views, '_html_to_text') as mock_html_to_text:
+            response = self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        mock_html_to_text.assert_not_called()
+        self.assertIn('welcome to the article.', response.content.decode())
+    
+    def test_save_clears_stored_download(self):
+        """Test saving an edited post makes the next download render it again."""
+        self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        post = BlogPost.objects.get(pk=self.post.pk)
+        post.generated_content = '<p>Edited article body.</p>'
+        post.save()
+        
+        post.refresh_from_db()
+        self.assertIsNone(post.download_text)
+        self.assertIsNone(post.download_filename)
+        
+        response = self.client.get(reverse('download-blog', args=[self.post.pk]))
+        self.assertIn('Edited article body.', response.content.decode())
+    
+    def test_partial_save_clears_stored_download(self):
+        """Test save(update_fields=...) of the article body also clears the download."""
+        self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        post = BlogPost.objects.get(pk=self.post.pk)
+        post.generated_content = '<p>Edited article body.</p>'
+        post.save(update_fields=['generated_content'])
+        
+        post.refresh_from_db()
+        self.assertIsNone(post.download_text)
+        self.assertIsNone(post.download_filename)
+        
+        # Saving unrelated fields keeps the stored download
+        self.client.get(reverse('download-blog', args=[self.post.pk]))
+        post = BlogPost.objects.get(pk=self.post.pk)
+        post.youtube_link = 'https://www.youtube.com/watch?v=changed'
+        post.save(update_fields=['youtube_link'])
+        
+        post.refresh_from_db()
+        self.assertIsNotNone(post.download_text)
+    
+    def test_long_download_is_streamed(self):
+        """Test downloads longer than DOWNLOAD_CHUNK_CHARS are streamed in chunks."""
+        short = self.client.get(reverse('download-blog', args=[self.post.pk]))
+        self.assertNotIsInstance(short, StreamingHttpResponse)
+        
+        body = 'é' * views.DOWNLOAD_CHUNK_CHARS
+        BlogPost.objects.filter(pk=self.post.pk).update(generated_content=f'<p>{body}</p>')
+        post = BlogPost.objects.get(pk=self.post.pk)
+        post.save()
+        
+        response = self.client.get(reverse('download-blog', args=[self.post.pk]))
+        
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertIn(body, b''.join(response.streaming_content).decode('utf-8'))
+
+
+class GenerateBlogTests(BlogViewTestCase):
+    """Tests for the generate_blog response."""
+    
+    transcript = ' '.join(f"This is sentence number {i} of the talk." for i in range(6))
+    
+    def generate(self, **extra):
+        transcript_result = {'success': True, 'text': self.transcript, 'method': 'subtitles'}
+        with patch.object(views, 'yt_title', return_value='Test Video'), \
+                patch.object(views, 'yt_transcript', return_value=transcript_result):
+            return self.client.post(
+                reverse('generate-blog'),
+                json.dumps({'link': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ', **extra}),
+                content_type='application/json'
+            )
+    
+    def test_transcript_omitted_by_default(self):
+        """Test the raw transcript is left out unless requested."""
+        response = self.generate()
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertIn('sentence number 0', data['content'])
+        self.assertNotIn('transcript', data)
+    
+    def test_transcript_included_when_requested(self):
+        """Test include_transcript adds the raw transcript to the response."""
+        response = self.generate(include_transcript=True)
+        
+        self.assertEqual(response.json()['transcript'], self.transcript)
+    
+    def test_generated_post_is_saved_for_user(self):
+        """Test a signed-in user's generated article is stored."""
+        self.generate()
+        
+        post = BlogPost.objects.filter(user=self.owner, youtube_title='Test Video').get()
+        self.assertIn('sentence number 0', post.generated_content)
+
+
+class BlogPostAdminTests(BlogViewTestCase):
+    """Tests for the BlogPost admin querysets."""
+    
+    def setUp(self):
+        self.admin_user = User.objects.create_superuser('admin', password='pass')
+        self.client.force_login(self.admin_user)
+    
+    def test_changelist_skips_article_body(self):
+        """Test the changelist doesn't load generated_content."""
+        response = self.client.get(reverse('admin:blog_generator_blogpost_changelist'))
+        
+        self.assertEqual(response.status_code, 200)
+        posts = list(response.context['cl'].result_list)
+        self.assertEqual(len(posts), 2)
+        self.assertIn('generated_content', posts[0].get_deferred_fields())
+    
+    def test_change_view_loads_full_row(self):
+        """Test the change form gets every field from the one post query."""
+        url = reverse('admin:blog_generator_blogpost_change', args=[self.post.pk])
+        
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['original'].get_deferred_fields(), set())
+
 
-# Create your tests here.
+class EnhanceContentCompressionTests(TestCase):
+    """Tests for Brotli negotiation on enhance_content."""
+    
+    def enhance(self, **headers):
+        return self.client.post(
+            reverse('enhance-content'),
+            json.dumps({'content': 'Some article text. ' * 200, 'enhancement_type': 'improve'}),
+            content_type='application/json',
+            **headers
+        )
+    
+    def test_accepts_brotli(self):
+        """Test Accept-Encoding parsing, including q=0 refusals."""
+        def accepts(value):
+            request = Mock(META={'HTTP_ACCEPT_ENCODING': value})
+            return views._accepts_brotli(request)
+        
+        self.assertTrue(accepts('gzip, deflate, br'))
+        self.assertTrue(accepts('br;q=0.5'))
+        self.assertFalse(accepts('br;q=0'))
+        self.assertFalse(accepts('gzip, deflate'))
+        self.assertFalse(accepts(''))
+    
+    def test_compressed_when_client_accepts_brotli(self):
+        """Test large responses are Brotli-encoded for clients that accept it."""
+        mock_brotli = Mock()
+        mock_brotli.compress.return_value = b'compressed'
+        with patch.object(views, 'brotli', mock_brotli):
+            response = self.enhance(HTTP_ACCEPT_ENCODING='gzip, br')
+        
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response.content, b'compressed')
+        self.assertIn('Accept-Encoding', response['Vary'])
+    
+    def test_uncompressed_when_client_does_not_accept_brotli(self):
+        """Test clients without br get plain JSON, marked as varying by encoding."""
+        with patch.object(views, 'brotli', Mock()):
+            response = self.enhance(HTTP_ACCEPT_ENCODING='gzip')
+        
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertTrue(response.json()['success'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+    
+    def test_uncompressed_without_brotli_installed(self):
+        """Test responses are sent as-is when brotli isn't installed."""
+        with patch.object(views, 'brotli', None):
+            response = self.enhance(HTTP_ACCEPT_ENCODING='br')
+        
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertTrue(response.json()['success'])
@@ -6,6 +6,7 @@ Tests for audio_extractor.py, whisper_service.py, and transcript_cleaner.py
 
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -26,25 +27,30 @@ from blog_generator.transcription import (
 class AudioExtractorTests(TestCase):
     """Tests for audio_extractor.py functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temp directory shared by the whole class."""
+        super().setUpClass()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temp directory."""
+        cls._tmp.cleanup()
+        super().tearDownClass()
+    
     def setUp(self):
         """Set up test fixtures."""
         self.valid_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         self.invalid_url = "https://invalid-url.com/video"
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Clean up temp directory
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        audio_extractor.clear_audio_info_cache()
     
     @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
     def test_get_audio_info_success(self, mock_ydl_class):
         """Test successful audio info extraction."""
         # Mock the YoutubeDL instance
-        mock_ydl = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = mock_ydl_class.return_value
         
         # Mock video info
         mock_ydl.extract_info.return_value = {
@@ -62,11 +68,86 @@ class AudioExtractorTests(TestCase):
         self.assertEqual(result['video_id'], 'test123')
         self.assertEqual(result['language'], 'en')
     
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_get_audio_info_cached(self, mock_ydl_class):
+        """Test repeated lookups are served from cache and errors are not cached."""
+        mock_ydl = mock_ydl_class.return_value
+        
+        import yt_dlp
+        mock_ydl.extract_info.side_effect = [
+            yt_dlp.utils.DownloadError("Video not available"),
+            {'duration': 180, 'title': 'Test Video', 'id': 'test123'},
+        ]
+        
+        with self.assertRaises(exceptions.InvalidURLError):
+            audio_extractor.get_audio_info(self.valid_url)
+        first = audio_extractor.get_audio_info(self.valid_url)
+        first['title'] = 'Mutated'
+        second = audio_extractor.get_audio_info(self.valid_url)
+        
+        self.assertEqual(mock_ydl.extract_info.call_count, 2)
+        self.assertEqual(second['title'], 'Test Video')
+        # Both fetches reused one YoutubeDL instance
+        self.assertEqual(mock_ydl_class.call_count, 1)
+    
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_get_audio_info_cached_by_video_id(self, mock_ydl_class):
+        """Test different URL forms of one video share a cache entry."""
+        mock_ydl = mock_ydl_class.return_value
+        mock_ydl.extract_info.return_value = {
+            'duration': 180, 'title': 'Test Video', 'id': 'dQw4w9WgXcQ'
+        }
+        
+        audio_extractor.get_audio_info(self.valid_url)
+        audio_extractor.get_audio_info("https://youtu.be/dQw4w9WgXcQ?si=tracking")
+        audio_extractor.get_audio_info(self.valid_url + "&t=42s")
+        
+        self.assertEqual(mock_ydl.extract_info.call_count, 1)
+    
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_get_audio_info_failed_fetch_keeps_lock_for_waiters(self, mock_ydl_class):
+        """Test a failed lookup doesn't let a new arrival fetch alongside the waiters."""
+        import threading
+        import yt_dlp
+        
+        active = {'current': 0, 'max': 0}
+        active_lock = threading.Lock()
+        
+        def extract_info(url, download=False, process=True):
+            with active_lock:
+                active['current'] += 1
+                active['max'] = max(active['max'], active['current'])
+            try:
+                time.sleep(0.05)
+                raise yt_dlp.utils.DownloadError("Video not available")
+            finally:
+                with active_lock:
+                    active['current'] -= 1
+        mock_ydl_class.side_effect = lambda opts: MagicMock(
+            extract_info=MagicMock(side_effect=extract_info)
+        )
+        
+        def run():
+            with self.assertRaises(exceptions.InvalidURLError):
+                audio_extractor.get_audio_info(self.valid_url)
+        
+        threads = []
+        for _ in range(4):
+            thread = threading.Thread(target=run)
+            thread.start()
+            threads.append(thread)
+            # Stagger arrivals so some come after the first fetch has failed
+            time.sleep(0.03)
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(active['max'], 1)
+        self.assertEqual(audio_extractor._audio_info_fetch_locks, {})
+    
     @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
     def test_get_audio_info_invalid_url(self, mock_ydl_class):
         """Test handling of invalid URLs."""
-        mock_ydl = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+        mock_ydl = mock_ydl_class.return_value
         
         # Simulate download error
         import yt_dlp
@@ -75,6 +156,229 @@ class AudioExtractorTests(TestCase):
         with self.assertRaises(exceptions.InvalidURLError):
             audio_extractor.get_audio_info(self.invalid_url)
     
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_extract_audio_rejects_long_video_in_download(self, mock_ydl_class):
+        """Test the download's match_filter enforces duration without a separate probe."""
+        from blog_generator.transcription.config import MAX_VIDEO_DURATION
+        
+        def make_ydl(opts):
+            def extract_info(url, download=False):
+                # yt-dlp runs match_filter on the extracted info before downloading
+                opts['match_filter']({'id': 'dQw4w9WgXcQ', 'duration': MAX_VIDEO_DURATION + 1})
+            ydl = MagicMock()
+            ydl.__enter__.return_value.extract_info.side_effect = extract_info
+            return ydl
+        mock_ydl_class.side_effect = make_ydl
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', Path(self.temp_dir)):
+            with self.assertRaises(exceptions.DurationLimitError):
+                audio_extractor.extract_audio(self.valid_url)
+    
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_extract_audio_reuses_finished_extraction(self, mock_ydl_class):
+        """Test a second extraction of the same video links the first one's file."""
+        reuse_dir = Path(self.temp_dir) / 'reuse'
+        reuse_dir.mkdir()
+        info = {'success': True, 'duration': 60, 'title': 'Test Video',
+                'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        
+        def make_ydl(opts):
+            def extract_info(url, download=False):
+                Path(opts['outtmpl'] + '.wav').write_bytes(b'audio')
+                return {'id': 'dQw4w9WgXcQ', 'duration': 60, 'title': 'Test Video'}
+            ydl = MagicMock()
+            ydl.__enter__.return_value.extract_info.side_effect = extract_info
+            return ydl
+        mock_ydl_class.side_effect = make_ydl
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', reuse_dir):
+            first = audio_extractor.extract_audio(self.valid_url, info=info)
+            second = audio_extractor.extract_audio(self.valid_url, info=info)
+        
+        self.assertEqual(mock_ydl_class.call_count, 1)
+        self.assertNotEqual(first['audio_path'], second['audio_path'])
+        self.assertTrue(os.path.samefile(first['audio_path'], second['audio_path']))
+        self.assertEqual(second['title'], 'Test Video')
+        
+        # Each caller can clean up its own path independently
+        audio_extractor.cleanup_audio_file(first['audio_path'])
+        self.assertTrue(os.path.exists(second['audio_path']))
+        
+        # Only the download's YoutubeDL was created, no metadata probe
+        self.assertEqual(mock_ydl_class.call_count, 1)
+    
+    @patch('blog_generator.transcription.audio_extractor.os.link')
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_extract_audio_reuse_copies_without_hard_links(self, mock_ydl_class, mock_link):
+        """Test reuse falls back to a private copy when hard links are unsupported."""
+        copy_dir = Path(self.temp_dir) / 'reuse_copy'
+        copy_dir.mkdir()
+        info = {'success': True, 'duration': 60, 'title': 'Test Video',
+                'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        mock_link.side_effect = OSError("Operation not permitted")
+        
+        def make_ydl(opts):
+            def extract_info(url, download=False):
+                Path(opts['outtmpl'] + '.wav').write_bytes(b'audio')
+                return {'id': 'dQw4w9WgXcQ', 'duration': 60, 'title': 'Test Video'}
+            ydl = MagicMock()
+            ydl.__enter__.return_value.extract_info.side_effect = extract_info
+            return ydl
+        mock_ydl_class.side_effect = make_ydl
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', copy_dir):
+            first = audio_extractor.extract_audio(self.valid_url, info=info)
+            second = audio_extractor.extract_audio(self.valid_url, info=info)
+        
+        self.assertEqual(mock_ydl_class.call_count, 1)
+        self.assertNotEqual(first['audio_path'], second['audio_path'])
+        self.assertFalse(os.path.samefile(first['audio_path'], second['audio_path']))
+        
+        # Cleaning up the first caller's file leaves the second one's intact
+        audio_extractor.cleanup_audio_file(first['audio_path'])
+        self.assertEqual(Path(second['audio_path']).read_bytes(), b'audio')
+    
+    @patch('blog_generator.transcription.audio_extractor.yt_dlp.YoutubeDL')
+    def test_extract_audio_concurrent_same_video_downloads_once(self, mock_ydl_class):
+        """Test concurrent extractions of one video share a single download, one at a time."""
+        import threading
+        
+        shared_dir = Path(self.temp_dir) / 'concurrent'
+        shared_dir.mkdir()
+        info = {'success': True, 'duration': 60, 'title': 'Test Video',
+                'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        
+        def make_ydl(opts):
+            def extract_info(url, download=False):
+                time.sleep(0.1)
+                Path(opts['outtmpl'] + '.wav').write_bytes(b'audio')
+                return {'id': 'dQw4w9WgXcQ', 'duration': 60, 'title': 'Test Video'}
+            ydl = MagicMock()
+            ydl.__enter__.return_value.extract_info.side_effect = extract_info
+            return ydl
+        mock_ydl_class.side_effect = make_ydl
+        
+        # Track how many threads are inside the lock at once
+        holders = {'current': 0, 'max': 0}
+        holders_lock = threading.Lock()
+        real_reuse = audio_extractor._reuse_extracted_audio
+        
+        def tracking_reuse(*args):
+            with holders_lock:
+                holders['current'] += 1
+                holders['max'] = max(holders['max'], holders['current'])
+            try:
+                time.sleep(0.05)
+                return real_reuse(*args)
+            finally:
+                with holders_lock:
+                    holders['current'] -= 1
+        
+        results = []
+        
+        def run():
+            results.append(audio_extractor.extract_audio(self.valid_url, info=info))
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', shared_dir), \
+                patch.object(audio_extractor, '_reuse_extracted_audio', tracking_reuse):
+            threads = []
+            for _ in range(4):
+                thread = threading.Thread(target=run)
+                thread.start()
+                threads.append(thread)
+                # Stagger arrivals so some come after the first holder has left
+                time.sleep(0.06)
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(len(results), 4)
+        self.assertEqual(mock_ydl_class.call_count, 1)
+        self.assertEqual(holders['max'], 1)
+        self.assertEqual(audio_extractor._extraction_locks, {})
+    
+    def _mock_pcm_pipeline(self, mock_popen, pcm=b'', ydl_returncode=0, ydl_stderr=b''):
+        """Make subprocess.Popen return fake yt-dlp and ffmpeg processes."""
+        ydl = MagicMock(returncode=ydl_returncode)
+        ffmpeg = MagicMock(returncode=0)
+        ffmpeg.communicate.return_value = (pcm, b'')
+        
+        def popen(cmd, **kwargs):
+            if cmd[0] == audio_extractor._FFMPEG_LOCATION:
+                return ffmpeg
+            # yt-dlp's stderr is a temp file the extractor reads back
+            kwargs['stderr'].write(ydl_stderr)
+            return ydl
+        mock_popen.side_effect = popen
+    
+    @patch('blog_generator.transcription.audio_extractor.subprocess.Popen')
+    @patch('blog_generator.transcription.audio_extractor.get_audio_info')
+    def test_extract_audio_pcm_success(self, mock_info, mock_popen):
+        """Test streamed int16 PCM is converted to float samples in [-1, 1]."""
+        import numpy as np
+        
+        mock_info.return_value = {'success': True, 'duration': 60, 'title': 'Test Video',
+                                  'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16).tobytes()
+        self._mock_pcm_pipeline(mock_popen, pcm=pcm)
+        
+        with patch.object(audio_extractor, 'AUDIO_DTYPE', 'float32'):
+            result = audio_extractor.extract_audio_pcm(self.valid_url)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['audio'].dtype, np.float32)
+        np.testing.assert_allclose(result['audio'], [0.0, 0.5, -1.0, 32767 / 32768])
+        self.assertEqual(result['video_id'], 'dQw4w9WgXcQ')
+        self.assertEqual(mock_popen.call_count, 2)
+    
+    @patch('blog_generator.transcription.audio_extractor.subprocess.Popen')
+    @patch('blog_generator.transcription.audio_extractor.get_audio_info')
+    def test_extract_audio_pcm_download_errors(self, mock_info, mock_popen):
+        """Test yt-dlp failures map to the same errors as extract_audio()."""
+        mock_info.return_value = {'success': True, 'duration': 60, 'title': 'Test Video',
+                                  'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        
+        self._mock_pcm_pipeline(
+            mock_popen, ydl_returncode=1, ydl_stderr=b'ERROR: Video not available'
+        )
+        with self.assertRaises(exceptions.InvalidURLError):
+            audio_extractor.extract_audio_pcm(self.valid_url)
+        
+        self._mock_pcm_pipeline(
+            mock_popen, ydl_returncode=1, ydl_stderr=b'ERROR: Read timeout'
+        )
+        with self.assertRaises(exceptions.NetworkError):
+            audio_extractor.extract_audio_pcm(self.valid_url)
+    
+    @patch('blog_generator.transcription.audio_extractor.subprocess.Popen')
+    @patch('blog_generator.transcription.audio_extractor.get_audio_info')
+    def test_extract_audio_pcm_empty_stream(self, mock_info, mock_popen):
+        """Test an empty audio stream is reported as an extraction error."""
+        mock_info.return_value = {'success': True, 'duration': 60, 'title': 'Test Video',
+                                  'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        self._mock_pcm_pipeline(mock_popen, pcm=b'')
+        
+        with self.assertRaises(exceptions.AudioExtractionError):
+            audio_extractor.extract_audio_pcm(self.valid_url)
+    
+    @patch('blog_generator.transcription.audio_extractor.subprocess.Popen')
+    @patch('blog_generator.transcription.audio_extractor.get_audio_info')
+    def test_extract_audio_pcm_float16(self, mock_info, mock_popen):
+        """Test AUDIO_DTYPE='float16' gives a half-size waveform in [-1, 1]."""
+        import numpy as np
+        
+        mock_info.return_value = {'success': True, 'duration': 60, 'title': 'Test Video',
+                                  'video_id': 'dQw4w9WgXcQ', 'language': 'en'}
+        pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16).tobytes()
+        self._mock_pcm_pipeline(mock_popen, pcm=pcm)
+        
+        with patch.object(audio_extractor, 'AUDIO_DTYPE', 'float16'):
+            result = audio_extractor.extract_audio_pcm(self.valid_url)
+        
+        audio = result['audio']
+        self.assertEqual(audio.dtype, np.float16)
+        self.assertTrue(np.all(np.abs(audio) <= 1.0))
+        np.testing.assert_allclose(audio, [0.0, 0.5, -1.0, 1.0], atol=1e-3)
+    
     def test_validate_video_duration_too_short(self):
         """Test rejection of videos that are too short."""
         # Check the MIN_VIDEO_DURATION from config
@@ -97,10 +401,22 @@ class AudioExtractorTests(TestCase):
         except exceptions.DurationLimitError:
             self.fail("validate_video_duration raised DurationLimitError unexpectedly")
     
+    def test_ensure_temp_directory_recreates_removed_dir(self):
+        """Test the temp directory is recreated if it is removed at runtime."""
+        from blog_generator.transcription import config
+        
+        temp_audio_dir = Path(self.temp_dir) / 'ensured'
+        with patch.object(config, 'TEMP_AUDIO_DIR', temp_audio_dir):
+            config.ensure_temp_directory()
+            temp_audio_dir.rmdir()
+            config.ensure_temp_directory()
+        
+        self.assertTrue(temp_audio_dir.is_dir())
+    
     def test_cleanup_audio_file_success(self):
         """Test successful audio file cleanup."""
         # Create a temporary file
-        temp_file = os.path.join(self.temp_dir, 'test_audio.wav')
+        temp_file = os.path.join(self.temp_dir, f'{self.id()}.wav')
         with open(temp_file, 'w') as f:
             f.write('test')
         
@@ -111,12 +427,64 @@ class AudioExtractorTests(TestCase):
     
     def test_cleanup_audio_file_nonexistent(self):
         """Test cleanup of non-existent file."""
-        nonexistent_file = os.path.join(self.temp_dir, 'nonexistent.wav')
+        nonexistent_file = os.path.join(self.temp_dir, f'{self.id()}.wav')
         
         result = audio_extractor.cleanup_audio_file(nonexistent_file)
         
         # Should succeed (file already gone)
         self.assertTrue(result['success'])
+    
+    def test_cleanup_old_audio_files(self):
+        """Test only expired audio files are deleted."""
+        cleanup_dir = Path(self.temp_dir) / 'cleanup'
+        cleanup_dir.mkdir()
+        old_file = cleanup_dir / 'old.wav'
+        new_file = cleanup_dir / 'new.wav'
+        other_file = cleanup_dir / 'old.txt'
+        for path in (old_file, new_file, other_file):
+            path.write_bytes(b'data')
+        two_days_ago = os.path.getmtime(new_file) - 48 * 3600
+        os.utime(old_file, (two_days_ago, two_days_ago))
+        os.utime(other_file, (two_days_ago, two_days_ago))
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', cleanup_dir):
+            result = audio_extractor.cleanup_old_audio_files(max_age_hours=24)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['deleted_count'], 1)
+        self.assertFalse(old_file.exists())
+        self.assertTrue(new_file.exists())
+        self.assertTrue(other_file.exists())
+    
+    def test_cleanup_old_audio_files_uses_index(self):
+        """Test cleanup deletes indexed files and files present when the index opened."""
+        cleanup_dir = Path(self.temp_dir) / 'indexed'
+        cleanup_dir.mkdir()
+        leftover_file = cleanup_dir / 'leftover.wav'
+        indexed_file = cleanup_dir / 'indexed.wav'
+        two_days_ago = os.path.getmtime(cleanup_dir) - 48 * 3600
+        leftover_file.write_bytes(b'data')
+        os.utime(leftover_file, (two_days_ago, two_days_ago))
+        
+        with patch.object(audio_extractor, 'TEMP_AUDIO_DIR', cleanup_dir):
+            # Opening the index picks up files written before it existed
+            result = audio_extractor.cleanup_old_audio_files(max_age_hours=24)
+            self.assertEqual(result['deleted_count'], 1)
+            
+            indexed_file.write_bytes(b'data')
+            os.utime(indexed_file, (two_days_ago, two_days_ago))
+            audio_extractor._index_audio_file(str(indexed_file), two_days_ago)
+            
+            result = audio_extractor.cleanup_old_audio_files(max_age_hours=24)
+            self.assertEqual(result['deleted_count'], 1)
+            
+            # Already-deleted files are dropped from the index quietly
+            result = audio_extractor.cleanup_old_audio_files(max_age_hours=24)
+            self.assertEqual(result['deleted_count'], 0)
+            self.assertEqual(result['failed_count'], 0)
+        
+        self.assertFalse(leftover_file.exists())
+        self.assertFalse(indexed_file.exists())
 
 
 # ============================================================================
@@ -126,23 +494,36 @@ class AudioExtractorTests(TestCase):
 class WhisperServiceTests(TestCase):
     """Tests for whisper_service.py functions."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_audio_path = os.path.join(self.temp_dir, 'test_audio.wav')
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temp directory and dummy audio file shared by the class."""
+        super().setUpClass()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+        cls.test_audio_path = os.path.join(cls.temp_dir, 'test_audio.wav')
         
         # Create a dummy audio file
-        with open(self.test_audio_path, 'wb') as f:
+        with open(cls.test_audio_path, 'wb') as f:
             f.write(b'RIFF' + b'\x00' * 100)  # Minimal WAV header
+        
+        whisper_service.unload_whisper_model()
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temp directory."""
+        cls._tmp.cleanup()
         
         # Unload any cached model
         whisper_service.unload_whisper_model()
+        super().tearDownClass()
+    
+    def setUp(self):
+        """Start each test with no cached model."""
+        whisper_service.unload_whisper_model()
+    
+    def tearDown(self):
+        """Drop any model a test loaded."""
+        whisper_service.unload_whisper_model()
     
     def test_validate_audio_file_exists(self):
         """Test validation of existing audio file."""
@@ -159,58 +540,263 @@ class WhisperServiceTests(TestCase):
     
     def test_validate_audio_file_empty(self):
         """Test validation of empty audio file."""
-        empty_file = os.path.join(self.temp_dir, 'empty.wav')
+        empty_file = os.path.join(self.temp_dir, f'{self.id()}.wav')
         with open(empty_file, 'w') as f:
             pass  # Create empty file
         
         with self.assertRaises(exceptions.AudioFormatError):
             whisper_service.validate_audio_file(empty_file)
     
-    @patch('whisper.load_model')
-    def test_load_whisper_model_success(self, mock_load_model):
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_load_whisper_model_success(self):
         """Test successful Whisper model loading."""
-        mock_model = MagicMock()
-        mock_load_model.return_value = mock_model
-        
-        # Unload any cached model first
-        whisper_service.unload_whisper_model()
+        import sys
+        mock_model_class = sys.modules['faster_whisper'].WhisperModel
         
         model = whisper_service.load_whisper_model('base')
         
-        self.assertIsNotNone(model)
-        mock_load_model.assert_called_once()
+        self.assertIs(model, mock_model_class.return_value)
+        mock_model_class.assert_called_once()
     
-    @patch('whisper.load_model')
-    def test_load_whisper_model_caching(self, mock_load_model):
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_load_whisper_model_caching(self):
         """Test that model is loaded once and cached."""
-        mock_model = MagicMock()
-        mock_load_model.return_value = mock_model
-        
-        # Unload any cached model first
-        whisper_service.unload_whisper_model()
+        import sys
+        mock_model_class = sys.modules['faster_whisper'].WhisperModel
         
         # Load model twice
         model1 = whisper_service.load_whisper_model('base')
         model2 = whisper_service.load_whisper_model('base')
         
-        # Should only call load_model once (second call uses cache)
-        self.assertEqual(mock_load_model.call_count, 1)
-        self.assertEqual(model1, model2)
+        # Should only construct the model once (second call uses cache)
+        self.assertEqual(mock_model_class.call_count, 1)
+        self.assertIs(model1, model2)
     
-    @patch('whisper.load_model')
-    def test_load_whisper_model_invalid_size(self, mock_load_model):
-        """Test handling of invalid model size."""
-        mock_model = MagicMock()
-        mock_load_model.return_value = mock_model
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_load_whisper_model_hit_does_not_wait_for_other_load(self):
+        """Test a resident model is returned while another model is loading."""
+        import sys
+        import threading
+        
+        whisper_service.unload_whisper_model()
+        whisper_service.load_whisper_model('base', device='cpu')
+        
+        started = threading.Event()
+        release = threading.Event()
+        def slow_model(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return MagicMock()
+        sys.modules['faster_whisper'].WhisperModel.side_effect = slow_model
         
-        # Unload any cached model first
+        loader = threading.Thread(
+            target=whisper_service.load_whisper_model, args=('tiny',), kwargs={'device': 'cpu'}
+        )
+        loader.start()
+        try:
+            self.assertTrue(started.wait(5))
+            start = time.monotonic()
+            whisper_service.load_whisper_model('base', device='cpu')
+            self.assertLess(time.monotonic() - start, 1)
+        finally:
+            release.set()
+            loader.join()
+            whisper_service.unload_whisper_model()
+    
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_load_whisper_model_force_reload_keeps_other_models(self):
+        """Test force_reload only replaces the requested model."""
+        import sys
+        
+        whisper_service.unload_whisper_model()
+        sys.modules['faster_whisper'].WhisperModel.side_effect = lambda *a, **k: MagicMock()
+        
+        base = whisper_service.load_whisper_model('base', device='cpu')
+        tiny = whisper_service.load_whisper_model('tiny', device='cpu')
+        reloaded = whisper_service.load_whisper_model('tiny', device='cpu', force_reload=True)
+        
+        self.assertIsNot(reloaded, tiny)
+        self.assertIs(whisper_service.load_whisper_model('base', device='cpu'), base)
+        self.assertEqual(sys.modules['faster_whisper'].WhisperModel.call_count, 3)
         whisper_service.unload_whisper_model()
+    
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_load_whisper_model_invalid_size(self):
+        """Test handling of invalid model size."""
+        import sys
+        mock_model_class = sys.modules['faster_whisper'].WhisperModel
         
         # Should default to 'base' for invalid size
         model = whisper_service.load_whisper_model('invalid_size')
         
         # Should still load successfully with default
         self.assertIsNotNone(model)
+        self.assertEqual(mock_model_class.call_args[0][0], 'base')
+    
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_audio_cached_by_content(self, mock_load_model):
+        """Test identical audio content is transcribed once."""
+        whisper_service.clear_transcription_cache()
+        paths = []
+        for name in ('first', 'second'):
+            path = os.path.join(self.temp_dir, f'{self.id()}_{name}.wav')
+            with open(path, 'wb') as f:
+                f.write(b'RIFF' + b'\x01' * 2000)
+            paths.append(path)
+        mock_load_model.return_value.transcribe.side_effect = lambda *a, **k: (
+            iter([Mock(text=' Hello world again.', avg_logprob=-0.1)]), Mock(language='en')
+        )
+        
+        first = whisper_service.transcribe_audio(paths[0])
+        second = whisper_service.transcribe_audio(paths[1])
+        
+        self.assertTrue(first['success'])
+        self.assertEqual(first, second)
+        self.assertEqual(mock_load_model.return_value.transcribe.call_count, 1)
+    
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_audio_widens_float16_waveform(self, mock_load_model):
+        """Test a float16 waveform is passed to the model as float32."""
+        import numpy as np
+        
+        mock_load_model.return_value.transcribe.return_value = (
+            iter([Mock(text=' Hello from memory.', avg_logprob=-0.1)]), Mock(language='en')
+        )
+        audio = np.full(16000, 0.25, dtype=np.float16)
+        
+        result = whisper_service.transcribe_audio(audio)
+        
+        self.assertTrue(result['success'])
+        passed = mock_load_model.return_value.transcribe.call_args[0][0]
+        self.assertEqual(passed.dtype, np.float32)
+        np.testing.assert_allclose(passed, 0.25)
+    
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_audio_timeout(self, mock_load_model):
+        """Test the timeout works off the main thread and stops decoding."""
+        audio_path = os.path.join(self.temp_dir, f'{self.id()}.wav')
+        with open(audio_path, 'wb') as f:
+            f.write(b'RIFF' + b'\x00' * 2000)
+        
+        decoded = []
+        def slow_segments():
+            for i in range(50):
+                time.sleep(0.05)
+                decoded.append(i)
+                yield Mock(text=f' Segment {i}.', avg_logprob=-0.1)
+        mock_load_model.return_value.transcribe.return_value = (
+            slow_segments(), Mock(language='en')
+        )
+        
+        result = whisper_service.transcribe_audio(audio_path, timeout=0.1)
+        
+        self.assertFalse(result['success'])
+        self.assertIn('timed out', result['error'])
+        
+        # The worker notices the cancellation instead of decoding all 50 segments
+        time.sleep(0.3)
+        self.assertLess(len(decoded), 10)
+    
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_audio_timeout_excludes_queue_time(self, mock_load_model):
+        """Test time spent waiting for a busy pool doesn't count against the timeout."""
+        import threading
+        
+        whisper_service.clear_transcription_cache()
+        audio_path = os.path.join(self.temp_dir, f'{self.id()}.wav')
+        with open(audio_path, 'wb') as f:
+            f.write(b'RIFF' + b'\x02' * 2000)
+        mock_load_model.return_value.transcribe.side_effect = lambda *a, **k: (
+            iter([Mock(text=' Queued but not timed out.', avg_logprob=-0.1)]), Mock(language='en')
+        )
+        
+        # Occupy every pool worker for longer than the timeout
+        release = threading.Event()
+        blockers = [
+            whisper_service._transcribe_executor.submit(release.wait, 5)
+            for _ in range(whisper_service._transcribe_executor._max_workers)
+        ]
+        threading.Timer(0.3, release.set).start()
+        
+        result = whisper_service.transcribe_audio(audio_path, timeout=0.2)
+        for blocker in blockers:
+            blocker.result()
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['text'], 'Queued but not timed out.')
+    
+    @patch('blog_generator.transcription.whisper_service.WHISPER_NUM_WORKERS', 2)
+    @patch('blog_generator.transcription.whisper_service.DEFAULT_LANGUAGE', None)
+    @patch('blog_generator.transcription.audio_extractor.cleanup_audio_file')
+    @patch('blog_generator.transcription.audio_extractor.split_audio_segments')
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_long_audio(self, mock_load_model, mock_split, mock_cleanup):
+        """Test long audio is transcribed in pieces with shifted timestamps."""
+        mock_split.return_value = [(0.0, 'part000.wav'), (600.0, 'part001.wav')]
+        
+        def fake_transcribe(path, **kwargs):
+            segment = Mock(text=f' Piece {path[4:7]} text.', start=1.0, end=2.5, avg_logprob=-0.1)
+            return iter([segment]), Mock(language='de')
+        mock_load_model.return_value.transcribe.side_effect = fake_transcribe
+        
+        result = whisper_service.transcribe_long_audio(self.test_audio_path, clean=False)
+        
+        # The language detected on the first piece is reused for the rest
+        languages = [
+            call.kwargs['language']
+            for call in mock_load_model.return_value.transcribe.call_args_list
+        ]
+        self.assertEqual(languages, [None, 'de'])
+        
+        self.assertTrue(result['success'])
+        self.assertTrue(result['text'].startswith('Piece 000 text.'))
+        self.assertTrue(result['text'].endswith('Piece 001 text.'))
+        self.assertEqual(
+            [(seg['start'], seg['end']) for seg in result['segments']],
+            [(1.0, 2.5), (601.0, 602.5)]
+        )
+        self.assertEqual(mock_cleanup.call_count, 2)
+    
+    @patch('blog_generator.transcription.whisper_service.WHISPER_NUM_WORKERS', 1)
+    @patch('blog_generator.transcription.whisper_service.transcribe_audio')
+    @patch('blog_generator.transcription.audio_extractor.split_audio_segments')
+    def test_transcribe_long_audio_single_worker(self, mock_split, mock_transcribe):
+        """Test long audio isn't split when pieces couldn't run in parallel."""
+        mock_transcribe.return_value = {'success': True, 'text': 'Whole file.'}
+        
+        result = whisper_service.transcribe_long_audio(self.test_audio_path, clean=False)
+        
+        self.assertEqual(result['text'], 'Whole file.')
+        mock_split.assert_not_called()
+        self.assertEqual(mock_transcribe.call_args[0][0], self.test_audio_path)
+    
+    @patch('blog_generator.transcription.whisper_service.WHISPER_NUM_WORKERS', 2)
+    @patch('blog_generator.transcription.audio_extractor.cleanup_audio_file')
+    @patch('blog_generator.transcription.audio_extractor.split_audio_segments')
+    @patch('blog_generator.transcription.whisper_service.load_whisper_model')
+    def test_transcribe_long_audio_timeout(self, mock_load_model, mock_split, mock_cleanup):
+        """Test long audio is bounded by one overall timeout and stops decoding."""
+        mock_split.return_value = [(0.0, 'part000.wav'), (600.0, 'part001.wav')]
+        
+        decoded = []
+        def slow_segments():
+            for i in range(50):
+                time.sleep(0.05)
+                decoded.append(i)
+                yield Mock(text=f' Segment {i}.', start=i, end=i + 1, avg_logprob=-0.1)
+        mock_load_model.return_value.transcribe.side_effect = lambda *a, **k: (
+            slow_segments(), Mock(language='en')
+        )
+        
+        result = whisper_service.transcribe_long_audio(self.test_audio_path, timeout=0.1)
+        
+        self.assertFalse(result['success'])
+        self.assertIn('timed out', result['error'])
+        self.assertEqual(mock_cleanup.call_count, 2)
+        
+        # The workers notice the cancellation instead of decoding every segment
+        time.sleep(0.3)
+        self.assertLess(len(decoded), 20)
     
     def test_get_model_info_no_model_loaded(self):
         """Test get_model_info when no model is loaded."""
@@ -220,7 +806,32 @@ class WhisperServiceTests(TestCase):
         
         self.assertFalse(info['loaded'])
         self.assertIsNone(info['model_size'])
-    
+
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    def test_get_model_info_reports_loaded_device(self):
+        """Test get_model_info reports the device the model was loaded on."""
+        whisper_service.unload_whisper_model()
+        whisper_service.load_whisper_model('tiny', device='cpu')
+
+        info = whisper_service.get_model_info()
+        whisper_service.unload_whisper_model()
+
+        self.assertTrue(info['loaded'])
+        self.assertEqual(info['model_size'], 'tiny')
+        self.assertEqual(info['device'], 'cpu')
+
+    @patch.dict('sys.modules', {'faster_whisper': MagicMock()})
+    @patch('blog_generator.transcription.whisper_service.WHISPER_IDLE_TIMEOUT', 0.05)
+    def test_idle_model_is_unloaded(self):
+        """Test the model is unloaded after WHISPER_IDLE_TIMEOUT without use."""
+        whisper_service.unload_whisper_model()
+        whisper_service.load_whisper_model('tiny', device='cpu')
+        self.assertTrue(whisper_service.get_model_info()['loaded'])
+
+        time.sleep(0.3)
+
+        self.assertFalse(whisper_service.get_model_info()['loaded'])
+
     def test_unload_whisper_model(self):
         """Test unloading Whisper model."""
         # Unload should not raise exception even if no model loaded
@@ -257,6 +868,15 @@ class TranscriptCleanerTests(TestCase):
         self.assertIn('Hello', result)
         self.assertIn('world', result)
     
+    def test_remove_timestamps_line_start_after_other_timestamps(self):
+        """Test a line-start timestamp is removed once the timestamps before it are."""
+        self.assertEqual(transcript_cleaner.remove_timestamps('<01:02:03>12:34 uh'), 'uh')
+        self.assertEqual(transcript_cleaner.remove_timestamps('[0:01]0:02 text'), 'text')
+        self.assertEqual(
+            transcript_cleaner.remove_timestamps('00:00:01,000 --> 00:00:02,000 text\n0:03 more'),
+            ' text\nmore'
+        )
+    
     def test_remove_filler_words(self):
         """Test removal of filler words."""
         text = "Um, so like, you know, this is basically a test, right?"
@@ -349,6 +969,14 @@ class TranscriptCleanerTests(TestCase):
         self.assertIn('fox', result)
         self.assertIn('jumps', result)
     
+    def test_clean_transcript_segments(self):
+        """Test segment-by-segment cleaning carries sentence state across segments."""
+        segments = [" hello    world .", " this is  basically a test", " you know", ""]
+        result = transcript_cleaner.clean_transcript_segments(segments)
+        
+        self.assertEqual(result, "Hello world. This is a test.")
+        self.assertEqual(result, transcript_cleaner.clean_transcript(''.join(segments)))
+    
     def test_segment_transcript_basic(self):
         """Test basic transcript segmentation."""
         text = "First sentence. Second sentence. Third sentence."
@@ -385,6 +1013,20 @@ class TranscriptCleanerTests(TestCase):
 class ErrorHandlingTests(TestCase):
     """Tests for error handling scenarios."""
     
+    def test_errors_survive_pickling(self):
+        """Test pickled errors keep both their technical and user messages."""
+        import pickle
+        
+        for error in (
+            exceptions.TranscriptionError('tech', 'friendly'),
+            exceptions.NetworkError('connection reset'),
+            exceptions.DurationLimitError('Video is 90 minutes long'),
+        ):
+            restored = pickle.loads(pickle.dumps(error))
+            self.assertIs(type(restored), type(error))
+            self.assertEqual(restored.message, error.message)
+            self.assertEqual(restored.get_user_message(), error.get_user_message())
+    
     def test_invalid_url_error_user_message(self):
         """Test InvalidURLError provides user-friendly message."""
         error = exceptions.InvalidURLError("Technical error message")
@@ -5,23 +5,45 @@ This module handles downloading and extracting audio from YouTube videos
 using yt-dlp, with proper error handling and validation.
 """
 
+import atexit
+import contextlib
+import hashlib
 import os
+import re
+import secrets
+import sys
 import logging
+import sqlite3
+import subprocess
+import tempfile
 import time
+import threading
+import zlib
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import yt_dlp
 import shutil
-import base64
+import binascii
+
+try:
+    import fcntl
+except ImportError:  # Windows: extractions only coalesce within a process
+    fcntl = None
 
 from .config import (
     TEMP_AUDIO_DIR,
     AUDIO_FORMAT,
     AUDIO_SAMPLE_RATE,
     AUDIO_CHANNELS,
+    AUDIO_DTYPE,
     MAX_VIDEO_DURATION,
     MIN_VIDEO_DURATION,
     MAX_AUDIO_FILE_SIZE_MB,
+    AUDIO_INFO_CACHE_TTL,
+    AUDIO_INFO_CACHE_SIZE,
+    AUDIO_SEGMENT_SECONDS,
     ensure_temp_directory
 )
 from .exceptions import (
@@ -35,6 +57,98 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Successful get_audio_info() results: key -> (expires_at, info), where the
+# key is the video ID when one can be parsed from the URL. Kept in LRU order
+# and guarded by a lock since requests probe from several threads.
+_audio_info_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_audio_info_cache_lock = threading.Lock()
+
+# Per-key locks so concurrent misses for the same video run yt-dlp only once.
+# Each entry is [lock, users] and is dropped once its last user (holder or
+# waiter) leaves.
+_audio_info_fetch_locks: Dict[str, list] = {}
+
+# YouTube video ID in watch, short-link, shorts and embed URLs
+_RE_VIDEO_ID = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([\w-]{11})')
+
+# (YOUTUBE_COOKIES_BASE64 value, resolved cookies path) from the last
+# _setup_cookies() call, reused as long as the env var is unchanged
+_cookies_resolved: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+# Last free-space reading for TEMP_AUDIO_DIR. Free space changes slowly, so a
+# reading with plenty of headroom is reused for _DISK_SPACE_CACHE_TTL seconds.
+_DISK_SPACE_CACHE_TTL = 30
+_disk_space_cache = {'checked_at': float('-inf'), 'available_mb': 0.0}
+
+# SQLite index of (path, mtime) for audio files in TEMP_AUDIO_DIR, so old-file
+# cleanup is a range query instead of a stat of every file in the directory.
+# One connection per index file, shared across threads under the lock.
+_AUDIO_INDEX_NAME = 'index.db'
+_audio_index_conns: Dict[str, sqlite3.Connection] = {}
+_audio_index_lock = threading.Lock()
+
+# Extractions to the same file are serialized so concurrent requests for one
+# video share a single download. Per-path thread locks, plus byte-range locks
+# on a lock file in TEMP_AUDIO_DIR to coordinate between processes. Each entry
+# is [lock, users] and is dropped once its last user (holder or waiter) leaves.
+_EXTRACTION_LOCK_NAME = '.extract.lock'
+_extraction_locks: Dict[str, list] = {}
+_extraction_lock_fds: Dict[str, int] = {}
+_extraction_locks_lock = threading.Lock()
+
+# Resolved once at import instead of searching PATH on every download
+_FFMPEG_LOCATION = shutil.which('ffmpeg') or '/usr/bin/ffmpeg'
+
+# YouTube-specific options to bypass bot detection
+_PLAYER_CLIENTS = ('android', 'ios', 'web', 'mediaconnect')
+_SKIP_MANIFESTS = ('hls', 'dash')
+_YOUTUBE_EXTRACTOR_ARGS = {
+    'youtube': {
+        'player_client': list(_PLAYER_CLIENTS),
+        'skip': list(_SKIP_MANIFESTS)
+    }
+}
+
+# Base yt-dlp options, built once and read-only; call sites merge per-call
+# fields with {**base, ...} instead of rebuilding the whole nested dict.
+
+# yt-dlp options for metadata-only lookups (cookiefile is added per instance)
+_INFO_YDL_OPTS = MappingProxyType({
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    'extractor_args': _YOUTUBE_EXTRACTOR_ARGS,
+})
+
+# yt-dlp options for audio downloads (outtmpl and cookiefile are added per call)
+_DOWNLOAD_YDL_OPTS = MappingProxyType({
+    # Prefer itag 140 (m4a, 128kbps): Whisper resamples to 16kHz mono
+    # anyway, so a fixed small audio stream is all we need
+    'format': '140/bestaudio[ext=m4a]/bestaudio/best',
+    'skip_download': False,
+    'postprocessors': [{
+        'key': 'FFmpegExtractAudio',
+        'preferredcodec': AUDIO_FORMAT,
+        'preferredquality': '192',
+    }],
+    'quiet': False,
+    'no_warnings': False,
+    'postprocessor_args': [
+        '-ar', str(AUDIO_SAMPLE_RATE),  # Sample rate: 16kHz
+        '-ac', str(AUDIO_CHANNELS),      # Channels: mono
+    ],
+    'ffmpeg_location': _FFMPEG_LOCATION,
+    # Force IPv4 (helps with some data center IP blocks)
+    'source_address': '0.0.0.0',
+    'extractor_args': _YOUTUBE_EXTRACTOR_ARGS,
+})
+
+# Idle YoutubeDL instances for metadata lookups. A YoutubeDL object can serve
+# many extract_info() calls but not two threads at once, so each lookup
+# borrows one and returns it afterwards. Stored as (cookiefile, ydl) pairs.
+_idle_info_ydls: deque = deque()
+
 
 # ============================================================================
 # Core Functions
@@ -44,35 +158,137 @@ def _setup_cookies() -> Optional[str]:
     """
     Setup cookies from environment variable if available.
     Returns path to cookies file or None.
+    
+    The result is resolved once and reused until YOUTUBE_COOKIES_BASE64
+    changes, so repeat calls don't decode, write or stat anything.
     """
-    cookies_path = Path('cookies/cookies.txt')
+    global _cookies_resolved
     
     # Check if cookies provided via env var (secure way for Render)
     cookies_b64 = os.environ.get('YOUTUBE_COOKIES_BASE64')
+    resolved = _cookies_resolved
+    if resolved is not None and resolved[0] == cookies_b64:
+        return resolved[1]
+    
+    cookies_path = Path('cookies/cookies.txt')
+    
     if cookies_b64:
         try:
             # Ensure directory exists
             cookies_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Decode and write to file
-            cookies_content = base64.b64decode(cookies_b64)
+            # Decode and write to file (a2b_base64 skips b64decode's
+            # extra normalization copy of the input)
             with open(cookies_path, 'wb') as f:
-                f.write(cookies_content)
+                f.write(binascii.a2b_base64(cookies_b64))
             logger.info("Successfully loaded YouTube cookies from environment variable")
+            _cookies_resolved = (cookies_b64, str(cookies_path))
             return str(cookies_path)
         except Exception as e:
-            logger.error(f"Failed to load cookies from environment variable: {e}")
+            # Not cached, so the next call retries the write
+            logger.error("Failed to load cookies from environment variable: %s", e)
+            return str(cookies_path) if cookies_path.exists() else None
             
     # Return path if file exists (local dev or manually added)
-    if cookies_path.exists():
-        return str(cookies_path)
-        
-    return None
+    result = str(cookies_path) if cookies_path.exists() else None
+    _cookies_resolved = (cookies_b64, result)
+    return result
+
+def _audio_info_cache_key(youtube_url: str) -> str:
+    """Key URLs by video ID so tracking params and URL forms share one entry."""
+    match = _RE_VIDEO_ID.search(youtube_url)
+    return match.group(1) if match else youtube_url
+
+
+def _get_cached_audio_info(key: str) -> Optional[Dict]:
+    """Return a copy of the cached info for a key, or None if absent or expired."""
+    with _audio_info_cache_lock:
+        entry = _audio_info_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at <= time.monotonic():
+            del _audio_info_cache[key]
+            return None
+        _audio_info_cache.move_to_end(key)
+        return dict(info)
+
+
+def _cache_audio_info(key: str, info: Dict) -> None:
+    """Store a successful lookup, evicting the least recently used entry if full."""
+    with _audio_info_cache_lock:
+        _audio_info_cache[key] = (time.monotonic() + AUDIO_INFO_CACHE_TTL, dict(info))
+        _audio_info_cache.move_to_end(key)
+        while len(_audio_info_cache) > AUDIO_INFO_CACHE_SIZE:
+            _audio_info_cache.popitem(last=False)
+
+
+def clear_audio_info_cache() -> None:
+    """Drop all cached video metadata and idle yt-dlp instances."""
+    with _audio_info_cache_lock:
+        _audio_info_cache.clear()
+    _close_idle_info_ydls()
+
+
+def _acquire_info_ydl() -> Tuple[Optional[str], yt_dlp.YoutubeDL]:
+    """
+    Borrow an idle metadata YoutubeDL, creating one if none is free.
+    
+    Returns:
+        tuple: (cookiefile, ydl), to be handed back to _release_info_ydl()
+    """
+    cookies_file = _setup_cookies()
+    
+    try:
+        idle_cookies_file, ydl = _idle_info_ydls.pop()
+    except IndexError:
+        pass
+    else:
+        if idle_cookies_file == cookies_file:
+            return cookies_file, ydl
+        # Cookies appeared or went away since this instance was built
+        ydl.close()
+    
+    return cookies_file, yt_dlp.YoutubeDL({**_INFO_YDL_OPTS, 'cookiefile': cookies_file})
+
+
+def _release_info_ydl(cookies_file: Optional[str], ydl: yt_dlp.YoutubeDL) -> None:
+    """Return a borrowed metadata YoutubeDL to the idle pool."""
+    _idle_info_ydls.append((cookies_file, ydl))
+
+
+@atexit.register
+def _close_idle_info_ydls() -> None:
+    """Close pooled metadata YoutubeDL instances (flushes their cookie jars)."""
+    while _idle_info_ydls:
+        try:
+            _, ydl = _idle_info_ydls.pop()
+            ydl.close()
+        except IndexError:
+            break
+        except Exception as e:
+            logger.debug("Failed to close pooled YoutubeDL: %s", e)
+
+
+def _download_opts(output_path: Path, cookies_file: Optional[str]) -> Dict:
+    """Build per-download yt-dlp options from the shared base options."""
+    return {
+        **_DOWNLOAD_YDL_OPTS,
+        'outtmpl': str(output_path.with_suffix('')),  # yt-dlp adds extension
+        'cookiefile': cookies_file,
+        'match_filter': _duration_match_filter,
+    }
+
 
 def get_audio_info(youtube_url: str) -> Dict:
     """
     Get audio metadata from a YouTube video without downloading.
     
+    Successful lookups are cached per video ID for AUDIO_INFO_CACHE_TTL
+    seconds, so repeated probes of the same video skip the round-trip to
+    YouTube. Concurrent lookups of the same video wait for a single yt-dlp
+    call instead of each making their own. Failures are never cached.
+    
     Args:
         youtube_url: YouTube video URL
         
@@ -90,54 +306,77 @@ def get_audio_info(youtube_url: str) -> Dict:
         InvalidURLError: If the URL is invalid
         NetworkError: If network errors occur
     """
-    logger.info(f"Fetching audio info for URL: {youtube_url}")
+    key = _audio_info_cache_key(youtube_url)
     
-    # Setup cookies
-    cookies_file = _setup_cookies()
+    cached = _get_cached_audio_info(key)
+    if cached is not None:
+        logger.debug("Using cached audio info for URL: %s", youtube_url)
+        return cached
     
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
-        # YouTube-specific options to bypass bot detection
-        'extractor_args': {
-            'youtube': {
-                'player_client': ['android', 'ios', 'web'],
-                'skip': ['hls', 'dash']
-            }
-        },
-        # Use cookies if available
-        'cookiefile': cookies_file,
-    }
+    with _audio_info_cache_lock:
+        entry = _audio_info_fetch_locks.get(key)
+        if entry is None:
+            entry = _audio_info_fetch_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
-            
-            if not info:
-                raise InvalidURLError("Unable to extract video information")
-            
-            duration = info.get('duration', 0)
-            title = info.get('title', 'Unknown')
-            video_id = info.get('id', 'unknown')
-            language = info.get('language', 'unknown')
-            
-            logger.info(
-                f"Video info retrieved: {title} "
-                f"(duration: {duration}s, id: {video_id})"
-            )
-            
-            return {
-                'success': True,
-                'duration': duration,
-                'title': title,
-                'video_id': video_id,
-                'language': language
-            }
+        with entry[0]:
+            # Another caller may have fetched it while we waited
+            cached = _get_cached_audio_info(key)
+            if cached is not None:
+                return cached
             
+            info = _fetch_audio_info(youtube_url)
+            _cache_audio_info(key, info)
+            return info
+    finally:
+        # Only drop the entry when nobody is waiting on it, or a later arrival
+        # would get a fresh lock and fetch alongside a waiter
+        with _audio_info_cache_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _audio_info_fetch_locks[key]
+
+
+def _fetch_audio_info(youtube_url: str) -> Dict:
+    """Fetch video metadata from YouTube; see get_audio_info()."""
+    logger.info("Fetching audio info for URL: %s", youtube_url)
+    
+    cookies_file, ydl = _acquire_info_ydl()
+    
+    try:
+        # process=False skips format selection, which we don't need for metadata
+        info = ydl.extract_info(youtube_url, download=False, process=False)
+        
+        # Redirecting URLs come back unresolved without processing
+        if info and info.get('_type') in ('url', 'url_transparent'):
+            info = ydl.extract_info(youtube_url, download=False)
+        
+        if not info:
+            raise InvalidURLError("Unable to extract video information")
+        
+        duration = info.get('duration', 0)
+        title = info.get('title', 'Unknown')
+        video_id = info.get('id', 'unknown')
+        language = info.get('language', 'unknown')
+        
+        logger.info(
+            "Video info retrieved: %s "
+            "(duration: %ss, id: %s)",
+            title, duration, video_id
+        )
+        
+        return {
+            'success': True,
+            'duration': duration,
+            'title': title,
+            'video_id': video_id,
+            'language': language
+        }
+        
     except yt_dlp.utils.DownloadError as e:
         error_msg = str(e)
-        logger.error(f"Failed to fetch video info: {error_msg}")
+        logger.error("Failed to fetch video info: %s", error_msg)
         
         if 'not available' in error_msg.lower() or 'private' in error_msg.lower():
             raise InvalidURLError("Video is not available or is private")
@@ -147,8 +386,12 @@ def get_audio_info(youtube_url: str) -> Dict:
             raise InvalidURLError(f"Invalid YouTube URL or video unavailable: {error_msg}")
             
     except Exception as e:
-        logger.error(f"Unexpected error fetching video info: {str(e)}")
+        logger.error("Unexpected error fetching video info: %s", e)
         raise AudioExtractionError(f"Failed to fetch video information: {str(e)}")
+        
+    finally:
+        # Return the instance for reuse; a failed lookup leaves it usable
+        _release_info_ydl(cookies_file, ydl)
 
 
 
@@ -175,7 +418,7 @@ def validate_video_duration(duration: float) -> None:
             f"Video duration: {duration / 60:.1f} minutes"
         )
     
-    logger.debug(f"Video duration validated: {duration}s")
+    logger.debug("Video duration validated: %ss", duration)
 
 
 def check_disk_space(required_mb: float = 100) -> None:
@@ -188,9 +431,17 @@ def check_disk_space(required_mb: float = 100) -> None:
     Raises:
         DiskSpaceError: If insufficient disk space
     """
+    # Skip the statvfs while a recent reading leaves at least 2x headroom
+    if (time.monotonic() - _disk_space_cache['checked_at'] < _DISK_SPACE_CACHE_TTL
+            and _disk_space_cache['available_mb'] >= required_mb * 2):
+        return
+    
     try:
+        # f_frsize (not f_bsize) is the unit f_bavail is counted in
         stat = os.statvfs(TEMP_AUDIO_DIR)
         available_mb = (stat.f_bavail * stat.f_frsize) / (1024 * 1024)
+        _disk_space_cache['checked_at'] = time.monotonic()
+        _disk_space_cache['available_mb'] = available_mb
         
         if available_mb < required_mb:
             raise DiskSpaceError(
@@ -198,17 +449,59 @@ def check_disk_space(required_mb: float = 100) -> None:
                 f"Available: {available_mb:.1f}MB"
             )
         
-        logger.debug(f"Disk space check passed: {available_mb:.1f}MB available")
+        logger.debug("Disk space check passed: %.1fMB available", available_mb)
         
     except AttributeError:
         # statvfs not available on Windows
         logger.warning("Disk space check not available on this platform")
     except Exception as e:
-        logger.warning(f"Could not check disk space: {str(e)}")
+        logger.warning("Could not check disk space: %s", e)
+
+
+
+def _expected_wav_size_mb(duration: float) -> float:
+    """Size of the 16-bit PCM WAV that extract_audio() produces for a duration."""
+    return (duration * AUDIO_SAMPLE_RATE * AUDIO_CHANNELS * 2 + 44) / (1024 * 1024)
 
 
+def _check_duration_limits(duration: float) -> float:
+    """
+    Validate a video's duration and the size of the WAV it would produce.
+    
+    Returns:
+        float: Expected WAV size in MB
+        
+    Raises:
+        DurationLimitError: If duration is outside acceptable range
+        AudioExtractionError: If the WAV would exceed MAX_AUDIO_FILE_SIZE_MB
+    """
+    validate_video_duration(duration)
+    
+    expected_mb = _expected_wav_size_mb(duration)
+    if expected_mb > MAX_AUDIO_FILE_SIZE_MB:
+        raise AudioExtractionError(
+            f"Audio file would be too large ({expected_mb:.1f}MB). "
+            f"Maximum allowed: {MAX_AUDIO_FILE_SIZE_MB}MB"
+        )
+    return expected_mb
 
-def extract_audio(youtube_url: str, output_path: Optional[str] = None) -> Dict:
+
+def _duration_match_filter(info_dict: Dict, incomplete=False) -> None:
+    """
+    yt-dlp match_filter enforcing the duration limits before any audio is fetched.
+    
+    Raising (rather than returning a reason, which yt-dlp treats as a silent
+    skip) lets DurationLimitError propagate out of extract_info().
+    """
+    duration = info_dict.get('duration')
+    # incomplete is True for partial playlist entries, or the set of
+    # format-only keys that may still be missing (duration never is)
+    if incomplete is not True and duration is not None:
+        _check_duration_limits(duration)
+    return None
+
+
+def extract_audio(youtube_url: str, output_path: Optional[str] = None, info: Optional[Dict] = None) -> Dict:
     """
     Extract audio from a YouTube video and save as WAV file.
     
@@ -216,9 +509,15 @@ def extract_audio(youtube_url: str, output_path: Optional[str] = None) -> Dict:
     WAV format (16kHz, mono) optimized for Whisper transcription, and
     saves it to the specified path.
     
+    Without an output_path, the file name is derived from the video, so a
+    request for a video that is already extracted (or being extracted by
+    another worker) reuses that file instead of downloading it again.
+    
     Args:
         youtube_url: YouTube video URL
         output_path: Optional custom output path. If None, generates automatic path.
+        info: Optional result of get_audio_info() for this URL, so callers
+              that already probed the video don't fetch its metadata again
         
     Returns:
         dict: {
@@ -239,144 +538,463 @@ def extract_audio(youtube_url: str, output_path: Optional[str] = None) -> Dict:
         FileSystemPermissionError: If file system permission errors occur
         AudioExtractionError: For other extraction errors
     """
-    logger.info(f"Starting audio extraction for URL: {youtube_url}")
+    logger.info("Starting audio extraction for URL: %s", youtube_url)
     
     try:
         # Ensure temp directory exists
         ensure_temp_directory()
         
-        # Check disk space
-        check_disk_space(required_mb=200)
+        cache_key = _audio_info_cache_key(youtube_url)
         
-        # Get video info and validate duration
-        info = get_audio_info(youtube_url)
-        duration = info['duration']
-        video_id = info['video_id']
-        title = info['title']
+        # Use metadata the caller passed in or that is already cached. Otherwise
+        # skip the separate probe: the download extracts the same metadata and
+        # _duration_match_filter enforces the limits before fetching any audio.
+        if info is None:
+            info = _get_cached_audio_info(cache_key)
         
-        validate_video_duration(duration)
+        if info is not None:
+            expected_mb = _check_duration_limits(info['duration'])
+            
+            # Check disk space (the WAV plus the compressed download it's made from)
+            check_disk_space(required_mb=max(200, expected_mb * 1.5))
+        else:
+            check_disk_space(required_mb=200)
         
-        # Generate output path if not provided
+        # Generate output path if not provided. The name is stable per video
+        # so a finished extraction of the same video can be reused.
+        reuse_existing = output_path is None
         if output_path is None:
-            timestamp = int(time.time())
-            filename = f"{video_id}_{timestamp}.{AUDIO_FORMAT}"
+            # cache_key is the video ID whenever the URL has a recognizable one
+            file_id = info['video_id'] if info is not None else cache_key
+            if not re.fullmatch(r'[\w-]+', file_id):
+                file_id = 'video'
+            digest = hashlib.blake2b(cache_key.encode(), digest_size=8).hexdigest()
+            filename = f"{file_id}_{digest}.{AUDIO_FORMAT}"
             output_path = TEMP_AUDIO_DIR / filename
         else:
             output_path = Path(output_path)
+            
+            # Ensure parent directory exists (the temp dir already does)
+            if output_path.parent != TEMP_AUDIO_DIR:
+                os.makedirs(output_path.parent, exist_ok=True)
         
-        # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if reuse_existing:
+            # Same video, same file name: whoever gets here first downloads,
+            # everyone else waits and reuses the result
+            with _extraction_lock(output_path):
+                reused = _reuse_extracted_audio(output_path, youtube_url, info)
+                if reused is not None:
+                    return reused
+                return _download_audio(youtube_url, output_path, info, cache_key)
         
-        logger.info(f"Downloading audio to: {output_path}")
+        return _download_audio(youtube_url, output_path, info, cache_key)
         
-        # Setup cookies
-        cookies_file = _setup_cookies()
+    except (InvalidURLError, DurationLimitError, NetworkError, 
+            DiskSpaceError, AudioExtractionError) as e:
+        # Re-raise known exceptions for proper error handling
+        logger.error("Audio extraction failed: %s", e)
+        raise
         
-        # Configure yt-dlp options for audio extraction
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': AUDIO_FORMAT,
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(output_path.with_suffix('')),  # yt-dlp adds extension
-            'quiet': False,
-            'no_warnings': False,
-            'postprocessor_args': [
-                '-ar', str(AUDIO_SAMPLE_RATE),  # Sample rate: 16kHz
-                '-ac', str(AUDIO_CHANNELS),      # Channels: mono
-            ],
-            # FFmpeg location (dynamically resolved)
-            'ffmpeg_location': shutil.which('ffmpeg') or '/usr/bin/ffmpeg',
-            # Force IPv4 (helps with some data center IP blocks)
-            'source_address': '0.0.0.0',
-            # YouTube-specific options to bypass bot detection
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['android', 'ios', 'web'],
-                    'skip': ['hls', 'dash']
-                }
-            },
-            # Use cookies if available (helps with rate limiting)
-            'cookiefile': cookies_file,
-        }
+    except OSError as e:
+        error_msg = str(e)
+        logger.error("File system error: %s", error_msg)
+        
+        if 'permission' in error_msg.lower():
+            raise FileSystemPermissionError(
+                f"Permission denied when accessing file system: {error_msg}"
+            )
+        else:
+            raise AudioExtractionError(f"File system error: {error_msg}")
+            
+    except Exception as e:
+        error_msg = f"Unexpected error during audio extraction: {str(e)}"
+        logger.error(error_msg)
+        raise AudioExtractionError(error_msg)
+
+
+
+def _download_audio(
+    youtube_url: str,
+    output_path: Path,
+    info: Optional[Dict],
+    cache_key: str
+) -> Dict:
+    """Download and convert the audio to output_path; see extract_audio()."""
+    logger.info("Downloading audio to: %s", output_path)
+    
+    # Setup cookies
+    cookies_file = _setup_cookies()
+    
+    # Configure yt-dlp options for audio extraction
+    ydl_opts = _download_opts(output_path, cookies_file)
+    
+    # Download and extract audio
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            downloaded = ydl.extract_info(youtube_url, download=True) or {}
+    except yt_dlp.utils.DownloadError as e:
+        error_msg = str(e)
+        logger.error("Download failed: %s", error_msg)
         
-        # Download and extract audio
+        if 'not available' in error_msg.lower():
+            raise InvalidURLError("Video is not available or is private")
+        elif 'network' in error_msg.lower() or 'timeout' in error_msg.lower():
+            raise NetworkError(f"Network error during download: {error_msg}")
+        else:
+            raise AudioExtractionError(f"Download failed: {error_msg}")
+    
+    # Metadata from the download itself; remember it for later probes
+    duration = downloaded.get('duration') or (info['duration'] if info else 0)
+    video_id = downloaded.get('id') or (info['video_id'] if info else 'unknown')
+    title = downloaded.get('title') or (info['title'] if info else 'Unknown')
+    if info is None and downloaded:
+        _cache_audio_info(cache_key, {
+            'success': True,
+            'duration': duration,
+            'title': title,
+            'video_id': video_id,
+            'language': downloaded.get('language', 'unknown')
+        })
+    
+    # Verify the output file exists and get its size with a single stat
+    final_path = output_path.with_suffix(f'.{AUDIO_FORMAT}')
+    try:
+        file_stat = os.stat(final_path)
+    except FileNotFoundError:
+        raise AudioExtractionError(
+            f"Audio file was not created at expected path: {final_path}"
+        )
+    file_size_mb = file_stat.st_size / (1024 * 1024)
+    
+    # Validate file size
+    if file_size_mb > MAX_AUDIO_FILE_SIZE_MB:
+        # Clean up the file
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([youtube_url])
-        except yt_dlp.utils.DownloadError as e:
-            error_msg = str(e)
-            logger.error(f"Download failed: {error_msg}")
+            final_path.unlink()
+        except Exception:
+            pass
+        raise AudioExtractionError(
+            f"Audio file too large ({file_size_mb:.1f}MB). "
+            f"Maximum allowed: {MAX_AUDIO_FILE_SIZE_MB}MB"
+        )
+    
+    if final_path.parent == TEMP_AUDIO_DIR:
+        _index_audio_file(str(final_path), file_stat.st_mtime)
+    
+    logger.info(
+        "Audio extraction successful: %s "
+        "(%.2fMB, %ss)",
+        final_path, file_size_mb, duration
+    )
+    
+    return {
+        'success': True,
+        'audio_path': str(final_path),
+        'duration': duration,
+        'video_id': video_id,
+        'title': title,
+        'file_size_mb': file_size_mb
+    }
+
+
+def _reuse_extracted_audio(
+    audio_path: Path,
+    youtube_url: str,
+    info: Optional[Dict]
+) -> Optional[Dict]:
+    """
+    Return an extract_audio() result for an existing extraction at audio_path, or None.
+    
+    The caller gets its own hard link to the file (or a copy where hard links
+    aren't supported), so whichever caller cleans up first doesn't delete the
+    audio out from under the other.
+    """
+    try:
+        file_stat = os.stat(audio_path)
+    except FileNotFoundError:
+        return None
+    if file_stat.st_size == 0:
+        return None
+    
+    if info is None:
+        info = get_audio_info(youtube_url)
+    
+    link_path = audio_path.with_name(
+        f"{audio_path.stem}_{secrets.token_hex(4)}{audio_path.suffix}"
+    )
+    try:
+        os.link(audio_path, link_path)
+        link_mtime = file_stat.st_mtime
+    except OSError as e:
+        # No hard links on this filesystem; give the caller its own copy
+        logger.debug("Could not link %s, copying it: %s", audio_path, e)
+        try:
+            shutil.copyfile(audio_path, link_path)
+            link_mtime = os.stat(link_path).st_mtime
+        except OSError as e:
+            logger.warning("Could not copy %s, downloading again: %s", audio_path, e)
+            with contextlib.suppress(OSError):
+                os.unlink(link_path)
+            return None
+    _index_audio_file(str(link_path), link_mtime)
+    
+    logger.info("Reusing extracted audio for URL: %s (%s)", youtube_url, link_path)
+    
+    return {
+        'success': True,
+        'audio_path': str(link_path),
+        'duration': info['duration'],
+        'video_id': info['video_id'],
+        'title': info['title'],
+        'file_size_mb': file_stat.st_size / (1024 * 1024)
+    }
+
+
+@contextlib.contextmanager
+def _extraction_lock(audio_path: Path):
+    """
+    Hold an exclusive lock for extracting to audio_path.
+    
+    Threads wait on a per-path lock. Processes (e.g. several web workers) wait
+    on a byte-range lock in a shared lock file, where available.
+    """
+    key = str(audio_path)
+    with _extraction_locks_lock:
+        entry = _extraction_locks.get(key)
+        if entry is None:
+            entry = _extraction_locks[key] = [threading.Lock(), 0]
+        entry[1] += 1
+    
+    try:
+        with entry[0]:
+            lock_fd = _extraction_lock_file()
+            offset = zlib.crc32(key.encode())
+            if lock_fd is not None:
+                fcntl.lockf(lock_fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield
+            finally:
+                if lock_fd is not None:
+                    fcntl.lockf(lock_fd, fcntl.LOCK_UN, 1, offset)
+    finally:
+        # Only drop the entry when nobody is waiting on it, or a later arrival
+        # would get a fresh lock and run alongside a waiter
+        with _extraction_locks_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _extraction_locks[key]
+
+
+def _extraction_lock_file() -> Optional[int]:
+    """
+    Return the descriptor of the shared lock file for TEMP_AUDIO_DIR, or None.
+    
+    The descriptor stays open for the life of the process: POSIX drops all of
+    a process's locks on a file when any descriptor for it is closed.
+    """
+    if fcntl is None:
+        return None
+    
+    lock_path = os.path.join(TEMP_AUDIO_DIR, _EXTRACTION_LOCK_NAME)
+    with _extraction_locks_lock:
+        lock_fd = _extraction_lock_fds.get(lock_path)
+        if lock_fd is None:
+            lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            _extraction_lock_fds[lock_path] = lock_fd
+    return lock_fd
+
+
+def extract_audio_pcm(youtube_url: str) -> Dict:
+    """
+    Stream audio from a YouTube video straight into memory as Whisper-ready PCM.
+    
+    yt-dlp writes the audio stream to stdout, which is piped through ffmpeg
+    to produce 16kHz mono 16-bit PCM on its stdout. No intermediate file is
+    written, so the download + convert phase touches the disk zero times
+    instead of twice. The whole waveform is held in memory (about 230MB per
+    hour of audio as float32, half that with AUDIO_DTYPE='float16'), so
+    prefer extract_audio() for very long videos.
+    
+    Args:
+        youtube_url: YouTube video URL
+        
+    Returns:
+        dict: {
+            'success': bool,
+            'audio': numpy.ndarray (AUDIO_DTYPE samples in [-1, 1]),
+            'sample_rate': int,
+            'duration': float,
+            'video_id': str,
+            'title': str
+        }
+        
+    Raises:
+        InvalidURLError: If the URL is invalid
+        DurationLimitError: If video duration exceeds limits
+        NetworkError: If network errors occur
+        AudioExtractionError: For other extraction errors
+    """
+    logger.info("Starting in-memory audio extraction for URL: %s", youtube_url)
+    
+    try:
+        import numpy as np
+        
+        # Get video info and validate duration
+        info = get_audio_info(youtube_url)
+        duration = info['duration']
+        validate_video_duration(duration)
+        
+        ydl_cmd = [
+            sys.executable, '-m', 'yt_dlp',
+            '--quiet', '--no-warnings',
+            '-f', '140/bestaudio[ext=m4a]/bestaudio/best',
+            '--extractor-args',
+            f"youtube:player_client={','.join(_PLAYER_CLIENTS)};"
+            f"skip={','.join(_SKIP_MANIFESTS)}",
+            '-o', '-',
+        ]
+        cookies_file = _setup_cookies()
+        if cookies_file:
+            ydl_cmd += ['--cookies', cookies_file]
+        ydl_cmd.append(youtube_url)
+        
+        ffmpeg_cmd = [
+            _FFMPEG_LOCATION,
+            '-nostdin', '-loglevel', 'error',
+            '-i', 'pipe:0',
+            '-ac', str(AUDIO_CHANNELS),
+            '-ar', str(AUDIO_SAMPLE_RATE),
+            '-f', 's16le',
+            'pipe:1',
+        ]
+        
+        # yt-dlp's stderr goes to a temp file so a chatty download can't fill
+        # a pipe nobody is reading and stall the whole chain
+        with tempfile.TemporaryFile() as ydl_stderr:
+            ydl = subprocess.Popen(ydl_cmd, stdout=subprocess.PIPE, stderr=ydl_stderr)
+            ffmpeg = subprocess.Popen(
+                ffmpeg_cmd,
+                stdin=ydl.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            # Let yt-dlp see a broken pipe if ffmpeg exits early
+            ydl.stdout.close()
+            pcm, ffmpeg_err = ffmpeg.communicate()
+            ydl.wait()
+            ydl_stderr.seek(0)
+            ydl_err = ydl_stderr.read().decode('utf-8', errors='replace')
+        
+        if ydl.returncode != 0:
+            logger.error("Download failed: %s", ydl_err)
             
-            if 'not available' in error_msg.lower():
+            if 'not available' in ydl_err.lower():
                 raise InvalidURLError("Video is not available or is private")
-            elif 'network' in error_msg.lower() or 'timeout' in error_msg.lower():
-                raise NetworkError(f"Network error during download: {error_msg}")
+            elif 'network' in ydl_err.lower() or 'timeout' in ydl_err.lower():
+                raise NetworkError(f"Network error during download: {ydl_err}")
             else:
-                raise AudioExtractionError(f"Download failed: {error_msg}")
+                raise AudioExtractionError(f"Download failed: {ydl_err}")
         
-        # Verify the output file exists
-        final_path = output_path.with_suffix(f'.{AUDIO_FORMAT}')
-        if not final_path.exists():
+        if ffmpeg.returncode != 0:
             raise AudioExtractionError(
-                f"Audio file was not created at expected path: {final_path}"
+                f"Audio conversion failed: {ffmpeg_err.decode('utf-8', errors='replace')}"
             )
         
-        # Get file size
-        file_size_bytes = final_path.stat().st_size
-        file_size_mb = file_size_bytes / (1024 * 1024)
-        
-        # Validate file size
-        if file_size_mb > MAX_AUDIO_FILE_SIZE_MB:
-            # Clean up the file
-            try:
-                final_path.unlink()
-            except Exception:
-                pass
-            raise AudioExtractionError(
-                f"Audio file too large ({file_size_mb:.1f}MB). "
-                f"Maximum allowed: {MAX_AUDIO_FILE_SIZE_MB}MB"
-            )
+        # Convert to AUDIO_DTYPE and scale in place, dropping the raw bytes as
+        # soon as they're copied, so at most two copies of the audio are ever alive
+        audio = np.frombuffer(pcm, dtype=np.int16).astype(AUDIO_DTYPE)
+        del pcm
+        audio *= 1.0 / 32768.0
+        if audio.size == 0:
+            raise AudioExtractionError("Audio stream was empty")
         
         logger.info(
-            f"Audio extraction successful: {final_path} "
-            f"({file_size_mb:.2f}MB, {duration}s)"
+            "In-memory audio extraction successful: %.1fs of audio",
+            audio.size / AUDIO_SAMPLE_RATE
         )
         
         return {
             'success': True,
-            'audio_path': str(final_path),
+            'audio': audio,
+            'sample_rate': AUDIO_SAMPLE_RATE,
             'duration': duration,
-            'video_id': video_id,
-            'title': title,
-            'file_size_mb': file_size_mb
+            'video_id': info['video_id'],
+            'title': info['title']
         }
         
-    except (InvalidURLError, DurationLimitError, NetworkError, 
-            DiskSpaceError, AudioExtractionError) as e:
-        # Re-raise known exceptions for proper error handling
-        logger.error(f"Audio extraction failed: {str(e)}")
+    except (InvalidURLError, DurationLimitError, NetworkError, AudioExtractionError) as e:
+        logger.error("Audio extraction failed: %s", e)
         raise
         
-    except OSError as e:
-        error_msg = str(e)
-        logger.error(f"File system error: {error_msg}")
-        
-        if 'permission' in error_msg.lower():
-            raise FileSystemPermissionError(
-                f"Permission denied when accessing file system: {error_msg}"
-            )
-        else:
-            raise AudioExtractionError(f"File system error: {error_msg}")
-            
     except Exception as e:
         error_msg = f"Unexpected error during audio extraction: {str(e)}"
         logger.error(error_msg)
         raise AudioExtractionError(error_msg)
 
 
+def split_audio_segments(
+    audio_path: str,
+    segment_seconds: float = AUDIO_SEGMENT_SECONDS
+) -> List[Tuple[float, str]]:
+    """
+    Split an extracted WAV file into consecutive segments for parallel transcription.
+    
+    A single ffmpeg invocation stream-copies the PCM into segment files next
+    to the original, so there is no re-encode. The caller owns the segment
+    files and should delete them with cleanup_audio_file() when done.
+    
+    Args:
+        audio_path: Path to a WAV file produced by extract_audio()
+        segment_seconds: Target length of each segment in seconds
+        
+    Returns:
+        list: (start_offset_seconds, segment_path) per segment, in order
+        
+    Raises:
+        AudioExtractionError: If ffmpeg fails or produces no segments
+    """
+    source = Path(audio_path)
+    pattern = source.with_name(f"{source.stem}_part%03d{source.suffix}")
+    
+    # ffmpeg reports each segment's actual start time on the segment list,
+    # which is exact for PCM rather than a multiple of segment_seconds
+    result = subprocess.run(
+        [
+            _FFMPEG_LOCATION,
+            '-nostdin', '-loglevel', 'error', '-y',
+            '-i', str(source),
+            '-f', 'segment',
+            '-segment_time', str(segment_seconds),
+            '-segment_list', 'pipe:1',
+            '-segment_list_type', 'csv',
+            '-c', 'copy',
+            str(pattern),
+        ],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise AudioExtractionError(f"Audio splitting failed: {result.stderr.strip()}")
+    
+    segments = []
+    for line in result.stdout.splitlines():
+        if not line:
+            continue
+        name, start, _end = line.rsplit(',', 2)
+        segments.append((float(start), str(source.parent / os.path.basename(name))))
+    
+    if not segments:
+        raise AudioExtractionError("Audio splitting produced no segments")
+    
+    # Indexed so segments left by a worker that dies mid-transcription expire
+    if source.parent == TEMP_AUDIO_DIR:
+        for _start, segment_path in segments:
+            with contextlib.suppress(FileNotFoundError):
+                _index_audio_file(segment_path, os.stat(segment_path).st_mtime)
+    
+    logger.info("Split %s into %d segments", audio_path, len(segments))
+    return segments
+
 
 def cleanup_audio_file(audio_path: str) -> Dict:
     """
@@ -392,23 +1010,23 @@ def cleanup_audio_file(audio_path: str) -> Dict:
             'error': str (if failed)
         }
     """
-    logger.info(f"Cleaning up audio file: {audio_path}")
+    logger.info("Cleaning up audio file: %s", audio_path)
     
     try:
-        path = Path(audio_path)
-        
-        if not path.exists():
-            logger.warning(f"Audio file does not exist: {audio_path}")
+        # Delete the file directly rather than checking for it first
+        try:
+            os.unlink(audio_path)
+        except FileNotFoundError:
+            logger.warning("Audio file does not exist: %s", audio_path)
+            _forget_audio_file(audio_path)
             return {
                 'success': True,
                 'path': audio_path,
                 'message': 'File does not exist (already cleaned up)'
             }
         
-        # Delete the file
-        path.unlink()
-        
-        logger.info(f"Audio file deleted successfully: {audio_path}")
+        _forget_audio_file(audio_path)
+        logger.info("Audio file deleted successfully: %s", audio_path)
         
         return {
             'success': True,
@@ -436,6 +1054,90 @@ def cleanup_audio_file(audio_path: str) -> Dict:
         }
 
 
+def _open_audio_index() -> sqlite3.Connection:
+    """
+    Return the mtime index for the current TEMP_AUDIO_DIR, creating it on first use.
+    
+    Each process reconciles the index with one directory scan when it first
+    opens it, which picks up files whose insert failed or that were left by a
+    worker that died; after that the insert and delete hooks keep it current.
+    Callers must hold _audio_index_lock.
+    """
+    db_path = os.path.join(TEMP_AUDIO_DIR, _AUDIO_INDEX_NAME)
+    conn = _audio_index_conns.get(db_path)
+    if conn is not None:
+        return conn
+    
+    ensure_temp_directory()
+    conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+    with conn:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS audio '
+            '(path TEXT PRIMARY KEY, mtime REAL NOT NULL) WITHOUT ROWID'
+        )
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_audio_mtime ON audio(mtime)')
+        conn.executemany(
+            'INSERT OR IGNORE INTO audio (path, mtime) VALUES (?, ?)',
+            _scan_audio_files()
+        )
+    
+    _audio_index_conns[db_path] = conn
+    return conn
+
+
+def _scan_audio_files() -> List[Tuple[str, float]]:
+    """List (path, mtime) for every audio file directly in TEMP_AUDIO_DIR."""
+    suffix = f'.{AUDIO_FORMAT}'
+    found = []
+    
+    # scandir yields entries straight from the directory listing, so there
+    # is no Path object per file and the stat can often reuse readdir data
+    with os.scandir(TEMP_AUDIO_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                found.append((entry.path, entry.stat(follow_symlinks=False).st_mtime))
+            except FileNotFoundError:
+                pass
+    
+    return found
+
+
+def _index_audio_file(path: str, mtime: float) -> None:
+    """Record a new temp audio file in the mtime index."""
+    try:
+        with _audio_index_lock:
+            conn = _open_audio_index()
+            with conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO audio (path, mtime) VALUES (?, ?)',
+                    (path, mtime)
+                )
+    except (sqlite3.Error, OSError) as e:
+        # Not fatal: the next process to open the index picks the file up
+        logger.warning("Failed to index audio file %s: %s", path, e)
+
+
+def _forget_audio_files(paths: List[str]) -> None:
+    """Drop deleted files from the mtime index."""
+    try:
+        with _audio_index_lock:
+            conn = _open_audio_index()
+            with conn:
+                conn.executemany(
+                    'DELETE FROM audio WHERE path = ?', ((path,) for path in paths)
+                )
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Failed to update audio index: %s", e)
+
+
+def _forget_audio_file(path: str) -> None:
+    """Drop a single deleted file from the index if it lives in TEMP_AUDIO_DIR."""
+    if os.path.dirname(path) == str(TEMP_AUDIO_DIR):
+        _forget_audio_files([path])
+
+
 def cleanup_old_audio_files(max_age_hours: int = 24) -> Dict:
     """
     Clean up old audio files from the temp directory.
@@ -451,37 +1153,47 @@ def cleanup_old_audio_files(max_age_hours: int = 24) -> Dict:
             'errors': list
         }
     """
-    logger.info(f"Cleaning up audio files older than {max_age_hours} hours")
+    logger.info("Cleaning up audio files older than %s hours", max_age_hours)
     
     try:
         ensure_temp_directory()
         
-        current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
+        cutoff = time.time() - max_age_hours * 3600
         
         deleted_count = 0
         failed_count = 0
         errors = []
+        removed = []
+        
+        # Indexed range query rather than a stat of every file in the directory
+        with _audio_index_lock:
+            expired = [
+                path for path, in _open_audio_index().execute(
+                    'SELECT path FROM audio WHERE mtime < ?', (cutoff,)
+                )
+            ]
         
-        # Iterate through files in temp directory
-        for file_path in TEMP_AUDIO_DIR.glob(f'*.{AUDIO_FORMAT}'):
+        for path in expired:
             try:
-                # Check file age
-                file_age = current_time - file_path.stat().st_mtime
-                
-                if file_age > max_age_seconds:
-                    file_path.unlink()
-                    deleted_count += 1
-                    logger.debug(f"Deleted old file: {file_path}")
-                    
-            except Exception as e:
+                os.unlink(path)
+            except FileNotFoundError:
+                # Deleted behind the index's back; just drop the entry
+                removed.append(path)
+            except OSError as e:
                 failed_count += 1
-                error_msg = f"Failed to delete {file_path}: {str(e)}"
+                error_msg = f"Failed to delete {path}: {str(e)}"
                 errors.append(error_msg)
                 logger.warning(error_msg)
+            else:
+                deleted_count += 1
+                removed.append(path)
+                logger.debug("Deleted old file: %s", path)
+        
+        if removed:
+            _forget_audio_files(removed)
         
         logger.info(
-            f"Cleanup complete: {deleted_count} deleted, {failed_count} failed"
+            "Cleanup complete: %d deleted, %d failed", deleted_count, failed_count
         )
         
         return {
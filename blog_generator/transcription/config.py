@@ -30,7 +30,9 @@ def _get_setting(name, default=None):
 # Whisper Model Configuration
 # ============================================================================
 
-# Valid Whisper model sizes with their characteristics
+# Valid Whisper model sizes with their characteristics. memory_gb is the
+# full-precision footprint; with compute_type='int8' (what load_whisper_model
+# uses on CPU) the weights need roughly half of that.
 VALID_MODEL_SIZES = {
     'tiny': {'memory_gb': 1, 'speed': 'fastest', 'accuracy': 'lowest'},
     'base': {'memory_gb': 1.5, 'speed': 'fast', 'accuracy': 'good'},
@@ -45,8 +47,47 @@ WHISPER_MODEL_SIZE = _get_setting('WHISPER_MODEL_SIZE', 'base')
 # Device to run Whisper on ('cpu' or 'cuda')
 WHISPER_DEVICE = _get_setting('WHISPER_DEVICE', 'cpu')
 
+# CTranslate2 compute type for the model weights and activations. None picks
+# 'int8' on CPU and 'float16' on CUDA; set e.g. 'float32' to force full precision
+WHISPER_COMPUTE_TYPE = _get_setting('WHISPER_COMPUTE_TYPE', None)
+
+# Valid compute type overrides
+VALID_COMPUTE_TYPES = [
+    'int8', 'int8_float32', 'int8_float16', 'int8_bfloat16',
+    'int16', 'float16', 'bfloat16', 'float32'
+]
+
+# Use CTranslate2's FlashAttention kernels on CUDA (Ampere or newer GPUs and
+# faster-whisper >= 1.0.3; ignored on CPU). Default: off
+WHISPER_FLASH_ATTENTION = _get_setting('WHISPER_FLASH_ATTENTION', False)
+
+# Directory for downloaded/converted CTranslate2 models (None: the Hugging Face
+# cache). Models already in it are loaded without contacting the Hub.
+WHISPER_DOWNLOAD_ROOT = _get_setting('WHISPER_DOWNLOAD_ROOT', None)
+
+# Number of models (distinct size/device pairs) kept loaded at once, least
+# recently used evicted first (default: 2)
+WHISPER_MAX_CACHED_MODELS = _get_setting('WHISPER_MAX_CACHED_MODELS', 2)
+
+# Unload the model after this many seconds without a transcription, to give
+# the memory back on idle workers (default: 0, keep it loaded). Should be well
+# above ASR_TIMEOUT, or a model still in use may be loaded a second time.
+WHISPER_IDLE_TIMEOUT = _get_setting('WHISPER_IDLE_TIMEOUT', 0)
+
+# Number of transcriptions one loaded model can decode truly in parallel.
+# Each worker gets an equal share of the CPU threads (default: 1)
+WHISPER_NUM_WORKERS = _get_setting('WHISPER_NUM_WORKERS', 1)
+
+# Decoding preset: 'accurate' (beam search) or 'fast' (greedy decoding and
+# more aggressive VAD, roughly half the decode time for a small WER cost)
+TRANSCRIBE_QUALITY = _get_setting('TRANSCRIBE_QUALITY', 'accurate')
+
+# Valid decoding presets
+VALID_TRANSCRIBE_QUALITIES = ['accurate', 'fast']
+
 # Valid device options
 VALID_DEVICES = ['cpu', 'cuda']
+VALID_DEVICES_SET = frozenset(VALID_DEVICES)  # For membership checks
 
 
 # ============================================================================
@@ -71,6 +112,14 @@ AUDIO_QUALITY = {
     'codec': 'pcm_s16le'  # 16-bit PCM
 }
 
+# Sample dtype for in-memory waveforms from extract_audio_pcm(). 'float16'
+# halves the buffer for queued or long audio; it is widened back to float32
+# right before inference, which is what Whisper's feature extractor expects.
+AUDIO_DTYPE = _get_setting('AUDIO_DTYPE', 'float32')
+
+# Valid in-memory sample dtypes
+VALID_AUDIO_DTYPES = ['float32', 'float16']
+
 
 # ============================================================================
 # Processing Limits and Timeouts
@@ -88,6 +137,24 @@ ASR_TIMEOUT = _get_setting('ASR_TIMEOUT', 14400)
 # Maximum file size for audio files in MB (default: 1000MB)
 MAX_AUDIO_FILE_SIZE_MB = _get_setting('MAX_AUDIO_FILE_SIZE_MB', 1000)
 
+# Audio longer than this many seconds is split into segments that are
+# transcribed concurrently. Only used when WHISPER_NUM_WORKERS > 1, since
+# with one worker the pieces would just run one after another (default: 0, off)
+LONG_AUDIO_THRESHOLD = _get_setting('LONG_AUDIO_THRESHOLD', 0)
+
+# Length of each segment when splitting long audio, in seconds (default: 10 minutes)
+AUDIO_SEGMENT_SECONDS = _get_setting('AUDIO_SEGMENT_SECONDS', 600)
+
+# How long video metadata lookups are cached, in seconds (default: 5 minutes)
+AUDIO_INFO_CACHE_TTL = _get_setting('AUDIO_INFO_CACHE_TTL', 300)
+
+# Maximum number of cached video metadata lookups
+AUDIO_INFO_CACHE_SIZE = _get_setting('AUDIO_INFO_CACHE_SIZE', 1024)
+
+# Maximum number of transcription results kept in memory, keyed by a hash of
+# the audio content, so the same audio isn't transcribed twice (0 = disabled)
+TRANSCRIPTION_CACHE_SIZE = _get_setting('TRANSCRIPTION_CACHE_SIZE', 32)
+
 
 # ============================================================================
 # Feature Flags
@@ -102,6 +169,10 @@ AUTO_CLEANUP_AUDIO = _get_setting('AUTO_CLEANUP_AUDIO', True)
 # Cleanup delay in seconds (0 = immediate)
 CLEANUP_DELAY = _get_setting('CLEANUP_DELAY', 0)
 
+# Load the Whisper model and run a short warm-up transcription when Django
+# starts, so the first request doesn't pay for it (default: off)
+WHISPER_PREWARM = _get_setting('WHISPER_PREWARM', False)
+
 
 # ============================================================================
 # Language Configuration
@@ -124,6 +195,7 @@ SUPPORTED_LANGUAGES = [
     'ar',  # Arabic
     'hi',  # Hindi
 ]
+SUPPORTED_LANGUAGES_SET = frozenset(SUPPORTED_LANGUAGES)  # For membership checks
 
 # Default language (None = auto-detect)
 DEFAULT_LANGUAGE = _get_setting('DEFAULT_TRANSCRIPTION_LANGUAGE', None)
@@ -173,13 +245,35 @@ def validate_configuration():
         )
     
     # Validate device
-    if WHISPER_DEVICE not in VALID_DEVICES:
+    if WHISPER_DEVICE not in VALID_DEVICES_SET:
         errors.append(
             f"Invalid WHISPER_DEVICE '{WHISPER_DEVICE}'. "
             f"Must be one of: {', '.join(VALID_DEVICES)}. "
             f"Defaulting to 'cpu'."
         )
     
+    # Validate compute type override
+    if WHISPER_COMPUTE_TYPE is not None and WHISPER_COMPUTE_TYPE not in VALID_COMPUTE_TYPES:
+        errors.append(
+            f"Invalid WHISPER_COMPUTE_TYPE '{WHISPER_COMPUTE_TYPE}'. "
+            f"Must be one of: {', '.join(VALID_COMPUTE_TYPES)}."
+        )
+    
+    # Validate decoding preset
+    if TRANSCRIBE_QUALITY not in VALID_TRANSCRIBE_QUALITIES:
+        errors.append(
+            f"Invalid TRANSCRIBE_QUALITY '{TRANSCRIBE_QUALITY}'. "
+            f"Must be one of: {', '.join(VALID_TRANSCRIBE_QUALITIES)}. "
+            f"Defaulting to 'accurate'."
+        )
+    
+    # Validate in-memory audio dtype
+    if AUDIO_DTYPE not in VALID_AUDIO_DTYPES:
+        errors.append(
+            f"Invalid AUDIO_DTYPE '{AUDIO_DTYPE}'. "
+            f"Must be one of: {', '.join(VALID_AUDIO_DTYPES)}."
+        )
+    
     # Validate video duration limits
     if MAX_VIDEO_DURATION <= 0:
         errors.append(
@@ -218,7 +312,7 @@ def validate_configuration():
         errors.append("TEMP_AUDIO_DIR is not configured.")
     
     # Validate language
-    if DEFAULT_LANGUAGE and DEFAULT_LANGUAGE not in SUPPORTED_LANGUAGES:
+    if DEFAULT_LANGUAGE and DEFAULT_LANGUAGE not in SUPPORTED_LANGUAGES_SET:
         errors.append(
             f"Invalid DEFAULT_TRANSCRIPTION_LANGUAGE '{DEFAULT_LANGUAGE}'. "
             f"Must be one of: {', '.join(SUPPORTED_LANGUAGES)} or None for auto-detect."
@@ -258,14 +352,20 @@ def ensure_temp_directory():
     """
     Ensure the temporary audio directory exists.
     
+    While the directory exists this costs a single stat. It is recreated if
+    something (e.g. a tmp cleaner) removed it at runtime.
+    
     Returns:
         Path: Path to the temp directory
         
     Raises:
         OSError: If directory cannot be created
     """
+    if os.path.isdir(TEMP_AUDIO_DIR):
+        return TEMP_AUDIO_DIR
+    
     try:
-        TEMP_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+        os.makedirs(TEMP_AUDIO_DIR, exist_ok=True)
         logger.debug(f"Temp audio directory ensured at: {TEMP_AUDIO_DIR}")
         return TEMP_AUDIO_DIR
     except OSError as e:
@@ -6,6 +6,8 @@ error conditions in the audio extraction and transcription process.
 All exceptions inherit from TranscriptionError for easy catching.
 """
 
+import functools
+
 
 # ============================================================================
 # Base Exception
@@ -17,19 +19,28 @@ class TranscriptionError(Exception):
     
     All custom exceptions in the transcription system inherit from this class,
     allowing for easy catching of any transcription-related error.
+    
+    Subclasses set USER_MESSAGE instead of overriding __init__.
     """
     
+    # Fixed user-facing message for the class (None = use the technical message)
+    USER_MESSAGE = None
+    
+    # Whether the error is caused by user input (4xx) rather than the server (5xx)
+    IS_USER_ERROR = False
+    
     def __init__(self, message: str, user_message: str = None):
         """
         Initialize the exception.
         
         Args:
             message: Technical error message for logging
-            user_message: User-friendly message (optional, defaults to message)
+            user_message: User-friendly message (optional, defaults to
+                          USER_MESSAGE, then to message)
         """
         super().__init__(message)
         self.message = message
-        self.user_message = user_message or message
+        self.user_message = user_message or self.USER_MESSAGE or message
     
     def get_user_message(self) -> str:
         """Get user-friendly error message."""
@@ -48,14 +59,15 @@ class AudioExtractionError(TranscriptionError):
 class InvalidURLError(AudioExtractionError):
     """Raised when the provided URL is invalid or video is unavailable."""
     
-    def __init__(self, message: str):
-        user_message = "Please provide a valid YouTube URL. The video may be private or unavailable."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Please provide a valid YouTube URL. The video may be private or unavailable."
+    IS_USER_ERROR = True
 
 
 class DurationLimitError(AudioExtractionError):
     """Raised when video duration exceeds the maximum limit."""
     
+    IS_USER_ERROR = True
+    
     def __init__(self, message: str):
         # Extract duration info if present in message for user-friendly display
         user_message = message if "minute" in message.lower() else \
@@ -66,25 +78,19 @@ class DurationLimitError(AudioExtractionError):
 class NetworkError(AudioExtractionError):
     """Raised when network-related errors occur."""
     
-    def __init__(self, message: str):
-        user_message = "Network error occurred. Please check your connection and try again."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Network error occurred. Please check your connection and try again."
 
 
 class DiskSpaceError(AudioExtractionError):
     """Raised when there's insufficient disk space."""
     
-    def __init__(self, message: str):
-        user_message = "Server storage is full. Please contact the administrator."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Server storage is full. Please contact the administrator."
 
 
 class FileSystemPermissionError(AudioExtractionError):
     """Raised when file system permission errors occur."""
     
-    def __init__(self, message: str):
-        user_message = "File system error occurred. Please contact the administrator."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "File system error occurred. Please contact the administrator."
 
 
 # ============================================================================
@@ -99,33 +105,26 @@ class WhisperError(TranscriptionError):
 class ModelLoadError(WhisperError):
     """Raised when Whisper model fails to load."""
     
-    def __init__(self, message: str):
-        user_message = "Transcription service is temporarily unavailable. Please try again later."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Transcription service is temporarily unavailable. Please try again later."
 
 
 class TranscriptionTimeoutError(WhisperError):
     """Raised when transcription times out."""
     
-    def __init__(self, message: str):
-        user_message = "Transcription timed out. The video may be too long. Please try a shorter video."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Transcription timed out. The video may be too long. Please try a shorter video."
 
 
 class AudioFormatError(WhisperError):
     """Raised when audio format is invalid."""
     
-    def __init__(self, message: str):
-        user_message = "Audio file is corrupted or invalid. Please try a different video."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Audio file is corrupted or invalid. Please try a different video."
+    IS_USER_ERROR = True
 
 
 class OutOfMemoryError(WhisperError):
     """Raised when system runs out of memory during transcription."""
     
-    def __init__(self, message: str):
-        user_message = "Video is too large to process. Please try a shorter video or contact the administrator."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Video is too large to process. Please try a shorter video or contact the administrator."
 
 
 # ============================================================================
@@ -135,43 +134,68 @@ class OutOfMemoryError(WhisperError):
 class TranscriptCleaningError(TranscriptionError):
     """Raised when transcript cleaning fails."""
     
-    def __init__(self, message: str):
-        user_message = "Failed to process transcript text. The content may be invalid."
-        super().__init__(message, user_message)
+    USER_MESSAGE = "Failed to process transcript text. The content may be invalid."
 
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
+# Keyword groups used to classify generic exceptions, checked in order
+_ERROR_KEYWORDS = {
+    ('network', 'connection', 'timeout'):
+        "Network error occurred. Please check your connection and try again.",
+    ('permission', 'access denied'):
+        "File system error occurred. Please contact the administrator.",
+    ('memory',):
+        "Video is too large to process. Please try a shorter video.",
+    ('not found', 'unavailable'):
+        "Video not found or unavailable. Please check the URL and try again.",
+    ('invalid', 'corrupted'):
+        "Invalid or corrupted content. Please try a different video.",
+}
+
+# Flattened to (keyword, message) pairs in priority order, so classifying an
+# error is one plain loop of substring checks with no per-group generators
+_ERROR_KEYWORD_MESSAGES = tuple(
+    (keyword, user_message)
+    for keywords, user_message in _ERROR_KEYWORDS.items()
+    for keyword in keywords
+)
+
+
+@functools.singledispatch
 def get_user_friendly_error(exception: Exception) -> str:
     """
     Convert any exception to a user-friendly error message.
     
+    Dispatches on the exception type; TranscriptionError subclasses carry
+    their own message, anything else is classified by keyword.
+    
     Args:
         exception: The exception to convert
         
     Returns:
         User-friendly error message string
     """
-    if isinstance(exception, TranscriptionError):
-        return exception.get_user_message()
-    
-    # Handle common exception types
-    error_str = str(exception).lower()
-    
-    if 'network' in error_str or 'connection' in error_str or 'timeout' in error_str:
-        return "Network error occurred. Please check your connection and try again."
-    elif 'permission' in error_str or 'access denied' in error_str:
-        return "File system error occurred. Please contact the administrator."
-    elif 'memory' in error_str or 'out of memory' in error_str:
-        return "Video is too large to process. Please try a shorter video."
-    elif 'not found' in error_str or 'unavailable' in error_str:
-        return "Video not found or unavailable. Please check the URL and try again."
-    elif 'invalid' in error_str or 'corrupted' in error_str:
-        return "Invalid or corrupted content. Please try a different video."
-    else:
-        return "An unexpected error occurred. Please try again or contact support."
+    return _classify_error_message(str(exception))
+
+
+def _classify_error_message(message: str) -> str:
+    """Map an error message to a user-friendly one by keyword."""
+    # Handle common exception types, first matching keyword group wins
+    error_str = message.lower()
+    
+    for keyword, user_message in _ERROR_KEYWORD_MESSAGES:
+        if keyword in error_str:
+            return user_message
+    
+    return "An unexpected error occurred. Please try again or contact support."
+
+
+@get_user_friendly_error.register
+def _(exception: TranscriptionError) -> str:
+    return exception.get_user_message()
 
 
 def is_user_error(exception: Exception) -> bool:
@@ -184,10 +208,4 @@ def is_user_error(exception: Exception) -> bool:
     Returns:
         True if user error (4xx), False if server error (5xx)
     """
-    user_error_types = (
-        InvalidURLError,
-        DurationLimitError,
-        AudioFormatError,
-    )
-    
-    return isinstance(exception, user_error_types)
+    return getattr(exception, 'IS_USER_ERROR', False)
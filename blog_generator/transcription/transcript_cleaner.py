@@ -9,6 +9,16 @@ import re
 import logging
 from .exceptions import TranscriptCleaningError
 
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator, fall back to the regex path
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # Optional DFA engine, fall back to the re module
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +32,75 @@ FILLER_WORDS = [
 ]
 
 
+# ============================================================================
+# Precompiled Patterns
+# ============================================================================
+
+# The delimited timestamp formats in one alternation, so the text is scanned
+# and copied once for all of them instead of once per format
+_TIMESTAMP_PATTERN = '|'.join([
+    r'\[\d{1,2}:\d{2}(?::\d{2})?\]',                 # [00:00:00] or [0:00]
+    r'\(\d{1,2}:\d{2}(?::\d{2})?\)',                 # (00:00)
+    r'\d{2}:\d{2}:\d{2}(?:,\d{3})?\s*-->\s*\d{2}:\d{2}:\d{2}(?:,\d{3})?',  # SRT
+    r'<\d{1,2}:\d{2}(?::\d{2})?>',                   # <00:00:00>
+])
+_RE_TIMESTAMPS = re.compile(_TIMESTAMP_PATTERN)
+
+# Bare 00:00 at line start. Removed in a second pass, since a line can start
+# with one only once the timestamps before it are gone ("[0:01]0:02 text")
+_LINE_START_TIMESTAMP_PATTERN = r'^\d{1,2}:\d{2}(?::\d{2})?\s*'
+_RE_LINE_START_TIMESTAMP = re.compile(_LINE_START_TIMESTAMP_PATTERN, re.MULTILINE)
+
+# re backtracks through all four branches at every position; RE2 runs the
+# same alternation as one DFA, several times faster on text with colons.
+# Filler removal stays on Aho-Corasick/re, which RE2 doesn't beat.
+if re2 is not None:
+    _TIMESTAMP_MATCHER = re2.compile(_TIMESTAMP_PATTERN)
+    _LINE_START_TIMESTAMP_MATCHER = re2.compile('(?m)' + _LINE_START_TIMESTAMP_PATTERN)
+else:
+    _TIMESTAMP_MATCHER = _RE_TIMESTAMPS
+    _LINE_START_TIMESTAMP_MATCHER = _RE_LINE_START_TIMESTAMP
+
+# FILLER_WORDS entries are literal phrases wrapped in \b anchors, longest
+# first so multi-word fillers like "uh huh" win over their prefixes
+_FILLER_PHRASES = tuple(sorted(
+    (pattern[2:-2].lower() for pattern in FILLER_WORDS), key=len, reverse=True
+))
+
+# All filler words in a single alternation with the word boundaries factored
+# out, so each position is tested against \b once rather than per phrase
+_RE_FILLERS = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, _FILLER_PHRASES)) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _build_filler_automaton():
+    """Build an Aho-Corasick automaton over the plain filler phrases."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for phrase in _FILLER_PHRASES:
+        automaton.add_word(phrase, len(phrase))
+    automaton.make_automaton()
+    return automaton
+
+
+_FILLER_AUTOMATON = _build_filler_automaton()
+
+# Spacing and punctuation patterns
+# Lookaheads instead of capture groups: the engine only has to delete the
+# matched character, with no group bookkeeping or template expansion. The
+# space pattern takes a single character since fix_spacing collapses runs first.
+_RE_SPACE_BEFORE_PUNCT = re.compile(r'\s(?=[.,!?;:])')
+_RE_NO_SPACE_AFTER_PUNCT = re.compile(r'([.,!?;:])([A-Za-z])')
+# Drops every mark followed by another, keeping the last one of each run
+_RE_MULTI_PUNCT = re.compile(r'[.,!?;:](?=[.,!?;:])')
+_RE_SENTENCE_START = re.compile(r'([.!?]\s+)([a-z])')
+_RE_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
 def remove_timestamps(text: str) -> str:
     """
     Remove timestamp patterns from transcript text.
@@ -39,22 +118,13 @@ def remove_timestamps(text: str) -> str:
     Returns:
         Text with timestamps removed
     """
-    # Remove square bracket timestamps [00:00:00] or [0:00]
-    text = re.sub(r'\[\d{1,2}:\d{2}(?::\d{2})?\]', '', text)
-    
-    # Remove parenthesis timestamps (00:00)
-    text = re.sub(r'\(\d{1,2}:\d{2}(?::\d{2})?\)', '', text)
-    
-    # Remove SRT-style timestamps (00:00:00 --> 00:00:00)
-    text = re.sub(r'\d{2}:\d{2}:\d{2}(?:,\d{3})?\s*-->\s*\d{2}:\d{2}:\d{2}(?:,\d{3})?', '', text)
-    
-    # Remove angle bracket timestamps <00:00:00>
-    text = re.sub(r'<\d{1,2}:\d{2}(?::\d{2})?>', '', text)
+    # Every timestamp format contains a colon. str's C-level search rules
+    # that out far faster than the regex can, and most text has none.
+    if ':' not in text:
+        return text
     
-    # Remove standalone timestamps at start of lines
-    text = re.sub(r'^\d{1,2}:\d{2}(?::\d{2})?\s*', '', text, flags=re.MULTILINE)
-    
-    return text
+    text = _TIMESTAMP_MATCHER.sub('', text)
+    return _LINE_START_TIMESTAMP_MATCHER.sub('', text)
 
 
 def remove_filler_words(text: str) -> str:
@@ -67,13 +137,45 @@ def remove_filler_words(text: str) -> str:
     Returns:
         Text with filler words removed
     """
-    cleaned_text = text
+    lowered = text.lower()
     
-    for filler in FILLER_WORDS:
+    # Lowercasing can change the length of some non-ASCII text, which would
+    # break the span offsets below, so use the regex for those inputs
+    if _FILLER_AUTOMATON is None or len(lowered) != len(text):
         # Remove filler words (case-insensitive), preserving surrounding spaces
-        cleaned_text = re.sub(filler, ' ', cleaned_text, flags=re.IGNORECASE)
-    
-    return cleaned_text
+        return _RE_FILLERS.sub(' ', text)
+    
+    # Keep the longest match at each start offset that sits on word boundaries
+    longest = {}
+    for end, length in _FILLER_AUTOMATON.iter(lowered):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        if length > longest.get(start, 0):
+            longest[start] = length
+    
+    if not longest:
+        return text
+    
+    # Splice the surviving segments, replacing each filler with a space
+    parts = []
+    position = 0
+    for start in sorted(longest):
+        if start < position:
+            continue  # Overlaps a filler that was already removed
+        parts.append(text[position:start])
+        parts.append(' ')
+        position = start + longest[start]
+    parts.append(text[position:])
+    
+    return ''.join(parts)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class used by the \\b anchors in FILLER_WORDS."""
+    return char.isalnum() or char == '_'
 
 
 def fix_spacing(text: str) -> str:
@@ -90,17 +192,16 @@ def fix_spacing(text: str) -> str:
     Returns:
         Text with corrected spacing
     """
-    # Remove multiple spaces
-    text = re.sub(r' {2,}', ' ', text)
+    # Remove multiple spaces and spaces at start and end of lines, dropping
+    # blank lines; str.split()/join does this in C without the regex engine
+    lines = (' '.join(line.split()) for line in text.split('\n'))
+    text = '\n'.join(line for line in lines if line)
     
     # Remove spaces before punctuation
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+    text = _RE_SPACE_BEFORE_PUNCT.sub('', text)
     
     # Ensure space after punctuation (if not at end of string)
-    text = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', text)
-    
-    # Remove spaces at start and end of lines
-    text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
+    text = _RE_NO_SPACE_AFTER_PUNCT.sub(r'\1 \2', text)
     
     return text
 
@@ -120,10 +221,10 @@ def fix_punctuation(text: str) -> str:
         Text with corrected punctuation
     """
     # Remove multiple punctuation marks
-    text = re.sub(r'([.,!?;:]){2,}', r'\1', text)
+    text = _RE_MULTI_PUNCT.sub('', text)
     
     # Capitalize first letter of sentences (after . ! ?)
-    text = re.sub(r'([.!?]\s+)([a-z])', lambda m: m.group(1) + m.group(2).upper(), text)
+    text = _RE_SENTENCE_START.sub(lambda m: m.group(1) + m.group(2).upper(), text)
     
     # Capitalize first letter of text
     if text:
@@ -154,7 +255,8 @@ def normalize_whitespace(text: str) -> str:
     text = text.replace('\r\n', '\n').replace('\r', '\n')
     
     # Remove multiple consecutive newlines (keep max 2 for paragraph breaks)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    while '\n\n\n' in text:
+        text = text.replace('\n\n\n', '\n\n')
     
     # Remove trailing/leading whitespace from entire text
     text = text.strip()
@@ -182,7 +284,7 @@ def clean_transcript(text: str) -> str:
     Raises:
         TranscriptCleaningError: If cleaning fails
     """
-    if not text or not isinstance(text, str):
+    if not text or not isinstance(text, str) or text.isspace():
         logger.warning("Empty or invalid text provided for cleaning")
         return ""
     
@@ -219,6 +321,93 @@ def clean_transcript(text: str) -> str:
         return text.strip()
 
 
+def clean_segment(text: str) -> str:
+    """
+    Clean a single transcript segment.
+    
+    Removes timestamps and filler words, fixes spacing and collapses repeated
+    punctuation. Sentence capitalization across segment boundaries is left to
+    SentenceCapitalizer, since it depends on the preceding segment.
+    
+    Args:
+        text: Raw segment text
+        
+    Returns:
+        Cleaned segment text (may be empty, e.g. for silence)
+    """
+    # Silent stretches often decode to empty or blank segments
+    if not text or text.isspace():
+        return ""
+    
+    text = remove_timestamps(text)
+    text = remove_filler_words(text)
+    text = fix_spacing(text)
+    return _RE_MULTI_PUNCT.sub('', text)
+
+
+class SentenceCapitalizer:
+    """
+    Capitalize sentence starts across a stream of transcript segments.
+    
+    Remembers whether the previous segment ended a sentence, so the first
+    letter of the next segment is capitalized as if the segments had been
+    joined before cleaning.
+    """
+    
+    def __init__(self):
+        self.at_sentence_start = True
+    
+    def __call__(self, segment: str) -> str:
+        if not segment:
+            return segment
+        
+        # Capitalize first letter of sentences within the segment
+        segment = _RE_SENTENCE_START.sub(lambda m: m.group(1) + m.group(2).upper(), segment)
+        
+        if self.at_sentence_start:
+            segment = segment[0].upper() + segment[1:]
+        
+        self.at_sentence_start = segment[-1] in '.!?'
+        return segment
+
+
+def clean_transcript_segments(segments) -> str:
+    """
+    Clean transcript text one segment at a time.
+    
+    Produces the same kind of output as clean_transcript() on the joined
+    text, but each segment goes through the whole pipeline on its own, so
+    only one segment's intermediate strings are alive at any time. Intended
+    for consuming Whisper segments as they are decoded.
+    
+    Args:
+        segments: Iterable of raw segment texts
+        
+    Returns:
+        Cleaned transcript text, or "" if nothing survived cleaning
+    """
+    capitalize = SentenceCapitalizer()
+    parts = []
+    
+    for segment in segments:
+        cleaned = clean_segment(segment)
+        if not cleaned:
+            continue
+        
+        # Punctuation opening a segment belongs to the previous word
+        if parts and cleaned[0] not in '.,!?;:':
+            parts.append(' ')
+        parts.append(capitalize(cleaned))
+    
+    cleaned = ''.join(parts)
+    
+    # Add period at end if missing
+    if cleaned and cleaned[-1] not in '.!?':
+        cleaned += '.'
+    
+    return cleaned
+
+
 def segment_transcript(text: str, max_segment_length: int = 500) -> list:
     """
     Split transcript into logical segments for blog generation.
@@ -232,34 +421,40 @@ def segment_transcript(text: str, max_segment_length: int = 500) -> list:
     Returns:
         List of text segments
     """
-    if not text:
+    if not text or text.isspace():
         return []
     
-    # Split into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    
     segments = []
-    current_segment = ""
-    
-    for sentence in sentences:
-        # If adding this sentence would exceed max length
-        if len(current_segment) + len(sentence) + 1 > max_segment_length:
-            # Save current segment if not empty
-            if current_segment:
-                segments.append(current_segment.strip())
-                current_segment = sentence
-            else:
+    segment_start = segment_end = None
+    
+    # Grow the current segment by sentence offsets and slice it out of the
+    # original text once, instead of building intermediate sentence strings
+    for start, end in _iter_sentence_spans(text):
+        if segment_start is None:
+            if end - start + 1 > max_segment_length:
                 # Single sentence exceeds max length, add it anyway
-                segments.append(sentence.strip())
-        else:
-            # Add sentence to current segment
-            if current_segment:
-                current_segment += " " + sentence
+                segments.append(text[start:end].strip())
             else:
-                current_segment = sentence
+                segment_start, segment_end = start, end
+        elif end - segment_start > max_segment_length:
+            # Adding this sentence would exceed max length
+            segments.append(text[segment_start:segment_end].strip())
+            segment_start, segment_end = start, end
+        else:
+            segment_end = end
     
     # Add remaining segment
-    if current_segment:
-        segments.append(current_segment.strip())
+    if segment_start is not None:
+        segments.append(text[segment_start:segment_end].strip())
     
     return segments
+
+
+def _iter_sentence_spans(text: str):
+    """Yield (start, end) offsets of each sentence in text."""
+    start = 0
+    for match in _RE_SENTENCE_BOUNDARY.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    if start < len(text):
+        yield start, len(text)
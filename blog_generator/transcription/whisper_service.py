@@ -13,20 +13,40 @@ faster-whisper is a lightweight alternative to openai-whisper that:
 """
 
 import os
+import functools
+import hashlib
+import inspect
 import logging
+import math
 import time
-import signal
-from pathlib import Path
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # Optional, only used to count physical cores
+    psutil = None
 
 from .config import (
     WHISPER_MODEL_SIZE,
     WHISPER_DEVICE,
+    WHISPER_NUM_WORKERS,
+    WHISPER_COMPUTE_TYPE,
+    WHISPER_DOWNLOAD_ROOT,
+    WHISPER_FLASH_ATTENTION,
+    WHISPER_IDLE_TIMEOUT,
+    WHISPER_MAX_CACHED_MODELS,
+    TRANSCRIBE_QUALITY,
     ASR_TIMEOUT,
     AUDIO_FORMAT,
     AUDIO_SAMPLE_RATE,
+    AUDIO_SEGMENT_SECONDS,
+    TRANSCRIPTION_CACHE_SIZE,
     DEFAULT_LANGUAGE,
-    SUPPORTED_LANGUAGES,
+    SUPPORTED_LANGUAGES_SET,
+    VALID_DEVICES_SET,
     VALID_MODEL_SIZES
 )
 from .exceptions import (
@@ -37,6 +57,7 @@ from .exceptions import (
     TranscriptionTimeoutError,
     OutOfMemoryError
 )
+from .transcript_cleaner import clean_transcript_segments
 
 logger = logging.getLogger(__name__)
 
@@ -45,52 +66,215 @@ logger = logging.getLogger(__name__)
 # Global Model Cache
 # ============================================================================
 
-_whisper_model = None
+# Size and device of the most recently requested model, reported by
+# get_model_info()
 _model_size_loaded = None
+_device_loaded = None
+
+# Loaded models by (size, device) in LRU order, at most
+# WHISPER_MAX_CACHED_MODELS of them
+_models: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+
+# Guards _models, the bookkeeping below and unloads. Held only briefly,
+# never for a load.
+_model_lock = threading.Lock()
+
+# Per-(size, device) locks serializing misses, so concurrent requests in a
+# threaded worker can't construct the same model twice while requests for a
+# model that is already resident never wait behind another model's load
+_model_load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+# Pending idle unload, restarted on every load_whisper_model() call
+_idle_timer = None
+
+
+# Successful transcription results: (content hash, model size, language,
+# clean, quality) -> result dict. Kept in LRU order and guarded by a lock
+# since transcriptions run on several threads.
+_transcription_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_transcription_cache_lock = threading.Lock()
+
+# Read size when hashing audio files for the transcription cache
+_HASH_CHUNK_SIZE = 1024 * 1024
 
 
 # ============================================================================
-# Timeout Handler
+# Decoding Options
 # ============================================================================
 
-class TimeoutException(Exception):
-    """Exception raised when operation times out."""
-    pass
+# faster-whisper transcribe() options for each TRANSCRIBE_QUALITY preset
+_DECODE_PRESETS = {
+    'accurate': dict(
+        beam_size=5,
+        vad_filter=True,  # Voice activity detection
+        vad_parameters=dict(min_silence_duration_ms=500)
+    ),
+    # Greedy decoding with no temperature fallback, and longer silences cut
+    # by VAD; without_timestamps skips predicting timestamp tokens
+    'fast': dict(
+        beam_size=1,
+        best_of=1,
+        temperature=0.0,
+        condition_on_previous_text=False,
+        without_timestamps=True,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=1000, speech_pad_ms=200)
+    ),
+}
 
 
-def timeout_handler(signum, frame):
-    """Signal handler for timeout."""
-    raise TimeoutException("Operation timed out")
+def _decode_options(timestamps: bool = False) -> Dict:
+    """
+    Decoding options for the configured TRANSCRIBE_QUALITY.
+    
+    Args:
+        timestamps: Whether the caller uses segment start/end times
+    """
+    options = dict(_DECODE_PRESETS.get(TRANSCRIBE_QUALITY, _DECODE_PRESETS['accurate']))
+    if timestamps:
+        options.pop('without_timestamps', None)
+    return options
 
 
 # ============================================================================
-# Model Loading Functions
+# Timeout Handling
 # ============================================================================
 
-def load_whisper_model(model_size: Optional[str] = None, device: Optional[str] = None, force_reload: bool = False) -> object:
+# Transcriptions run on this pool so callers can wait on them with a timeout
+# from any thread; SIGALRM only works on the main thread, which request
+# handlers in WSGI/ASGI workers usually aren't
+_transcribe_executor = ThreadPoolExecutor(
+    max_workers=max(1, WHISPER_NUM_WORKERS),
+    thread_name_prefix='whisper'
+)
+
+
+def _collect_segments(
+    model,
+    audio,
+    cancelled: Optional[threading.Event] = None,
+    started: Optional[threading.Event] = None,
+    **options
+):
     """
-    Load faster-whisper model with caching to avoid reloading.
+    Run model.transcribe() and drain its segment generator.
     
-    The model is loaded once and cached in memory. Subsequent calls return
-    the cached model unless force_reload is True or a different model size
-    is requested.
+    Only each segment's text and avg_logprob are kept, so the Segment objects
+    (with their token ids) are freed as they are consumed instead of all
+    being held until the end. faster-whisper decodes lazily, so once
+    cancelled is set the remaining audio is never decoded. started is set
+    when a pool worker picks the job up, so callers can time the run itself.
     
-    Args:
-        model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large').
-                   Defaults to configured WHISPER_MODEL_SIZE.
-        device: Device to load model on ('cpu' or 'cuda').
-               Defaults to configured WHISPER_DEVICE.
-        force_reload: Force reload the model even if cached.
-        
     Returns:
-        faster-whisper WhisperModel object
-        
-    Raises:
-        ModelLoadError: If model fails to load
-        OutOfMemoryError: If insufficient memory to load model
+        tuple: (texts, logprobs, info)
     """
-    global _whisper_model, _model_size_loaded
+    if started is not None:
+        started.set()
+    segments, info = model.transcribe(audio, **options)
+    texts = []
+    logprobs = []
+    for segment in segments:
+        if cancelled is not None and cancelled.is_set():
+            break
+        texts.append(segment.text)
+        logprobs.append(getattr(segment, 'avg_logprob', None))
+    return texts, logprobs, info
+
+
+# ============================================================================
+# Model Loading Functions
+# ============================================================================
+
+def _load_model(model_size: str, device: str) -> object:
+    """Construct a faster-whisper model; load_whisper_model() caches the result."""
+    from faster_whisper import WhisperModel
     
+    # Get model info for logging
+    model_info = VALID_MODEL_SIZES.get(model_size, {})
+    memory_gb = model_info.get('memory_gb', 'unknown')
+    logger.info(f"Model requires approximately {memory_gb}GB of RAM")
+    
+    # Load the model
+    start_time = time.time()
+    
+    # faster-whisper parameters
+    # compute_type: "int8" for CPU (faster, less memory), "float16" for GPU
+    # (half the memory traffic and Tensor Core throughput), unless overridden
+    compute_type = WHISPER_COMPUTE_TYPE or ("int8" if device == "cpu" else "float16")
+    
+    # CTranslate2 only uses 4 threads by default; let int8 inference use every
+    # core, split evenly between the workers that decode concurrent calls
+    num_workers = max(1, WHISPER_NUM_WORKERS)
+    cpu_threads = max(1, _cpu_core_count() // num_workers) if device == "cpu" else 0
+    
+    model_kwargs = dict(
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+        download_root=WHISPER_DOWNLOAD_ROOT,  # None uses the default cache
+    )
+    
+    # Fused attention cuts the encoder's memory traffic on GPU; CTranslate2
+    # has no CPU kernel for it, and older faster-whisper lacks the argument
+    if (WHISPER_FLASH_ATTENTION and device == "cuda"
+            and 'flash_attention' in inspect.signature(WhisperModel).parameters):
+        model_kwargs['flash_attention'] = True
+    
+    # Load an already downloaded model straight from disk; only go to the
+    # Hub (which checks for updates on every load) when it isn't there yet
+    try:
+        model = WhisperModel(model_size, local_files_only=True, **model_kwargs)
+    except FileNotFoundError:
+        logger.info("faster-whisper model %s not cached locally, downloading", model_size)
+        model = WhisperModel(model_size, local_files_only=False, **model_kwargs)
+    
+    load_time = time.time() - start_time
+    
+    logger.info(
+        f"faster-whisper model loaded successfully in {load_time:.2f}s: "
+        f"{model_size} on {device} (compute_type: {compute_type})"
+    )
+    
+    return model
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_core_count() -> int:
+    """
+    Number of cores inference threads should use.
+    
+    Hyperthread siblings share one core's vector units, so a thread per
+    logical CPU only adds contention to the int8 matmuls; count physical
+    cores when psutil can tell, capped by the CPUs this process may run on
+    (container CPU sets, taskset).
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        available = os.cpu_count() or 1
+    
+    physical = psutil.cpu_count(logical=False) if psutil is not None else None
+    return max(1, min(available, physical or available))
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """Whether CTranslate2 can see a CUDA device. Queried once per process."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_model_args(model_size: Optional[str], device: Optional[str]) -> Tuple[str, str]:
+    """
+    Apply defaults and validation to load_whisper_model() arguments.
+    
+    Memoized, so warnings about invalid values are logged once per value.
+    """
     # Use configured values if not provided
     model_size = model_size or WHISPER_MODEL_SIZE
     device = device or WHISPER_DEVICE
@@ -105,58 +289,77 @@ def load_whisper_model(model_size: Optional[str] = None, device: Optional[str] =
         model_size = 'base'
     
     # Validate device - faster-whisper uses different device names
-    if device not in ['cpu', 'cuda']:
+    if device not in VALID_DEVICES_SET:
         logger.warning(f"Invalid device '{device}'. Using 'cpu' instead.")
         device = 'cpu'
     
-    # For faster-whisper, we'll use cpu for compatibility
-    # CUDA support can be added later if needed
-    if device == 'cuda':
-        logger.info("faster-whisper: Using CPU for maximum compatibility on Render")
+    # Fall back to CPU where there is no usable GPU (e.g. on Render)
+    if device == 'cuda' and not _cuda_available():
+        logger.info("faster-whisper: No CUDA device available, using CPU")
         device = 'cpu'
     
-    # Return cached model if available and same size
-    if not force_reload and _whisper_model is not None and _model_size_loaded == model_size:
-        logger.debug(f"Using cached faster-whisper model: {model_size}")
-        return _whisper_model
+    return model_size, device
+
+
+def load_whisper_model(model_size: Optional[str] = None, device: Optional[str] = None, force_reload: bool = False) -> object:
+    """
+    Load faster-whisper model with caching to avoid reloading.
     
-    # Load new model
-    logger.info(f"Loading faster-whisper model: {model_size} on {device}")
+    Models are cached in memory by size and device. Subsequent calls return
+    the cached model unless force_reload is True.
     
-    try:
-        from faster_whisper import WhisperModel
-        
-        # Get model info for logging
-        model_info = VALID_MODEL_SIZES.get(model_size, {})
-        memory_gb = model_info.get('memory_gb', 'unknown')
-        logger.info(f"Model requires approximately {memory_gb}GB of RAM")
-        
-        # Load the model
-        start_time = time.time()
-        
-        # faster-whisper parameters
-        # compute_type: "int8" for CPU (faster, less memory), "float16" for GPU
-        compute_type = "int8" if device == "cpu" else "float16"
-        
-        model = WhisperModel(
-            model_size,
-            device=device,
-            compute_type=compute_type,
-            download_root=None,  # Use default cache directory
-            local_files_only=False
-        )
-        
-        load_time = time.time() - start_time
+    Args:
+        model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large').
+                   Defaults to configured WHISPER_MODEL_SIZE.
+        device: Device to load model on ('cpu' or 'cuda').
+               Defaults to configured WHISPER_DEVICE.
+        force_reload: Force reload the model even if cached.
         
-        # Cache the model
-        _whisper_model = model
-        _model_size_loaded = model_size
+    Returns:
+        faster-whisper WhisperModel object
         
-        logger.info(
-            f"faster-whisper model loaded successfully in {load_time:.2f}s: "
-            f"{model_size} on {device} (compute_type: {compute_type})"
-        )
+    Raises:
+        ModelLoadError: If model fails to load
+        OutOfMemoryError: If insufficient memory to load model
+    """
+    global _model_size_loaded, _device_loaded
+    
+    # Defaults, validation and the CUDA probe are resolved once per distinct
+    # argument pair, so cache hits cost two dict lookups
+    model_size, device = _resolve_model_args(model_size, device)
+    
+    logger.debug("Requesting faster-whisper model: %s on %s", model_size, device)
+    
+    key = (model_size, device)
+    
+    try:
+        # Hits are a plain dict read; only misses take the per-key lock, so a
+        # second miss for this key waits for the first one's model
+        model = None if force_reload else _models.get(key)
+        if model is None:
+            with _model_lock:
+                load_lock = _model_load_locks.setdefault(key, threading.Lock())
+            
+            with load_lock:
+                with _model_lock:
+                    if force_reload:
+                        # Only this key; other cached models stay loaded
+                        _models.pop(key, None)
+                    model = _models.get(key)
+                
+                if model is None:
+                    model = _load_model(model_size, device)
+                    with _model_lock:
+                        _models[key] = model
+                        while len(_models) > max(1, WHISPER_MAX_CACHED_MODELS):
+                            _models.popitem(last=False)
         
+        with _model_lock:
+            if key in _models:
+                _models.move_to_end(key)
+            _model_size_loaded = model_size
+            _device_loaded = device
+            _schedule_idle_unload()
         return model
         
     except ImportError as e:
@@ -181,27 +384,80 @@ def load_whisper_model(model_size: Optional[str] = None, device: Optional[str] =
         raise ModelLoadError(error_msg) from e
 
 
+def prewarm_whisper_model(model_size: Optional[str] = None, device: Optional[str] = None) -> bool:
+    """
+    Load the model and run it once on half a second of silence.
+    
+    The first transcription after a load also pays for allocating the
+    inference buffers; doing it at startup keeps that off the first request.
+    
+    Args:
+        model_size: Model size to warm up (defaults to WHISPER_MODEL_SIZE)
+        device: Device to warm up on (defaults to WHISPER_DEVICE)
+    
+    Returns:
+        bool: True if the warm-up ran, False if it failed (logged, not raised)
+    """
+    try:
+        import numpy as np  # Installed with faster-whisper
+        
+        model = load_whisper_model(model_size=model_size, device=device)
+        silence = np.zeros(AUDIO_SAMPLE_RATE // 2, dtype=np.float32)
+        segments, _ = model.transcribe(silence, language=DEFAULT_LANGUAGE or 'en', beam_size=1)
+        for _ in segments:
+            pass
+        
+        logger.info("faster-whisper model warmed up")
+        return True
+        
+    except Exception as e:
+        logger.warning("faster-whisper warm-up failed: %s", e)
+        return False
+
+
+def _schedule_idle_unload() -> None:
+    """Restart the WHISPER_IDLE_TIMEOUT countdown. Caller holds _model_lock."""
+    global _idle_timer
+    
+    if not WHISPER_IDLE_TIMEOUT or WHISPER_IDLE_TIMEOUT <= 0:
+        return
+    
+    if _idle_timer is not None:
+        _idle_timer.cancel()
+    
+    _idle_timer = threading.Timer(WHISPER_IDLE_TIMEOUT, unload_whisper_model)
+    _idle_timer.daemon = True
+    _idle_timer.start()
+
+
 def unload_whisper_model() -> None:
     """
-    Unload the cached faster-whisper model to free memory.
+    Unload the cached faster-whisper models to free memory.
     
     This can be useful for freeing up resources when the model
-    is not expected to be used for a while.
+    is not expected to be used for a while. Called automatically after
+    WHISPER_IDLE_TIMEOUT seconds without a load_whisper_model() call.
     """
-    global _whisper_model, _model_size_loaded
+    global _model_size_loaded, _device_loaded, _idle_timer
     
-    if _whisper_model is not None:
-        logger.info(f"Unloading faster-whisper model: {_model_size_loaded}")
-        _whisper_model = None
-        _model_size_loaded = None
+    with _model_lock:
+        if _idle_timer is not None:
+            _idle_timer.cancel()
+            _idle_timer = None
         
-        # Force garbage collection
-        import gc
-        gc.collect()
-        
-        logger.info("faster-whisper model unloaded successfully")
-    else:
-        logger.debug("No faster-whisper model loaded to unload")
+        if _models:
+            logger.info(f"Unloading faster-whisper model: {_model_size_loaded}")
+            _models.clear()
+            _model_size_loaded = None
+            _device_loaded = None
+            
+            # Force garbage collection
+            import gc
+            gc.collect()
+            
+            logger.info("faster-whisper model unloaded successfully")
+        else:
+            logger.debug("No faster-whisper model loaded to unload")
 
 
 def get_model_info() -> Dict:
@@ -216,7 +472,7 @@ def get_model_info() -> Dict:
             'memory_gb': float or None
         }
     """
-    if _whisper_model is None:
+    if not _models or _model_size_loaded is None:
         return {
             'loaded': False,
             'model_size': None,
@@ -224,13 +480,14 @@ def get_model_info() -> Dict:
             'memory_gb': None
         }
     
-    device = next(_whisper_model.parameters()).device
+    # The device is recorded at load time; WhisperModel exposes no tensors
+    # to inspect, and re-resolving it could report a different device
     model_info = VALID_MODEL_SIZES.get(_model_size_loaded, {})
     
     return {
         'loaded': True,
         'model_size': _model_size_loaded,
-        'device': str(device),
+        'device': _device_loaded,
         'memory_gb': model_info.get('memory_gb')
     }
 
@@ -239,78 +496,160 @@ def get_model_info() -> Dict:
 # Audio Validation Functions
 # ============================================================================
 
-def validate_audio_file(audio_path: str) -> None:
+# Extensions faster-whisper is known to handle; others only log a warning
+_AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.m4a', '.flac', '.ogg'})
+
+# Files smaller than this (1KB) can't hold meaningful audio and are treated
+# as corrupted before transcription; real decoding errors surface from the model
+_MIN_AUDIO_FILE_SIZE = 1000
+
+
+def validate_audio_file(audio_path: str) -> int:
     """
     Validate that audio file exists and has correct format.
     
     Args:
         audio_path: Path to audio file
         
+    Returns:
+        int: File size in bytes
+        
     Raises:
         AudioFormatError: If audio file is invalid
     """
-    path = Path(audio_path)
-    
-    # Check if file exists
-    if not path.exists():
+    # Check if file exists (a single stat also gives us the size below)
+    try:
+        st = os.stat(audio_path)
+    except FileNotFoundError:
         raise AudioFormatError(f"Audio file does not exist: {audio_path}")
+    except PermissionError:
+        raise AudioFormatError(f"Audio file is not readable: {audio_path}")
     
-    # Check if file is readable
-    if not os.access(path, os.R_OK):
+    # Check if file is readable. stat() only needs search permission on the
+    # directory, so this is the one check it can't answer.
+    if not os.access(audio_path, os.R_OK):
         raise AudioFormatError(f"Audio file is not readable: {audio_path}")
     
     # Check file size
-    file_size = path.stat().st_size
+    file_size = st.st_size
     if file_size == 0:
         raise AudioFormatError(f"Audio file is empty: {audio_path}")
     
     # Check file extension
-    if path.suffix.lower() not in ['.wav', '.mp3', '.m4a', '.flac', '.ogg']:
+    suffix = os.path.splitext(audio_path)[1]
+    if suffix.lower() not in _AUDIO_EXTENSIONS:
         logger.warning(
-            f"Audio file has unexpected extension: {path.suffix}. "
+            f"Audio file has unexpected extension: {suffix}. "
             f"Whisper may still be able to process it."
         )
     
     logger.debug(f"Audio file validated: {audio_path} ({file_size} bytes)")
+    
+    return file_size
 
 
-def check_audio_corruption(audio_path: str) -> bool:
+# ============================================================================
+# Transcription Result Cache
+# ============================================================================
+
+def _transcription_cache_key(audio_path: str, model_size: Optional[str],
+                             language: Optional[str], clean: bool) -> Optional[tuple]:
     """
-    Check if audio file is corrupted by attempting to read it.
+    Key a transcription by the audio content and the options that change its text.
+    
+    The whole file is hashed: blake2b runs at around 1 GB/s, a rounding error
+    next to transcribing it, and hashing only the head and tail would confuse
+    equal-length recordings that start and end in silence.
     
-    Args:
-        audio_path: Path to audio file
-        
     Returns:
-        bool: True if file appears valid, False if corrupted
+        tuple, or None if caching is disabled or the file can't be read
     """
+    if TRANSCRIPTION_CACHE_SIZE <= 0:
+        return None
+    
+    digest = hashlib.blake2b(digest_size=16)
     try:
-        # For faster-whisper, we'll do a basic file check
-        # The actual audio validation happens during transcription
-        path = Path(audio_path)
-        
-        # Check file size is reasonable
-        file_size = path.stat().st_size
-        if file_size < 1000:  # Less than 1KB is suspicious
-            logger.warning(f"Audio file is very small: {file_size} bytes")
-            return False
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Audio file appears corrupted: {str(e)}")
-        return False
+        with open(audio_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    except OSError as e:
+        logger.debug("Not caching transcription of %s: %s", audio_path, e)
+        return None
+    
+    return (
+        digest.hexdigest(),
+        model_size or WHISPER_MODEL_SIZE,
+        language or DEFAULT_LANGUAGE,
+        clean,
+        TRANSCRIBE_QUALITY
+    )
+
+
+def _get_cached_transcription(key: Optional[tuple]) -> Optional[Dict]:
+    """Return a copy of the cached result for a key, or None if absent."""
+    if key is None:
+        return None
+    with _transcription_cache_lock:
+        result = _transcription_cache.get(key)
+        if result is None:
+            return None
+        _transcription_cache.move_to_end(key)
+        return dict(result)
+
+
+def _cache_transcription(key: Optional[tuple], result: Dict) -> None:
+    """Store a successful result, evicting the least recently used entry if full."""
+    if key is None:
+        return
+    with _transcription_cache_lock:
+        _transcription_cache[key] = dict(result)
+        _transcription_cache.move_to_end(key)
+        while len(_transcription_cache) > TRANSCRIPTION_CACHE_SIZE:
+            _transcription_cache.popitem(last=False)
+
+
+def clear_transcription_cache() -> None:
+    """Drop all cached transcription results."""
+    with _transcription_cache_lock:
+        _transcription_cache.clear()
 
 
 # ============================================================================
 # Transcription Functions
 # ============================================================================
 
+def _average_confidence(logprobs) -> float:
+    """
+    Average per-segment confidence on a 0-1 scale.
+    
+    Takes each segment's avg_logprob, with None where it isn't available.
+    """
+    if not logprobs:
+        return 0.0
+    
+    # Average of segment average probabilities, in one pass without building
+    # intermediate lists (long audio can produce thousands of segments).
+    # avg_logprob is typically negative, closer to 0 is better, so exp()
+    # converts it to a confidence on a 0-1 scale.
+    total = 0.0
+    count = 0
+    for logprob in logprobs:
+        if logprob is not None:
+            total += math.exp(logprob)
+            count += 1
+    
+    if not count:
+        return 0.8  # Default confidence if not available
+    
+    return min(1.0, max(0.0, total / count))  # Clamp to 0-1
+
+
 def transcribe_audio(
     audio_path: str,
     language: Optional[str] = None,
     model_size: Optional[str] = None,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    clean: bool = False
 ) -> Dict:
     """
     Transcribe audio file using Whisper with automatic language detection.
@@ -322,11 +661,20 @@ def transcribe_audio(
     - Transcription with timeout handling
     - Error handling for various failure modes
     
+    Successful results for audio files are cached by content (see
+    TRANSCRIPTION_CACHE_SIZE), so transcribing the same audio again with the
+    same options returns the earlier result without running the model.
+    
     Args:
-        audio_path: Path to audio file (WAV format recommended)
+        audio_path: Path to audio file (WAV format recommended), or a float32
+                    16kHz mono waveform such as the one returned by
+                    audio_extractor.extract_audio_pcm()
         language: Optional language code (e.g., 'en', 'es'). If None, auto-detects.
         model_size: Optional model size override
-        timeout: Optional timeout in seconds (defaults to ASR_TIMEOUT)
+        timeout: Optional timeout in seconds (defaults to ASR_TIMEOUT), counted
+                 from when a pool worker starts the job rather than from submission
+        clean: Run each segment through the transcript cleaner as it is
+               collected, returning cleaned text instead of raw text
         
     Returns:
         dict: {
@@ -344,29 +692,46 @@ def transcribe_audio(
         OutOfMemoryError: If system runs out of memory
         TranscriptionError: For other transcription errors
     """
-    logger.info(f"Starting transcription for: {audio_path}")
+    # In-memory waveforms skip the file checks and go straight to the model
+    is_file = isinstance(audio_path, (str, os.PathLike))
+    source = audio_path if is_file else 'in-memory audio'
+    logger.info(f"Starting transcription for: {source}")
     
     # Use default timeout if not provided
     timeout = timeout or ASR_TIMEOUT
     
     try:
-        # Validate audio file
-        validate_audio_file(audio_path)
-        
-        # Check for corruption
-        if not check_audio_corruption(audio_path):
-            raise AudioFormatError(
-                "Audio file appears to be corrupted or invalid"
-            )
+        if is_file:
+            # Validate audio file
+            file_size = validate_audio_file(audio_path)
+            
+            # Check for corruption, using the size from the validation stat
+            if file_size < _MIN_AUDIO_FILE_SIZE:
+                raise AudioFormatError(
+                    f"Audio file appears to be corrupted or invalid "
+                    f"({file_size} bytes)"
+                )
+        elif audio_path.dtype != 'float32':
+            # float16 waveforms (AUDIO_DTYPE) are widened only for inference
+            audio_path = audio_path.astype('float32')
         
         # Validate language if provided
-        if language and language not in SUPPORTED_LANGUAGES:
+        if language and language not in SUPPORTED_LANGUAGES_SET:
             logger.warning(
                 f"Unsupported language '{language}'. "
                 f"Will attempt auto-detection."
             )
             language = None
         
+        # The same audio with the same options gives the same transcript
+        cache_key = None
+        if is_file:
+            cache_key = _transcription_cache_key(audio_path, model_size, language, clean)
+            cached = _get_cached_transcription(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached transcription for: {source}")
+                return cached
+        
         # Load Whisper model
         try:
             model = load_whisper_model(model_size=model_size)
@@ -384,56 +749,50 @@ def transcribe_audio(
         # Transcribe with timeout handling
         start_time = time.time()
         
+        # Perform transcription with faster-whisper on the worker pool
+        cancelled = threading.Event()
+        started = threading.Event()
+        future = _transcribe_executor.submit(
+            _collect_segments,
+            model,
+            audio_path,
+            cancelled,
+            started,
+            language=lang,
+            task='transcribe',
+            **_decode_options()
+        )
+        
         try:
-            # Set up timeout (Unix-like systems only)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(timeout)
-            
-            # Perform transcription with faster-whisper
-            # faster-whisper returns segments generator and info
-            segments, info = model.transcribe(
-                audio_path,
-                language=lang,
-                task='transcribe',
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(min_silence_duration_ms=500)
-            )
-            
-            # Collect all segments and build full text
-            all_segments = list(segments)
-            text = ' '.join([segment.text for segment in all_segments]).strip()
-            
-            # Cancel timeout
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)
-            
-        except TimeoutException:
+            # Time spent queued behind other transcriptions doesn't count
+            # against the timeout; only the run itself does
+            started.wait()
+            texts, logprobs, info = future.result(timeout=timeout)
+        except FuturesTimeoutError:
+            # Stop decoding after the current segment (or before it starts)
+            cancelled.set()
+            future.cancel()
             raise TranscriptionTimeoutError(
                 f"Transcription timed out after {timeout} seconds. "
                 f"Try a shorter video or increase timeout."
             )
         
+        # Build full text from the collected segments
+        text = ''
+        if clean:
+            text = clean_transcript_segments(texts)
+        
+        # Use the raw text if not cleaning or cleaning produced nothing useful
+        if len(text) < 10:
+            text = ' '.join(texts).strip()
+        
         transcription_time = time.time() - start_time
         
         # Extract results from faster-whisper info object
         detected_language = info.language if hasattr(info, 'language') else 'unknown'
         
         # Calculate confidence from segments
-        if all_segments:
-            # Average of segment average probabilities
-            confidences = [seg.avg_logprob for seg in all_segments if hasattr(seg, 'avg_logprob')]
-            if confidences:
-                # Convert log probabilities to confidence (0-1 scale)
-                # avg_logprob is typically negative, closer to 0 is better
-                import math
-                avg_confidence = sum([math.exp(c) for c in confidences]) / len(confidences)
-                avg_confidence = min(1.0, max(0.0, avg_confidence))  # Clamp to 0-1
-            else:
-                avg_confidence = 0.8  # Default confidence if not available
-        else:
-            avg_confidence = 0.0
+        avg_confidence = _average_confidence(logprobs)
         
         # Validate transcription result
         if not text:
@@ -449,13 +808,15 @@ def transcribe_audio(
             f"confidence: {avg_confidence:.2f}"
         )
         
-        return {
+        result = {
             'success': True,
             'text': text,
             'language': detected_language,
             'confidence': avg_confidence,
             'duration': transcription_time
         }
+        _cache_transcription(cache_key, result)
+        return result
         
     except AudioFormatError as e:
         logger.error(f"Audio format error: {str(e)}")
@@ -491,11 +852,212 @@ def transcribe_audio(
             'success': False,
             'error': error_msg
         }
+
+
+def transcribe_long_audio(
+    audio_path: str,
+    language: Optional[str] = None,
+    model_size: Optional[str] = None,
+    clean: bool = True,
+    segment_seconds: float = AUDIO_SEGMENT_SECONDS,
+    timeout: Optional[int] = None
+) -> Dict:
+    """
+    Transcribe a long audio file by splitting it and transcribing the pieces concurrently.
+    
+    The file is cut into segment_seconds pieces with one ffmpeg call, and the
+    pieces are transcribed on the shared transcription pool against one
+    model. Only WHISPER_NUM_WORKERS pieces are queued at a time, so other
+    requests' transcriptions interleave with them instead of waiting for the
+    whole file. With a single worker nothing runs in parallel, so the whole
+    file is handed to transcribe_audio() instead (without 'segments').
+    
+    The first piece is transcribed on its own and its detected language is
+    used for the rest. Segment timestamps are shifted by each piece's offset
+    so they line up with the original audio. The whole job, splitting
+    included but not time spent waiting for a pool worker, must finish
+    within timeout; otherwise the remaining pieces are cancelled.
+    
+    Args:
+        audio_path: Path to audio file
+        language: Optional language code. If None, detected on the first piece.
+        model_size: Optional model size override
+        clean: Whether to clean the transcript text
+        segment_seconds: Length of each piece in seconds
+        timeout: Optional timeout in seconds for the whole job (defaults to ASR_TIMEOUT)
+        
+    Returns:
+        dict: Shaped like transcribe_audio() results, plus 'segments': a list
+              of dicts with 'start', 'end' and 'text' on the original timeline
+    """
+    from .audio_extractor import split_audio_segments, cleanup_audio_file
+    
+    if WHISPER_NUM_WORKERS <= 1:
+        return transcribe_audio(
+            audio_path, language=language, model_size=model_size, timeout=timeout, clean=clean
+        )
+    
+    logger.info(f"Starting long-audio transcription for: {audio_path}")
+    
+    timeout = timeout or ASR_TIMEOUT
+    deadline = time.monotonic() + timeout
+    
+    pieces = []
+    try:
+        validate_audio_file(audio_path)
+        
+        model = load_whisper_model(model_size=model_size)
+        
+        if language and language not in SUPPORTED_LANGUAGES_SET:
+            logger.warning(f"Unsupported language '{language}'. Will attempt auto-detection.")
+            language = None
+        lang = language or DEFAULT_LANGUAGE
+        
+        start_time = time.time()
+        pieces = split_audio_segments(audio_path, segment_seconds)
+        
+        def transcribe_piece(piece, cancelled, piece_lang, started=None):
+            offset, piece_path = piece
+            if started is not None:
+                started.set()
+            if cancelled.is_set():
+                return [], [], None
+            segments, info = model.transcribe(
+                piece_path,
+                language=piece_lang,
+                task='transcribe',
+                **_decode_options(timestamps=True)
+            )
+            # Keep only what the result needs, shifted onto the original timeline
+            timed = []
+            logprobs = []
+            for segment in segments:
+                if cancelled.is_set():
+                    break
+                timed.append((offset + segment.start, offset + segment.end, segment.text))
+                logprobs.append(getattr(segment, 'avg_logprob', None))
+            return timed, logprobs, info
+        
+        # One deadline for all pieces, on the same pool (and worker limit) as
+        # transcribe_audio(). The first piece runs alone so the rest can reuse
+        # its language instead of each detecting it again.
+        cancelled = threading.Event()
+        futures = deque()
+        results = []
+        try:
+            started = threading.Event()
+            queued_at = time.monotonic()
+            first = _transcribe_executor.submit(
+                transcribe_piece, pieces[0], cancelled, lang, started
+            )
+            futures.append(first)
+            # Time spent queued behind other transcriptions doesn't count
+            started.wait()
+            deadline += time.monotonic() - queued_at
+            results.append(first.result(timeout=max(0, deadline - time.monotonic())))
+            futures.popleft()
+            
+            first_info = results[0][2]
+            piece_lang = lang or getattr(first_info, 'language', None)
+            
+            # Keep at most WHISPER_NUM_WORKERS pieces queued at a time
+            remaining = iter(pieces[1:])
+            for piece in remaining:
+                futures.append(
+                    _transcribe_executor.submit(transcribe_piece, piece, cancelled, piece_lang)
+                )
+                if len(futures) >= WHISPER_NUM_WORKERS:
+                    break
+            while futures:
+                results.append(
+                    futures[0].result(timeout=max(0, deadline - time.monotonic()))
+                )
+                futures.popleft()
+                piece = next(remaining, None)
+                if piece is not None:
+                    futures.append(
+                        _transcribe_executor.submit(transcribe_piece, piece, cancelled, piece_lang)
+                    )
+        except FuturesTimeoutError:
+            raise TranscriptionTimeoutError(
+                f"Transcription timed out after {timeout} seconds. "
+                f"Try a shorter video or increase timeout."
+            )
+        finally:
+            # Stop pieces still decoding, or not yet started, if we bailed out
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+        
+        all_timed = [segment for timed, _, _ in results for segment in timed]
+        text = ''
+        if clean:
+            text = clean_transcript_segments(seg_text for _, _, seg_text in all_timed)
+        
+        # Use the raw text if not cleaning or cleaning produced nothing useful
+        if len(text) < 10:
+            text = ' '.join([seg_text for _, _, seg_text in all_timed]).strip()
+        
+        if not text:
+            raise TranscriptionError(
+                "Transcription produced empty text. "
+                "Audio may be silent or unintelligible."
+            )
+        
+        info = results[0][2]
+        detected_language = info.language if hasattr(info, 'language') else 'unknown'
+        avg_confidence = _average_confidence(
+            [logprob for _, logprobs, _ in results for logprob in logprobs]
+        )
+        transcription_time = time.time() - start_time
+        
+        logger.info(
+            f"Long-audio transcription successful: {len(text)} characters "
+            f"from {len(pieces)} pieces, language: {detected_language}, "
+            f"time: {transcription_time:.2f}s, confidence: {avg_confidence:.2f}"
+        )
+        
+        return {
+            'success': True,
+            'text': text,
+            'segments': [
+                {'start': start, 'end': end, 'text': seg_text.strip()}
+                for start, end, seg_text in all_timed
+            ],
+            'language': detected_language,
+            'confidence': avg_confidence,
+            'duration': transcription_time
+        }
+        
+    except TranscriptionTimeoutError as e:
+        logger.error(f"Transcription timeout: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+        
+    except MemoryError:
+        error_msg = (
+            "System out of memory during transcription. "
+            "Try a shorter video or smaller model."
+        )
+        logger.error(error_msg)
+        return {
+            'success': False,
+            'error': error_msg
+        }
+        
+    except Exception as e:
+        error_msg = f"Transcription failed: {str(e)}"
+        logger.error(error_msg)
+        return {
+            'success': False,
+            'error': error_msg
+        }
         
     finally:
-        # Ensure timeout is cancelled
-        if hasattr(signal, 'SIGALRM'):
-            signal.alarm(0)
+        for _, piece_path in pieces:
+            cleanup_audio_file(piece_path)
 
 
 def transcribe_audio_with_timestamps(
@@ -509,7 +1071,9 @@ def transcribe_audio_with_timestamps(
     This is useful for creating subtitles or time-aligned transcripts.
     
     Args:
-        audio_path: Path to audio file
+        audio_path: Path to audio file, or a decoded 16kHz mono waveform
+                    (see transcribe_audio()), so audio that is transcribed
+                    both ways only has to be decoded once
         language: Optional language code
         model_size: Optional model size override
         
@@ -522,11 +1086,17 @@ def transcribe_audio_with_timestamps(
             'error': str (if failed)
         }
     """
-    logger.info(f"Starting transcription with timestamps for: {audio_path}")
+    is_file = isinstance(audio_path, (str, os.PathLike))
+    source = audio_path if is_file else 'in-memory audio'
+    logger.info(f"Starting transcription with timestamps for: {source}")
     
     try:
-        # Validate audio file
-        validate_audio_file(audio_path)
+        if is_file:
+            # Validate audio file
+            validate_audio_file(audio_path)
+        elif audio_path.dtype != 'float32':
+            # float16 waveforms (AUDIO_DTYPE) are widened only for inference
+            audio_path = audio_path.astype('float32')
         
         # Load model
         model = load_whisper_model(model_size=model_size)
@@ -539,27 +1109,27 @@ def transcribe_audio_with_timestamps(
             audio_path,
             language=lang,
             task='transcribe',
-            beam_size=5,
             word_timestamps=True,
-            vad_filter=True
+            **_decode_options(timestamps=True)
         )
         
-        # Collect segments
-        all_segments = list(segments_gen)
-        
-        # Extract full text
-        text = ' '.join([seg.text for seg in all_segments]).strip()
-        detected_language = info.language if hasattr(info, 'language') else 'unknown'
-        
-        # Format segments with timestamps
+        # Format segments with timestamps as they are decoded; with
+        # word_timestamps each Segment carries a list of Word objects, so
+        # they are not kept around once read
+        texts = []
         formatted_segments = []
-        for seg in all_segments:
+        for seg in segments_gen:
+            texts.append(seg.text)
             formatted_segments.append({
                 'start': seg.start,
                 'end': seg.end,
                 'text': seg.text.strip()
             })
         
+        # Extract full text
+        text = ' '.join(texts).strip()
+        detected_language = info.language if hasattr(info, 'language') else 'unknown'
+        
         logger.info(
             f"Transcription with timestamps successful: "
             f"{len(formatted_segments)} segments"
@@ -3,17 +3,46 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.contrib import messages
+from django.utils.cache import patch_vary_headers
+from django.db.models.functions import Left
 from .models import BlogPost
+import atexit
+import hashlib
 import json
+import threading
 import yt_dlp
 from django.conf import settings
 import re
+import itertools
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 import time
 
+try:
+    import ijson
+except ImportError:  # Optional, JSON3 captions are parsed with json.loads instead
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional, request bodies are parsed with the json module instead
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Optional, enhance_content responses are sent uncompressed
+    brotli = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional, downloads fall back to stripping tags with a regex
+    LexborHTMLParser = None
+
 # Import custom exceptions
 from .transcription.exceptions import (
     TranscriptionError,
@@ -28,7 +57,6 @@ from .transcription.exceptions import (
     TranscriptionTimeoutError,
     AudioFormatError,
     OutOfMemoryError,
-    TranscriptCleaningError,
     get_user_friendly_error,
     is_user_error
 )
@@ -36,6 +64,47 @@ from .transcription.exceptions import (
 # Configure logging for transcription operations
 logger = logging.getLogger('transcription')
 
+# Parser for JSON request bodies. orjson's errors subclass json.JSONDecodeError,
+# so the existing handlers cover both.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Precompiled patterns for subtitle parsing and blog generation
+# A single class under +, so stripping URLs from user-supplied descriptions
+# stays linear instead of backtracking through per-character alternatives
+_RE_URL = re.compile(r'https?://\S+')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_VTT_TIMING = re.compile(r'\d+:\d+:\d+[.,]\d+ --> \d+:\d+:\d+[.,]\d+')
+_RE_WEBVTT_HEADER = re.compile(r'WEBVTT.*?\n\n', re.DOTALL)
+_RE_TIMESTAMP_PREFIX = re.compile(r'\d+:\d+:\d+')
+_RE_JSON_PUNCTUATION = re.compile(r'[{}"\[\]]')
+# Leading '{' after any whitespace, checked without copying the payload
+_RE_JSON_START = re.compile(r'\s*\{')
+_RE_BLOG_FILLERS = re.compile(r'\b(?:um|uh|like|you know|so|well)\b', re.IGNORECASE)
+# A sentence and its ending punctuation, or trailing text without any
+_RE_SENTENCE = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+_RE_TAG_WORD = re.compile(r'[a-z][a-z\-]+')
+# Characters dropped from download file names, and runs turned into one dash
+_RE_FILENAME_UNSAFE = re.compile(r'[^\w\s-]')
+_RE_FILENAME_SEPARATORS = re.compile(r'[-\s]+')
+
+# generate_blog request fields passed on to generate_blog_from_transcript(),
+# with their defaults
+AI_OPTION_DEFAULTS = (
+    ('writing_style', 'default'),
+    ('article_length', 'medium'),
+    ('custom_instructions', ''),
+    ('add_seo', False),
+    ('add_summary', False),
+    ('add_tags', False),
+)
+
+# Tags offered by the add_tags option, in display order
+COMMON_TAGS = ('tutorial', 'guide', 'tips', 'how-to', 'beginner', 'advanced', 'coding', 'development')
+
+# Characters of each article's HTML fetched for the all-blogs preview; far more
+# than the 30 words it shows, even counting the markup between them
+ALL_BLOGS_PREVIEW_CHARS = 2000
+
 def index(request):
     return render(request, "index.html")
 
@@ -79,26 +148,158 @@ def user_logout(request):
 
 @login_required
 def all_blogs(request):
-    blog_articles = BlogPost.objects.filter(user=request.user)
+    # The list only shows a 30-word preview of each article, so fetch a
+    # prefix of the body instead of every full generated article
+    blog_articles = BlogPost.objects.filter(user=request.user).only(
+        'id', 'youtube_title', 'created_at'
+    ).annotate(content_preview=Left('generated_content', ALL_BLOGS_PREVIEW_CHARS))
     return render(request, "all-blogs.html", {'blog_articles': blog_articles})
 
 @login_required
 def blog_details(request, pk):
-    blog_article_detail = BlogPost.objects.get(id=pk)
-    if request.user == blog_article_detail.user:
-        return render(request, 'blog-details.html', {'blog_article_detail': blog_article_detail})
-    else:
-        return redirect('/')
+    # Filter on the owner in the query: comparing blog.user afterwards cost a
+    # second SELECT on auth_user, and missing posts raised DoesNotExist (500)
+    blog_article_detail = get_object_or_404(
+        BlogPost.objects.defer('download_text'), id=pk, user=request.user
+    )
+    return render(request, 'blog-details.html', {'blog_article_detail': blog_article_detail})
+
+# yt-dlp options for video lookups; they cover both the title and the caption
+# tracks, so one extract_info() serves yt_title() and extract_subtitles()
+_VIDEO_INFO_YDL_OPTS = {
+    'writesubtitles': True,
+    'writeautomaticsub': True,
+    'subtitleslangs': ['en'],
+    'skip_download': True,
+    'quiet': True
+}
+
+# Idle YoutubeDL instances for video lookups and caption downloads. Each keeps
+# its keep-alive connections to YouTube, so reusing instances across calls
+# skips fresh TLS handshakes. An instance serves one thread at a time.
+_idle_video_ydls = deque()
+
+@contextmanager
+def _video_ydl():
+    """Borrow an idle YoutubeDL for video lookups, creating one if none is free."""
+    try:
+        ydl = _idle_video_ydls.pop()
+    except IndexError:
+        ydl = yt_dlp.YoutubeDL(_VIDEO_INFO_YDL_OPTS)
+    try:
+        yield ydl
+    finally:
+        _idle_video_ydls.append(ydl)
+
+@atexit.register
+def _close_idle_video_ydls():
+    """Close pooled video lookup YoutubeDL instances."""
+    while _idle_video_ydls:
+        try:
+            _idle_video_ydls.pop().close()
+        except IndexError:
+            break
+        except Exception as e:
+            logger.debug("Failed to close pooled YoutubeDL: %s", e)
+
+# Recent video lookups: url -> (expires_at, info), in LRU order. generate_blog
+# asks for the title and then the transcript of the same URL, and each
+# extract_info() is several round-trips to YouTube.
+_VIDEO_INFO_CACHE_TTL = 300
+_VIDEO_INFO_CACHE_SIZE = 128
+_video_info_cache = OrderedDict()
+_video_info_cache_lock = threading.Lock()
+
+def _cached_video_info(url):
+    """Return the cached _get_video_info() result for a URL, or None."""
+    with _video_info_cache_lock:
+        entry = _video_info_cache.get(url)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        _video_info_cache.move_to_end(url)
+        return entry[1]
+
+def _get_video_info(ydl, url):
+    """
+    Return the parts of extract_info() the views use, cached per URL.
+    
+    Only the id, title, description, duration, language and English caption
+    tracks are kept, so cached entries stay small. Failed lookups raise and
+    are not cached.
+    """
+    info = _cached_video_info(url)
+    if info is not None:
+        return info
+    
+    info_dict = ydl.extract_info(url, download=False)
+    subtitles = info_dict.get('subtitles') or {}
+    auto_subtitles = info_dict.get('automatic_captions') or {}
+    info = {
+        'id': info_dict.get('id'),
+        'title': info_dict.get('title'),
+        'description': info_dict.get('description'),
+        'duration': info_dict.get('duration'),
+        'language': info_dict.get('language'),
+        'subtitles': {'en': subtitles['en']} if subtitles.get('en') else {},
+        'automatic_captions': {'en': auto_subtitles['en']} if auto_subtitles.get('en') else {},
+    }
+    
+    with _video_info_cache_lock:
+        _video_info_cache[url] = (time.monotonic() + _VIDEO_INFO_CACHE_TTL, info)
+        _video_info_cache.move_to_end(url)
+        while len(_video_info_cache) > _VIDEO_INFO_CACHE_SIZE:
+            _video_info_cache.popitem(last=False)
+    return info
+
+def _audio_info_from_lookup(url):
+    """
+    Build get_audio_info()-style metadata from the cached video lookup, or None.
+    
+    Handing this to extract_audio() lets it check the duration limits and
+    disk space before downloading, without probing YouTube a third time.
+    """
+    info = _cached_video_info(url)
+    if info is None or not info['duration']:
+        return None
+    return {
+        'success': True,
+        'duration': info['duration'],
+        'title': info['title'] or 'Unknown',
+        'video_id': info['id'] or 'unknown',
+        'language': info['language'] or 'unknown'
+    }
 
 def yt_title(url):
-    ydl_opts = {'quiet': True}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with _video_ydl() as ydl:
         try:
-            info_dict = ydl.extract_info(url, download=False)
+            info_dict = _get_video_info(ydl, url)
             return info_dict.get('title', None)
         except:
             return None
 
+# Caption formats parse_subtitles() handles, best first: JSON3 is parsed
+# structurally, WebVTT by stripping cue timings and tags
+_SUBTITLE_FORMAT_PREFERENCE = ('json3', 'vtt')
+
+def _preferred_subtitle_track(tracks):
+    """Pick the caption track in the most parseable format, or None."""
+    for ext in _SUBTITLE_FORMAT_PREFERENCE:
+        for track in tracks:
+            if track.get('ext') == ext:
+                return track
+    return None
+
+def _fetch_subtitles(ydl, subtitle_url):
+    """
+    Download a subtitle track through the YoutubeDL instance that found it.
+    
+    yt-dlp's request handlers keep connections alive per instance (pooled
+    when requests is installed), so the caption fetches reuse the TLS
+    session of the metadata request and send the same headers and cookies.
+    """
+    with ydl.urlopen(subtitle_url) as response:
+        return response.read().decode('utf-8')
+
 def extract_subtitles(url):
     """
     Extract existing subtitles from YouTube video.
@@ -118,25 +319,18 @@ def extract_subtitles(url):
             'error': str (if failed)
         }
     """
-    logger.info(f"Attempting to extract subtitles from: {url}")
-    start_time = time.time()
-    
-    ydl_opts = {
-        'writesubtitles': True,
-        'writeautomaticsub': True,
-        'subtitleslangs': ['en'],
-        'skip_download': True,
-        'quiet': True
-    }
+    logger.info("Attempting to extract subtitles from: %s", url)
+    start_time = time.perf_counter()
     
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with _video_ydl() as ydl:
         try:
-            info_dict = ydl.extract_info(url, download=False)
-            video_id = info_dict.get('id', 'unknown')
-            video_title = info_dict.get('title', 'Unknown')
+            # Usually already fetched by yt_title() for the same request
+            info_dict = _get_video_info(ydl, url)
+            video_id = info_dict.get('id') or 'unknown'
+            video_title = info_dict.get('title') or 'Unknown'
             
             # Get video description as fallback
-            description = info_dict.get('description', '')
+            description = info_dict.get('description') or ''
             
             # Try to get subtitles
             subtitles = info_dict.get('subtitles', {})
@@ -146,39 +340,32 @@ def extract_subtitles(url):
             
             # Try automatic captions first (usually more complete)
             if 'en' in auto_subtitles and auto_subtitles['en']:
-                logger.debug(f"Found automatic captions for video {video_id}")
-                for subtitle_info in auto_subtitles['en']:
-                    if subtitle_info.get('ext') == 'json3':
-                        try:
-                            subtitle_url = subtitle_info['url']
-                            import urllib.request
-                            response = urllib.request.urlopen(subtitle_url)
-                            subtitle_content = response.read().decode('utf-8')
-                            subtitle_text = parse_subtitles(subtitle_content)
-                            if subtitle_text and len(subtitle_text.strip()) > 100:
-                                break
-                        except Exception as e:
-                            logger.warning(f"Failed to parse automatic caption: {str(e)}")
-                            continue
+                logger.debug("Found automatic captions for video %s", video_id)
+                # Every format carries the same captions, so fetch only one
+                subtitle_info = _preferred_subtitle_track(auto_subtitles['en'])
+                if subtitle_info is not None:
+                    try:
+                        subtitle_content = _fetch_subtitles(ydl, subtitle_info['url'])
+                        subtitle_text = parse_subtitles(subtitle_content)
+                    except Exception as e:
+                        logger.warning("Failed to parse automatic caption: %s", e)
             
             # Try manual subtitles if auto captions didn't work
             if not subtitle_text and 'en' in subtitles and subtitles['en']:
-                logger.debug(f"Found manual subtitles for video {video_id}")
+                logger.debug("Found manual subtitles for video %s", video_id)
                 try:
-                    subtitle_url = subtitles['en'][0]['url']
-                    import urllib.request
-                    response = urllib.request.urlopen(subtitle_url)
-                    subtitle_content = response.read().decode('utf-8')
+                    subtitle_content = _fetch_subtitles(ydl, subtitles['en'][0]['url'])
                     subtitle_text = parse_subtitles(subtitle_content)
                 except Exception as e:
-                    logger.warning(f"Failed to parse manual subtitles: {str(e)}")
+                    logger.warning("Failed to parse manual subtitles: %s", e)
             
             # Return subtitles if available
             if subtitle_text and len(subtitle_text.strip()) > 100:
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.perf_counter() - start_time
                 logger.info(
-                    f"Subtitles extracted successfully for '{video_title}' "
-                    f"(video_id: {video_id}, {len(subtitle_text)} chars, {elapsed_time:.2f}s)"
+                    "Subtitles extracted successfully for '%s' "
+                    "(video_id: %s, %d chars, %.2fs)",
+                    video_title, video_id, len(subtitle_text), elapsed_time
                 )
                 return {
                     'success': True,
@@ -190,11 +377,10 @@ def extract_subtitles(url):
             
             # Try description as fallback
             elif description and len(description.strip()) > 50:
-                logger.info(f"No subtitles found for video {video_id}, using description")
+                logger.info("No subtitles found for video %s, using description", video_id)
                 # Clean up description
-                description = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', description)
-                description = re.sub(r'\n+', ' ', description)
-                description = re.sub(r'\s+', ' ', description).strip()
+                description = _RE_URL.sub('', description)
+                description = ' '.join(description.split())
                 description_text = description[:1000] + "..." if len(description) > 1000 else description
                 
                 return {
@@ -205,7 +391,7 @@ def extract_subtitles(url):
                     'video_title': video_title
                 }
             else:
-                logger.warning(f"No subtitles or description found for video {video_id}")
+                logger.warning("No subtitles or description found for video %s", video_id)
                 return {
                     'success': False,
                     'text': '',
@@ -216,7 +402,7 @@ def extract_subtitles(url):
                 }
                 
         except Exception as e:
-            logger.error(f"Error extracting subtitles: {str(e)}")
+            logger.error("Error extracting subtitles: %s", e)
             return {
                 'success': False,
                 'text': '',
@@ -225,6 +411,23 @@ def extract_subtitles(url):
             }
 
 
+# Speculative audio downloads started next to the subtitle probe when
+# SPECULATIVE_ASR_PREFETCH is on; threads are only created once used
+_asr_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='asr-prefetch')
+
+def _discard_prefetched_audio(audio_future):
+    """Cancel a speculative audio download, or delete its file once it finishes."""
+    if audio_future.cancel():
+        return
+    
+    def cleanup(future):
+        if future.exception() is not None or not getattr(settings, 'AUTO_CLEANUP_AUDIO', True):
+            return
+        from .transcription.audio_extractor import cleanup_audio_file
+        cleanup_audio_file(future.result()['audio_path'])
+    
+    audio_future.add_done_callback(cleanup)
+
 def yt_transcript(url):
     """
     Extract transcript from YouTube video with ASR fallback.
@@ -247,24 +450,33 @@ def yt_transcript(url):
             'error': str (if failed)
         }
     """
-    logger.info(f"Starting transcript extraction for URL: {url}")
-    overall_start_time = time.time()
+    logger.info("Starting transcript extraction for URL: %s", url)
+    overall_start_time = time.perf_counter()
+    
+    # Optionally start the audio download for the ASR fallback right away, so
+    # a video without captions doesn't wait for the subtitle probe first
+    audio_future = None
+    if getattr(settings, 'ENABLE_ASR', True) and getattr(settings, 'SPECULATIVE_ASR_PREFETCH', False):
+        from .transcription.audio_extractor import extract_audio
+        audio_future = _asr_prefetch_executor.submit(extract_audio, url)
     
     # Step 1: Try existing subtitle extraction
     subtitle_result = extract_subtitles(url)
     
     if subtitle_result['success'] and subtitle_result.get('method') == 'subtitles' and len(subtitle_result['text'].strip()) > 100:
-        overall_time = time.time() - overall_start_time
+        if audio_future is not None:
+            _discard_prefetched_audio(audio_future)
+        overall_time = time.perf_counter() - overall_start_time
         logger.info(
-            f"Transcript extraction completed via subtitles "
-            f"(total time: {overall_time:.2f}s)"
+            "Transcript extraction completed via subtitles (total time: %.2fs)",
+            overall_time
         )
         return subtitle_result
     
     # Step 2: Fallback to ASR if enabled
     if getattr(settings, 'ENABLE_ASR', True):
         logger.warning(
-            f"No subtitles found for video, falling back to ASR transcription"
+            "No subtitles found for video, falling back to ASR transcription"
         )
         logger.info("STATUS: Downloading audio for transcription...")
         
@@ -272,36 +484,46 @@ def yt_transcript(url):
         
         try:
             from .transcription.audio_extractor import extract_audio, cleanup_audio_file
-            from .transcription.whisper_service import transcribe_audio
-            from .transcription.transcript_cleaner import clean_transcript
+            from .transcription.whisper_service import transcribe_audio, transcribe_long_audio
+            from .transcription.config import LONG_AUDIO_THRESHOLD, WHISPER_NUM_WORKERS
             
             # Extract audio
             logger.info("Starting audio extraction for ASR")
             logger.info("STATUS: Downloading audio from video...")
-            audio_start_time = time.time()
+            audio_start_time = time.perf_counter()
             
-            # extract_audio now raises exceptions directly
-            audio_result = extract_audio(url)
-            audio_time = time.time() - audio_start_time
+            # extract_audio now raises exceptions directly, and so does result()
+            if audio_future is not None:
+                audio_result = audio_future.result()
+            else:
+                # Reuse the metadata the subtitle probe already fetched
+                audio_result = extract_audio(url, info=_audio_info_from_lookup(url))
+            audio_time = time.perf_counter() - audio_start_time
             audio_path = audio_result['audio_path']
             
             logger.info(
-                f"Audio extracted successfully "
-                f"({audio_result.get('file_size_mb', 0):.2f}MB, {audio_time:.2f}s)"
+                "Audio extracted successfully (%.2fMB, %.2fs)",
+                audio_result.get('file_size_mb', 0), audio_time
             )
             
             # Transcribe audio
             logger.info("Starting audio transcription with Whisper")
             logger.info("STATUS: Transcribing audio (this may take a few minutes)...")
-            transcription_start_time = time.time()
+            transcription_start_time = time.perf_counter()
             
-            # transcribe_audio returns dict with success/error, check and raise if needed
-            transcription = transcribe_audio(audio_path)
-            transcription_time = time.time() - transcription_start_time
+            # Both return dict with success/error, check and raise if needed.
+            # Long recordings are split and the pieces transcribed concurrently,
+            # if enabled and the model can actually decode pieces in parallel.
+            if (LONG_AUDIO_THRESHOLD and WHISPER_NUM_WORKERS > 1
+                    and (audio_result.get('duration') or 0) > LONG_AUDIO_THRESHOLD):
+                transcription = transcribe_long_audio(audio_path, clean=True)
+            else:
+                transcription = transcribe_audio(audio_path, clean=True)
+            transcription_time = time.perf_counter() - transcription_start_time
             
             if not transcription['success']:
                 error_msg = transcription.get('error', 'Unknown transcription error')
-                logger.error(f"ASR transcription failed: {error_msg}")
+                logger.error("ASR transcription failed: %s", error_msg)
                 # Determine which exception to raise based on error message
                 if 'timeout' in error_msg.lower():
                     raise TranscriptionTimeoutError(error_msg)
@@ -314,21 +536,19 @@ def yt_transcript(url):
                 else:
                     raise TranscriptionError(error_msg)
             
-            # Clean the transcript
-            try:
-                cleaned_text = clean_transcript(transcription['text'])
-            except TranscriptCleaningError as e:
-                logger.warning(f"Transcript cleaning failed: {str(e)}, using original text")
-                cleaned_text = transcription['text']
+            # Segments were cleaned as they were transcribed
+            cleaned_text = transcription['text']
             
-            overall_time = time.time() - overall_start_time
+            overall_time = time.perf_counter() - overall_start_time
             logger.info(
-                f"ASR transcription successful: "
-                f"language={transcription.get('language', 'unknown')}, "
-                f"confidence={transcription.get('confidence', 0):.2f}, "
-                f"transcription_time={transcription_time:.2f}s, "
-                f"total_time={overall_time:.2f}s, "
-                f"chars={len(cleaned_text)}"
+                "ASR transcription successful: "
+                "language=%s, confidence=%.2f, transcription_time=%.2fs, "
+                "total_time=%.2fs, chars=%d",
+                transcription.get('language', 'unknown'),
+                transcription.get('confidence', 0),
+                transcription_time,
+                overall_time,
+                len(cleaned_text)
             )
             
             return {
@@ -352,26 +572,26 @@ def yt_transcript(url):
                 WhisperError, TranscriptionError) as e:
             # Re-raise custom exceptions to be handled by generate_blog
             if isinstance(e, TranscriptionTimeoutError):
-                logger.error(f"ASR timed out after {getattr(settings, 'ASR_TIMEOUT', 'unknown')}s: {str(e)}")
+                logger.error("ASR timed out after %ss: %s", getattr(settings, 'ASR_TIMEOUT', 'unknown'), e)
             elif isinstance(e, DurationLimitError):
-                logger.error(f"Video duration exceeded limit: {str(e)}")
+                logger.error("Video duration exceeded limit: %s", e)
             else:
-                logger.error(f"ASR failed with known error: {str(e)}")
+                logger.error("ASR failed with known error: %s", e)
             
             # Fallback to description if available
             if subtitle_result['success'] and subtitle_result.get('method') == 'description':
-                logger.warning(f"Falling back to video description due to ASR error")
+                logger.warning("Falling back to video description due to ASR error")
                 return subtitle_result
                 
             raise
             
         except ImportError as e:
             error_msg = "ASR module not available. Please install required dependencies."
-            logger.error(f"{error_msg}: {str(e)}")
+            logger.error("%s: %s", error_msg, e)
             
             # Fallback to description if available
             if subtitle_result['success'] and subtitle_result.get('method') == 'description':
-                logger.warning(f"Falling back to video description due to missing ASR module")
+                logger.warning("Falling back to video description due to missing ASR module")
                 return subtitle_result
                 
             raise TranscriptionError(error_msg)
@@ -382,7 +602,7 @@ def yt_transcript(url):
             
             # Fallback to description if available
             if subtitle_result['success'] and subtitle_result.get('method') == 'description':
-                logger.warning(f"Falling back to video description due to unexpected ASR error")
+                logger.warning("Falling back to video description due to unexpected ASR error")
                 return subtitle_result
                 
             raise TranscriptionError(error_msg)
@@ -393,21 +613,21 @@ def yt_transcript(url):
                 try:
                     cleanup_result = cleanup_audio_file(audio_path)
                     if cleanup_result['success']:
-                        logger.info(f"Audio file cleaned up: {audio_path}")
+                        logger.info("Audio file cleaned up: %s", audio_path)
                     else:
                         logger.warning(
-                            f"Failed to cleanup audio file: "
-                            f"{cleanup_result.get('error', 'Unknown error')}"
+                            "Failed to cleanup audio file: %s",
+                            cleanup_result.get('error', 'Unknown error')
                         )
                 except Exception as cleanup_error:
-                    logger.warning(f"Cleanup error: {str(cleanup_error)}")
+                    logger.warning("Cleanup error: %s", cleanup_error)
     
     # No ASR available or disabled
     logger.error("No transcript available and ASR is disabled")
     
     # Fallback to description if available
     if subtitle_result['success'] and subtitle_result.get('method') == 'description':
-        logger.warning(f"Using video description as ASR is disabled")
+        logger.warning("Using video description as ASR is disabled")
         return subtitle_result
 
     return {
@@ -417,46 +637,56 @@ def yt_transcript(url):
         'error': 'No subtitles available and ASR is disabled'
     }
 
+def _json3_text_parts(subtitle_content):
+    """
+    Return the caption text segments of a JSON3 subtitle payload.
+    
+    With ijson installed the utf8 leaves are streamed out of the payload
+    instead of building the whole events tree, which for long videos is many
+    times the size of the text. Raises ValueError if the payload isn't JSON.
+    """
+    if ijson is not None:
+        try:
+            return list(ijson.items(subtitle_content.encode('utf-8'), 'events.item.segs.item.utf8'))
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+    
+    data = json.loads(subtitle_content)
+    return [
+        seg['utf8']
+        for event in data.get('events', [])
+        for seg in event.get('segs', [])
+        if 'utf8' in seg
+    ]
+
 def parse_subtitles(subtitle_content):
     """Parse subtitle content and return clean text"""
-    import re
-    import json
-    
     try:
         # Check if it's JSON format (YouTube's automatic captions)
-        if subtitle_content.strip().startswith('{') or '"events"' in subtitle_content:
+        if _RE_JSON_START.match(subtitle_content) or '"events"' in subtitle_content:
             try:
                 # Parse JSON subtitle format
-                data = json.loads(subtitle_content)
-                events = data.get('events', [])
-                
-                text_parts = []
-                for event in events:
-                    segs = event.get('segs', [])
-                    for seg in segs:
-                        if 'utf8' in seg:
-                            text_parts.append(seg['utf8'])
+                text_parts = _json3_text_parts(subtitle_content)
                 
                 text = ' '.join(text_parts)
                 # Clean up the text
-                text = re.sub(r'\s+', ' ', text)
                 text = text.replace('\\n', ' ')
-                return text.strip()
+                return ' '.join(text.split())
                 
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         
         # Handle VTT/SRT format
         text = subtitle_content
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _RE_HTML_TAG.sub('', text)
         
         # Remove timestamp lines (VTT format)
-        text = re.sub(r'\d+:\d+:\d+[.,]\d+ --> \d+:\d+:\d+[.,]\d+', '', text)
+        text = _RE_VTT_TIMING.sub('', text)
         
         # Remove WEBVTT header
-        text = re.sub(r'WEBVTT.*?\n\n', '', text, flags=re.DOTALL)
+        text = _RE_WEBVTT_HEADER.sub('', text)
         
         # Remove standalone numbers (subtitle sequence numbers)
         lines = text.split('\n')
@@ -464,185 +694,231 @@ def parse_subtitles(subtitle_content):
         
         for line in lines:
             line = line.strip()
-            if line and not line.isdigit() and not re.match(r'^\d+$', line):
+            if line and not line.isdigit():
                 # Skip timestamp-only lines
-                if not re.match(r'^\d+:\d+:\d+', line):
+                if not _RE_TIMESTAMP_PREFIX.match(line):
                     cleaned_lines.append(line)
         
         # Join lines and clean up spacing
         text = ' '.join(cleaned_lines)
-        text = re.sub(r'\s+', ' ', text)
         
-        return text.strip()
+        return ' '.join(text.split())
         
     except Exception as e:
         # Fallback: just clean basic formatting
-        text = re.sub(r'[{}"\[\]]', '', subtitle_content)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        text = _RE_JSON_PUNCTUATION.sub('', subtitle_content)
+        return ' '.join(text.split())
+
+# Generated article HTML keyed by (transcript digest, options), in LRU order,
+# so regenerating a video with the same options skips the text pipeline
+_blog_content_cache = OrderedDict()
+_blog_content_cache_lock = threading.Lock()
 
 def generate_blog_from_transcript(transcript, options=None):
-    """Generate blog content from video transcript with AI enhancements"""
+    """
+    Generate blog content from video transcript with AI enhancements.
+    
+    The output depends only on the transcript and the options, so up to
+    BLOG_CONTENT_CACHE_SIZE results are kept, keyed by a BLAKE2 digest of the
+    transcript rather than the text itself. A size of 0 disables the cache.
+    """
     if not transcript or len(transcript.strip()) < 50:
         return "<p>Unable to generate blog content. The video may not have sufficient transcript data or may be unavailable.</p>"
     
     if options is None:
         options = {}
     
-    # Clean and format the transcript
-    import re
+    cache_size = getattr(settings, 'BLOG_CONTENT_CACHE_SIZE', 256)
+    key = None
+    if cache_size > 0:
+        try:
+            key = (
+                hashlib.blake2b(transcript.encode('utf-8'), digest_size=16).digest(),
+                frozenset(options.items()),
+            )
+        except TypeError:  # Unhashable option values from the request body
+            key = None
     
-    # Remove extra whitespace and clean up
-    text = re.sub(r'\s+', ' ', transcript).strip()
+    if key is not None:
+        with _blog_content_cache_lock:
+            content = _blog_content_cache.get(key)
+            if content is not None:
+                _blog_content_cache.move_to_end(key)
+                return content
     
-    # Remove common filler words and clean up
-    text = re.sub(r'\b(um|uh|like|you know|so|well)\b', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'\s+', ' ', text)
+    content = _render_blog_content(transcript, options)
     
-    # Split into sentences more intelligently
-    sentences = []
-    # Split on sentence endings but keep the punctuation
-    parts = re.split(r'([.!?]+)', text)
+    if key is not None:
+        with _blog_content_cache_lock:
+            _blog_content_cache[key] = content
+            _blog_content_cache.move_to_end(key)
+            while len(_blog_content_cache) > cache_size:
+                _blog_content_cache.popitem(last=False)
+    return content
+
+def _render_blog_content(transcript, options):
+    """Build the article HTML; see generate_blog_from_transcript()."""
+    # Apply AI enhancements based on options
+    writing_style = options.get('writing_style', 'default')
+    article_length = options.get('article_length', 'medium')
+    custom_instructions = options.get('custom_instructions', '')
     
-    current_sentence = ""
-    for i, part in enumerate(parts):
-        if re.match(r'[.!?]+', part):
-            current_sentence += part
-            if current_sentence.strip():
-                sentences.append(current_sentence.strip())
-            current_sentence = ""
-        else:
-            current_sentence += part
+    # Short articles keep only the first 3 paragraphs
+    max_paragraphs = 3 if article_length == 'short' else None
     
-    # Add any remaining text
-    if current_sentence.strip():
-        sentences.append(current_sentence.strip())
+    # Clean and format the transcript
+    # Remove extra whitespace and clean up
+    text = ' '.join(transcript.split())
     
-    # Filter and clean sentences
-    clean_sentences = []
-    for sentence in sentences:
-        sentence = sentence.strip()
-        # Only include sentences with substantial content
-        if len(sentence) > 15 and not sentence.lower().startswith(('http', 'www')):
-            # Capitalize first letter
-            sentence = sentence[0].upper() + sentence[1:] if sentence else sentence
-            clean_sentences.append(sentence)
+    # Remove common filler words and clean up. This is done on the whole text
+    # rather than per sentence: removing one between two punctuation marks
+    # ("really?um.") joins them into a single sentence ending.
+    text = ' '.join(_RE_BLOG_FILLERS.sub('', text).split())
     
-    if not clean_sentences:
-        return "<p>Unable to extract meaningful content from the video transcript.</p>"
+    # Walk the sentences lazily, keeping their punctuation, and keep only those
+    # with substantial content, capitalized. A short article stops splitting
+    # the transcript once it has its paragraphs.
+    sentences = (match.group().strip() for match in _RE_SENTENCE.finditer(text))
+    clean_sentences = (
+        sentence[:1].upper() + sentence[1:]
+        for sentence in sentences
+        if len(sentence) > 15 and not sentence.lower().startswith(('http', 'www'))
+    )
     
-    # Group sentences into paragraphs
+    # Group sentences into paragraphs of three
     paragraphs = []
-    current_paragraph = []
+    while max_paragraphs is None or len(paragraphs) < max_paragraphs:
+        paragraph_sentences = list(itertools.islice(clean_sentences, 3))
+        if not paragraph_sentences:
+            break
+        paragraphs.append(' '.join(paragraph_sentences))
     
-    for sentence in clean_sentences:
-        current_paragraph.append(sentence)
-        
-        # Create paragraph every 3-4 sentences or when we hit a natural break
-        if len(current_paragraph) >= 3:
-            paragraph_text = ' '.join(current_paragraph)
-            paragraphs.append(paragraph_text)
-            current_paragraph = []
-    
-    # Add remaining sentences as final paragraph
-    if current_paragraph:
-        paragraph_text = ' '.join(current_paragraph)
-        paragraphs.append(paragraph_text)
-    
-    # Apply AI enhancements based on options
-    writing_style = options.get('writing_style', 'default')
-    article_length = options.get('article_length', 'medium')
-    custom_instructions = options.get('custom_instructions', '')
+    if not paragraphs:
+        return "<p>Unable to extract meaningful content from the video transcript.</p>"
     
-    # Format as HTML with style-specific enhancements
-    formatted_content = ""
+    # Format as HTML with style-specific enhancements; pieces are collected
+    # and joined once at the end rather than concatenated as we go
+    parts = []
     
     if paragraphs:
         # Add introduction based on style
-        formatted_content += "<div class='mb-6'>\n"
+        parts.append("<div class='mb-6'>\n")
         
         if writing_style == 'tutorial':
-            formatted_content += "<h3 class='text-lg font-semibold mb-3'>📚 Tutorial Guide</h3>\n"
-            formatted_content += "<p class='text-gray-600 italic mb-4'>This step-by-step tutorial is generated from a YouTube video and organized for easy learning.</p>\n"
+            parts.append("<h3 class='text-lg font-semibold mb-3'>📚 Tutorial Guide</h3>\n")
+            parts.append("<p class='text-gray-600 italic mb-4'>This step-by-step tutorial is generated from a YouTube video and organized for easy learning.</p>\n")
         elif writing_style == 'professional':
-            formatted_content += "<h3 class='text-lg font-semibold mb-3'>Executive Summary</h3>\n"
-            formatted_content += "<p class='text-gray-600 italic mb-4'>Professional analysis and insights derived from video content.</p>\n"
+            parts.append("<h3 class='text-lg font-semibold mb-3'>Executive Summary</h3>\n")
+            parts.append("<p class='text-gray-600 italic mb-4'>Professional analysis and insights derived from video content.</p>\n")
         elif writing_style == 'academic':
-            formatted_content += "<h3 class='text-lg font-semibold mb-3'>Academic Analysis</h3>\n"
-            formatted_content += "<p class='text-gray-600 italic mb-4'>Scholarly examination of the presented material with structured analysis.</p>\n"
+            parts.append("<h3 class='text-lg font-semibold mb-3'>Academic Analysis</h3>\n")
+            parts.append("<p class='text-gray-600 italic mb-4'>Scholarly examination of the presented material with structured analysis.</p>\n")
         else:
-            formatted_content += "<h3 class='text-lg font-semibold mb-3'>Article Content</h3>\n"
-            formatted_content += "<p class='text-gray-600 italic mb-4'>This article is generated from a YouTube video transcript and has been organized for better readability.</p>\n"
+            parts.append("<h3 class='text-lg font-semibold mb-3'>Article Content</h3>\n")
+            parts.append("<p class='text-gray-600 italic mb-4'>This article is generated from a YouTube video transcript and has been organized for better readability.</p>\n")
         
-        formatted_content += "</div>\n\n"
+        parts.append("</div>\n\n")
         
         # Add summary if requested
         if options.get('add_summary'):
             summary_text = ' '.join(paragraphs[:2])[:200] + "..."
-            formatted_content += "<div class='bg-blue-50 p-4 rounded-lg mb-6'>\n"
-            formatted_content += "<h4 class='font-semibold mb-2'>📋 Quick Summary</h4>\n"
-            formatted_content += f"<p class='text-sm text-gray-700'>{summary_text}</p>\n"
-            formatted_content += "</div>\n\n"
+            parts.append("<div class='bg-blue-50 p-4 rounded-lg mb-6'>\n")
+            parts.append("<h4 class='font-semibold mb-2'>📋 Quick Summary</h4>\n")
+            parts.append(f"<p class='text-sm text-gray-700'>{summary_text}</p>\n")
+            parts.append("</div>\n\n")
         
-        # Adjust content based on length preference
-        if article_length == 'short':
-            paragraphs = paragraphs[:3]  # Keep only first 3 paragraphs
-        elif article_length == 'comprehensive':
+        # Adjust content based on length preference (short articles were
+        # already cut to max_paragraphs above)
+        if article_length == 'comprehensive':
             # Add more detailed sections
-            formatted_content += "<h4 class='text-lg font-medium mb-3'>🔍 Detailed Analysis</h4>\n"
+            parts.append("<h4 class='text-lg font-medium mb-3'>🔍 Detailed Analysis</h4>\n")
         
         # Add main content with style-specific formatting
         for i, paragraph in enumerate(paragraphs):
             if len(paragraph.strip()) > 30:
                 if writing_style == 'listicle':
-                    formatted_content += f"<div class='mb-4 p-3 bg-gray-50 rounded'>\n"
-                    formatted_content += f"<h5 class='font-medium mb-2'>{i+1}. Key Point</h5>\n"
-                    formatted_content += f"<p class='leading-relaxed'>{paragraph}</p>\n"
-                    formatted_content += "</div>\n\n"
+                    parts.append(
+                        f"<div class='mb-4 p-3 bg-gray-50 rounded'>\n"
+                        f"<h5 class='font-medium mb-2'>{i+1}. Key Point</h5>\n"
+                        f"<p class='leading-relaxed'>{paragraph}</p>\n"
+                        "</div>\n\n"
+                    )
                 elif writing_style == 'tutorial':
-                    formatted_content += f"<div class='mb-4 p-3 border-l-4 border-blue-500 bg-blue-50'>\n"
-                    formatted_content += f"<h5 class='font-medium mb-2'>Step {i+1}</h5>\n"
-                    formatted_content += f"<p class='leading-relaxed'>{paragraph}</p>\n"
-                    formatted_content += "</div>\n\n"
+                    parts.append(
+                        f"<div class='mb-4 p-3 border-l-4 border-blue-500 bg-blue-50'>\n"
+                        f"<h5 class='font-medium mb-2'>Step {i+1}</h5>\n"
+                        f"<p class='leading-relaxed'>{paragraph}</p>\n"
+                        "</div>\n\n"
+                    )
                 else:
-                    formatted_content += f"<p class='mb-4 leading-relaxed'>{paragraph}</p>\n\n"
+                    parts.append(f"<p class='mb-4 leading-relaxed'>{paragraph}</p>\n\n")
                 
                 # Add subheadings for longer content
                 if len(paragraphs) > 6 and i > 0 and (i + 1) % 3 == 0 and i < len(paragraphs) - 1:
                     section_num = (i // 3) + 1
-                    formatted_content += f"<h4 class='text-md font-medium mt-6 mb-3'>Key Points - Part {section_num}</h4>\n"
+                    parts.append(f"<h4 class='text-md font-medium mt-6 mb-3'>Key Points - Part {section_num}</h4>\n")
         
         # Add tags if requested
         if options.get('add_tags'):
-            # Generate simple tags based on content
-            common_words = ['tutorial', 'guide', 'tips', 'how-to', 'beginner', 'advanced', 'coding', 'development']
-            content_lower = ' '.join(paragraphs).lower()
-            found_tags = [word for word in common_words if word in content_lower]
+            # Generate simple tags based on the words that appear in the content
+            content_words = set(_RE_TAG_WORD.findall(' '.join(paragraphs).lower()))
+            found_tags = [tag for tag in COMMON_TAGS if tag in content_words]
             
             if found_tags:
-                formatted_content += "<div class='mt-6 p-4 bg-gray-50 rounded-lg'>\n"
-                formatted_content += "<h4 class='font-medium mb-2'>🏷️ Tags</h4>\n"
-                formatted_content += "<div class='flex flex-wrap gap-2'>\n"
+                parts.append("<div class='mt-6 p-4 bg-gray-50 rounded-lg'>\n")
+                parts.append("<h4 class='font-medium mb-2'>🏷️ Tags</h4>\n")
+                parts.append("<div class='flex flex-wrap gap-2'>\n")
                 for tag in found_tags[:5]:  # Limit to 5 tags
-                    formatted_content += f"<span class='bg-blue-100 text-blue-800 px-2 py-1 rounded text-sm'>{tag}</span>\n"
-                formatted_content += "</div>\n</div>\n"
+                    parts.append(f"<span class='bg-blue-100 text-blue-800 px-2 py-1 rounded text-sm'>{tag}</span>\n")
+                parts.append("</div>\n</div>\n")
         
         # Add SEO section if requested
         if options.get('add_seo'):
-            formatted_content += "<div class='mt-6 p-4 bg-green-50 rounded-lg'>\n"
-            formatted_content += "<h4 class='font-medium mb-2'>🎯 SEO Keywords</h4>\n"
-            formatted_content += "<p class='text-sm text-gray-700'>Key topics covered: video content, tutorial, guide, tips, learning</p>\n"
-            formatted_content += "</div>\n"
+            parts.append("<div class='mt-6 p-4 bg-green-50 rounded-lg'>\n")
+            parts.append("<h4 class='font-medium mb-2'>🎯 SEO Keywords</h4>\n")
+            parts.append("<p class='text-sm text-gray-700'>Key topics covered: video content, tutorial, guide, tips, learning</p>\n")
+            parts.append("</div>\n")
     else:
-        formatted_content = "<p>Content processed successfully, but no substantial text could be extracted from the video.</p>"
+        parts.append("<p>Content processed successfully, but no substantial text could be extracted from the video.</p>")
     
-    return formatted_content
+    return ''.join(parts)
+
+# generate_blog's response to each transcription failure: (error_type, HTTP
+# status, log label). Looked up along the exception's MRO, so an exception
+# without its own entry gets the one of its nearest listed base class.
+_TRANSCRIPTION_ERROR_RESPONSES = {
+    InvalidURLError: ('invalid_url', 400, 'Invalid URL'),
+    DurationLimitError: ('duration_limit', 400, 'Duration limit exceeded'),
+    NetworkError: ('network_error', 503, 'Network error'),
+    DiskSpaceError: ('disk_space', 507, 'Disk space error'),
+    FileSystemPermissionError: ('permission_error', 500, 'File system permission error'),
+    AudioExtractionError: ('audio_extraction', 400, 'Audio extraction error'),
+    ModelLoadError: ('model_load', 503, 'Model load error'),
+    TranscriptionTimeoutError: ('timeout', 408, 'Transcription timeout'),
+    AudioFormatError: ('audio_format', 400, 'Audio format error'),
+    OutOfMemoryError: ('out_of_memory', 507, 'Out of memory error'),
+    WhisperError: ('whisper_error', 500, 'Whisper error'),
+    TranscriptionError: ('transcription', 500, 'Transcription error'),
+}
+
+def _transcription_error_response(e):
+    """Log a TranscriptionError and build generate_blog's JSON error response."""
+    for cls in type(e).__mro__:
+        if cls in _TRANSCRIPTION_ERROR_RESPONSES:
+            error_type, status, label = _TRANSCRIPTION_ERROR_RESPONSES[cls]
+            break
+    logger.error("%s: %s", label, e)
+    return JsonResponse({
+        'error': e.get_user_message(),
+        'success': False,
+        'error_type': error_type
+    }, status=status)
 
 @csrf_exempt
 def generate_blog(request):
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
+            data = _json_loads(request.body)
             yt_link = data.get('link', '').strip()
             
             if not yt_link:
@@ -651,119 +927,37 @@ def generate_blog(request):
             
             # Basic URL validation
             if 'youtube.com' not in yt_link and 'youtu.be' not in yt_link:
-                logger.warning(f"Invalid YouTube URL provided: {yt_link}")
+                logger.warning("Invalid YouTube URL provided: %s", yt_link)
                 return JsonResponse({'error': 'Please provide a valid YouTube URL'}, status=400)
                 
         except json.JSONDecodeError:
             logger.error("Invalid JSON data in blog generation request")
             return JsonResponse({'error': 'Invalid JSON data'}, status=400)
         except Exception as e:
-            logger.error(f"Invalid request format: {str(e)}")
+            logger.error("Invalid request format: %s", e)
             return JsonResponse({'error': 'Invalid request format'}, status=400)
         
         try:
-            logger.info(f"Starting blog generation for URL: {yt_link}")
-            generation_start_time = time.time()
+            logger.info("Starting blog generation for URL: %s", yt_link)
+            generation_start_time = time.perf_counter()
             
             # Get video title
             title = yt_title(yt_link)
             if not title:
                 title = "YouTube Video"
             
-            logger.info(f"Video title retrieved: {title}")
+            logger.info("Video title retrieved: %s", title)
             
             # Get transcript with status tracking
             try:
                 transcript_result = yt_transcript(yt_link)
-            except InvalidURLError as e:
-                logger.error(f"Invalid URL: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'invalid_url'
-                }, status=400)
-            except DurationLimitError as e:
-                logger.error(f"Duration limit exceeded: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'duration_limit'
-                }, status=400)
-            except NetworkError as e:
-                logger.error(f"Network error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'network_error'
-                }, status=503)
-            except DiskSpaceError as e:
-                logger.error(f"Disk space error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'disk_space'
-                }, status=507)
-            except FileSystemPermissionError as e:
-                logger.error(f"File system permission error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'permission_error'
-                }, status=500)
-            except AudioExtractionError as e:
-                logger.error(f"Audio extraction error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'audio_extraction'
-                }, status=400)
-            except ModelLoadError as e:
-                logger.error(f"Model load error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'model_load'
-                }, status=503)
-            except TranscriptionTimeoutError as e:
-                logger.error(f"Transcription timeout: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'timeout'
-                }, status=408)
-            except AudioFormatError as e:
-                logger.error(f"Audio format error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'audio_format'
-                }, status=400)
-            except OutOfMemoryError as e:
-                logger.error(f"Out of memory error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'out_of_memory'
-                }, status=507)
-            except WhisperError as e:
-                logger.error(f"Whisper error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'whisper_error'
-                }, status=500)
             except TranscriptionError as e:
-                logger.error(f"Transcription error: {str(e)}")
-                return JsonResponse({
-                    'error': e.get_user_message(),
-                    'success': False,
-                    'error_type': 'transcription'
-                }, status=500)
+                return _transcription_error_response(e)
             
             # Handle transcript extraction failure (for non-exception cases)
             if not transcript_result.get('success', False):
                 error_msg = transcript_result.get('error', 'Failed to extract transcript')
-                logger.error(f"Transcript extraction failed: {error_msg}")
+                logger.error("Transcript extraction failed: %s", error_msg)
                 
                 # Use utility function to get user-friendly message
                 user_error = "Unable to extract transcript from the video. Please try a different video."
@@ -774,36 +968,33 @@ def generate_blog(request):
                     'method': transcript_result.get('method', 'unknown')
                 }, status=400)
             
-            # Extract transcript text
+            # Extract transcript text and metadata
             transcription = transcript_result.get('text', '')
             method = transcript_result.get('method', 'unknown')
+            language = transcript_result.get('language', 'unknown')
+            confidence = transcript_result.get('confidence', 0)
+            processing_time = transcript_result.get('processing_time', {})
             
             # Log transcription method and metadata
             if method == 'asr':
-                processing_time = transcript_result.get('processing_time', {})
                 logger.info(
-                    f"Transcript obtained via ASR: "
-                    f"language={transcript_result.get('language', 'unknown')}, "
-                    f"confidence={transcript_result.get('confidence', 0):.2f}, "
-                    f"audio_extraction_time={processing_time.get('audio_extraction', 0):.2f}s, "
-                    f"transcription_time={processing_time.get('transcription', 0):.2f}s"
+                    "Transcript obtained via ASR: "
+                    "language=%s, confidence=%.2f, "
+                    "audio_extraction_time=%.2fs, transcription_time=%.2fs",
+                    language,
+                    confidence,
+                    processing_time.get('audio_extraction', 0),
+                    processing_time.get('transcription', 0)
                 )
             elif method == 'subtitles':
-                logger.info(f"Transcript obtained via subtitles")
+                logger.info("Transcript obtained via subtitles")
             elif method == 'description':
-                logger.info(f"Transcript obtained via video description")
+                logger.info("Transcript obtained via video description")
             
             # Prepare AI options
-            ai_options = {
-                'writing_style': data.get('writing_style', 'default'),
-                'article_length': data.get('article_length', 'medium'),
-                'custom_instructions': data.get('custom_instructions', ''),
-                'add_seo': data.get('add_seo', False),
-                'add_summary': data.get('add_summary', False),
-                'add_tags': data.get('add_tags', False)
-            }
+            ai_options = {key: data.get(key, default) for key, default in AI_OPTION_DEFAULTS}
             
-            logger.info(f"Generating blog content with options: {ai_options}")
+            logger.info("Generating blog content with options: %s", ai_options)
             
             # Generate blog content with AI enhancements
             blog_content = generate_blog_from_transcript(transcription, ai_options)
@@ -817,19 +1008,18 @@ def generate_blog(request):
                         youtube_link=yt_link,
                         generated_content=blog_content
                     )
-                    blog_article.save()
                     logger.info(
-                        f"Blog article saved to database: "
-                        f"id={blog_article.id}, user={request.user.username}"
+                        "Blog article saved to database: id=%s, user=%s",
+                        blog_article.id, request.user.username
                     )
                 except Exception as e:
-                    logger.error(f"Failed to save blog article to database: {str(e)}")
+                    logger.error("Failed to save blog article to database: %s", e)
                     # Continue even if saving fails
             
-            generation_time = time.time() - generation_start_time
+            generation_time = time.perf_counter() - generation_start_time
             logger.info(
-                f"Blog generation completed successfully: "
-                f"method={method}, total_time={generation_time:.2f}s"
+                "Blog generation completed successfully: method=%s, total_time=%.2fs",
+                method, generation_time
             )
             
             # Prepare response with metadata
@@ -837,23 +1027,27 @@ def generate_blog(request):
                 'content': blog_content,
                 'title': title,
                 'success': True,
-                'method': method,
-                'transcript': transcription  # Include original transcript
+                'method': method
             }
             
+            # The original transcript can be as long as the article itself,
+            # so it's only sent to clients that ask for it
+            if data.get('include_transcript'):
+                response_data['transcript'] = transcription
+            
             # Add ASR-specific metadata if applicable
             if method == 'asr':
                 response_data['transcription_info'] = {
-                    'language': transcript_result.get('language', 'unknown'),
-                    'confidence': transcript_result.get('confidence', 0),
-                    'processing_time': transcript_result.get('processing_time', {})
+                    'language': language,
+                    'confidence': confidence,
+                    'processing_time': processing_time
                 }
             
             return JsonResponse(response_data)
             
         except TranscriptionError as e:
             # Catch any remaining transcription errors
-            logger.error(f"Transcription error: {str(e)}", exc_info=True)
+            logger.error("Transcription error: %s", e, exc_info=True)
             status_code = 400 if is_user_error(e) else 500
             return JsonResponse({
                 'error': e.get_user_message(),
@@ -863,7 +1057,7 @@ def generate_blog(request):
             
         except Exception as e:
             logger.error(
-                f"Unexpected error during blog generation: {str(e)}",
+                "Unexpected error during blog generation: %s", e,
                 exc_info=True
             )
             # Use utility function to get user-friendly error
@@ -874,7 +1068,7 @@ def generate_blog(request):
                 'error_type': 'unexpected'
             }, status=500)
     
-    logger.warning(f"Invalid HTTP method for generate_blog: {request.method}")
+    logger.warning("Invalid HTTP method for generate_blog: %s", request.method)
     return JsonResponse({'error': 'Only POST method allowed'}, status=405)
 
 @login_required
@@ -883,18 +1077,23 @@ def delete_blog(request, pk):
     """Delete a blog article"""
     if request.method == 'POST':
         try:
-            blog_article = get_object_or_404(BlogPost, id=pk, user=request.user)
-            article_title = blog_article.youtube_title
-            blog_article.delete()
+            # One DELETE with the ownership check in SQL: nothing references
+            # BlogPost rows, so Django doesn't need to load them first
+            deleted, _ = BlogPost.objects.filter(id=pk, user=request.user).delete()
+            if not deleted:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Article not found'
+                }, status=404)
             
-            logger.info(f"Article deleted: {article_title} (id: {pk}) by user: {request.user.username}")
+            logger.info("Article deleted: id %s by user: %s", pk, request.user.username)
             
             return JsonResponse({
                 'success': True,
                 'message': 'Article deleted successfully'
             })
         except Exception as e:
-            logger.error(f"Error deleting article {pk}: {str(e)}")
+            logger.error("Error deleting article %s: %s", pk, e)
             return JsonResponse({
                 'success': False,
                 'error': str(e)
@@ -903,19 +1102,43 @@ def delete_blog(request, pk):
     return JsonResponse({'error': 'Only POST method allowed'}, status=405)
 
 
+# Characters per chunk when streaming a long text download
+DOWNLOAD_CHUNK_CHARS = 64 * 1024
+
+def _iter_encoded_chunks(text):
+    """Yield text as UTF-8 bytes, DOWNLOAD_CHUNK_CHARS characters at a time."""
+    for start in range(0, len(text), DOWNLOAD_CHUNK_CHARS):
+        yield text[start:start + DOWNLOAD_CHUNK_CHARS].encode('utf-8')
+
+def _html_to_text(html):
+    """
+    Plain text of generated article HTML, with whitespace collapsed.
+    
+    selectolax parses the markup in C and also decodes entities such as &amp;,
+    which the regex fallback leaves in place. Only for plain-text output: the
+    decoded text must not be put back into HTML unescaped.
+    """
+    if LexborHTMLParser is not None:
+        text = LexborHTMLParser(html).text()
+    else:
+        text = _RE_HTML_TAG.sub('', html)
+    return ' '.join(text.split())
+
 @login_required
 def download_blog(request, pk):
     """Download blog article as text file"""
-    blog_article = get_object_or_404(BlogPost, id=pk, user=request.user)
+    # The article body is only needed the first time; after that the rendered
+    # download is stored on the row
+    blog_article = get_object_or_404(
+        BlogPost.objects.defer('generated_content'), id=pk, user=request.user
+    )
     
-    # Clean HTML tags from content for plain text
-    content = blog_article.generated_content
-    content = re.sub(r'<[^>]+>', '', content)  # Remove HTML tags
-    content = re.sub(r'\s+', ' ', content)     # Clean up whitespace
-    content = content.strip()
-    
-    # Create the text content
-    text_content = f"""
+    if blog_article.download_text is None:
+        # Clean HTML tags from content for plain text
+        content = _html_to_text(blog_article.generated_content)
+        
+        # Create the text content
+        text_content = f"""
 {blog_article.youtube_title}
 {'=' * len(blog_article.youtube_title)}
 
@@ -930,24 +1153,102 @@ Article Content:
 {'-' * 50}
 Generated by Article I - AI Blog Generator
 """
+        
+        # Create filename (sanitize title for filename)
+        safe_title = _RE_FILENAME_UNSAFE.sub('', blog_article.youtube_title)
+        safe_title = _RE_FILENAME_SEPARATORS.sub('-', safe_title)
+        filename = f"{safe_title[:50]}-article.txt"
+        
+        # update() rather than save(): writes just these columns, and
+        # concurrent first downloads store the same values
+        BlogPost.objects.filter(pk=blog_article.pk).update(
+            download_text=text_content, download_filename=filename
+        )
+    else:
+        text_content = blog_article.download_text
+        filename = blog_article.download_filename
     
-    # Create filename (sanitize title for filename)
-    safe_title = re.sub(r'[^\w\s-]', '', blog_article.youtube_title)
-    safe_title = re.sub(r'[-\s]+', '-', safe_title)
-    filename = f"{safe_title[:50]}-article.txt"
-    
-    # Create HTTP response with file download
-    response = HttpResponse(text_content, content_type='text/plain')
+    # Create HTTP response with file download. Long articles are encoded and
+    # sent in chunks instead of building the whole encoded body first.
+    if len(text_content) > DOWNLOAD_CHUNK_CHARS:
+        response = StreamingHttpResponse(
+            _iter_encoded_chunks(text_content), content_type='text/plain; charset=utf-8'
+        )
+    else:
+        response = HttpResponse(text_content, content_type='text/plain; charset=utf-8')
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
 
+# Enhanced HTML keyed by (content digest, enhancement type, title), in LRU
+# order, so switching back and forth between enhancements of the same
+# article doesn't redo the work
+ENHANCEMENT_CACHE_SIZE = 256
+_enhancement_cache = OrderedDict()
+_enhancement_cache_lock = threading.Lock()
+
+def _cached_content_enhancement(content, enhancement_type, title):
+    """apply_content_enhancement(), cached by a BLAKE2 digest of the content."""
+    key = (
+        hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest(),
+        enhancement_type,
+        title,
+    )
+    try:
+        hash(key)
+    except TypeError:  # Unhashable values from the request body
+        return apply_content_enhancement(content, enhancement_type, title)
+    
+    with _enhancement_cache_lock:
+        enhanced = _enhancement_cache.get(key)
+        if enhanced is not None:
+            _enhancement_cache.move_to_end(key)
+            return enhanced
+    
+    enhanced = apply_content_enhancement(content, enhancement_type, title)
+    
+    with _enhancement_cache_lock:
+        _enhancement_cache[key] = enhanced
+        _enhancement_cache.move_to_end(key)
+        while len(_enhancement_cache) > ENHANCEMENT_CACHE_SIZE:
+            _enhancement_cache.popitem(last=False)
+    return enhanced
+
+# Responses smaller than this aren't worth compressing
+BROTLI_MIN_BYTES = 1024
+
+def _accepts_brotli(request):
+    """Whether the client's Accept-Encoding lists br (ignoring q=0)."""
+    for coding in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        name, _, params = coding.partition(';')
+        if name.strip() == 'br':
+            quality = params.strip().partition('q=')[2]
+            try:
+                return not quality or float(quality) > 0
+            except ValueError:
+                return False
+    return False
+
+def _brotli_compressed(request, response):
+    """
+    Brotli-compress a response body when brotli is installed and the client
+    accepts it. Quality 4 compresses HTML-heavy JSON better than gzip's
+    default level for about the same CPU.
+    """
+    if brotli is None or len(response.content) < BROTLI_MIN_BYTES:
+        return response
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if _accepts_brotli(request):
+        response.content = brotli.compress(response.content, quality=4)
+        response['Content-Encoding'] = 'br'
+    return response
+
 @csrf_exempt
 def enhance_content(request):
     """Enhance existing blog content with AI"""
     if request.method == 'POST':
         try:
-            data = json.loads(request.body)
+            data = _json_loads(request.body)
             content = data.get('content', '')
             enhancement_type = data.get('enhancement_type', '')
             title = data.get('title', '')
@@ -956,12 +1257,12 @@ def enhance_content(request):
                 return JsonResponse({'error': 'No content provided'}, status=400)
             
             # Apply different enhancements based on type
-            enhanced_content = apply_content_enhancement(content, enhancement_type, title)
+            enhanced_content = _cached_content_enhancement(content, enhancement_type, title)
             
-            return JsonResponse({
+            return _brotli_compressed(request, JsonResponse({
                 'enhanced_content': enhanced_content,
                 'success': True
-            })
+            }))
             
         except Exception as e:
             return JsonResponse({
@@ -971,45 +1272,18 @@ def enhance_content(request):
     
     return JsonResponse({'error': 'Only POST method allowed'}, status=405)
 
-def apply_content_enhancement(content, enhancement_type, title):
-    """Apply specific content enhancements"""
-    # Remove existing HTML tags for processing
-    clean_content = re.sub(r'<[^>]+>', '', content)
-    clean_content = re.sub(r'\s+', ' ', clean_content).strip()
-    
-    if enhancement_type == 'improve':
-        # Improve writing quality
-        sentences = clean_content.split('. ')
-        improved_sentences = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence:
-                # Basic improvements: capitalize, add punctuation
-                sentence = sentence[0].upper() + sentence[1:] if sentence else sentence
-                if not sentence.endswith('.'):
-                    sentence += '.'
-                improved_sentences.append(sentence)
-        
-        improved_content = ' '.join(improved_sentences)
-        
-        return f"""
+# HTML for each enhancement type, filled in with str.format_map()
+_IMPROVE_TEMPLATE = """
         <div class='bg-purple-50 p-4 rounded-lg mb-4'>
             <h4 class='font-semibold text-purple-800 mb-2'>✨ Enhanced Version</h4>
             <p class='text-sm text-purple-600'>Content has been improved for better readability and flow.</p>
         </div>
         <div class='prose max-w-none'>
-            <p class='leading-relaxed'>{improved_content}</p>
+            <p class='leading-relaxed'>{content}</p>
         </div>
         """
-    
-    elif enhancement_type == 'summarize':
-        # Create a summary
-        sentences = clean_content.split('. ')
-        key_sentences = sentences[:3]  # Take first 3 sentences as summary
-        summary = '. '.join(key_sentences) + '.'
-        
-        return f"""
+
+_SUMMARIZE_TEMPLATE = """
         <div class='bg-indigo-50 p-4 rounded-lg mb-4'>
             <h4 class='font-semibold text-indigo-800 mb-2'>📝 Summary</h4>
             <p class='text-sm text-indigo-600'>Key points extracted from the original content.</p>
@@ -1020,16 +1294,12 @@ def apply_content_enhancement(content, enhancement_type, title):
         <details class='mt-4'>
             <summary class='cursor-pointer text-indigo-600 hover:text-indigo-800'>View Full Content</summary>
             <div class='mt-2 p-4 bg-gray-50 rounded'>
-                <p class='leading-relaxed'>{clean_content}</p>
+                <p class='leading-relaxed'>{content}</p>
             </div>
         </details>
         """
-    
-    elif enhancement_type == 'expand':
-        # Expand content with additional sections
-        paragraphs = clean_content.split('\n\n')
-        
-        expanded_content = f"""
+
+_EXPAND_TEMPLATE = """
         <div class='bg-orange-50 p-4 rounded-lg mb-4'>
             <h4 class='font-semibold text-orange-800 mb-2'>📈 Expanded Content</h4>
             <p class='text-sm text-orange-600'>Additional context and details have been added.</p>
@@ -1039,7 +1309,7 @@ def apply_content_enhancement(content, enhancement_type, title):
         <p class='mb-4 leading-relaxed'>This comprehensive guide covers the key concepts presented in the video, providing detailed explanations and practical insights.</p>
         
         <h3 class='text-lg font-semibold mb-3'>Main Content</h3>
-        <p class='mb-4 leading-relaxed'>{clean_content}</p>
+        <p class='mb-4 leading-relaxed'>{content}</p>
         
         <h3 class='text-lg font-semibold mb-3'>Key Takeaways</h3>
         <ul class='list-disc pl-6 mb-4 space-y-2'>
@@ -1051,12 +1321,8 @@ def apply_content_enhancement(content, enhancement_type, title):
         <h3 class='text-lg font-semibold mb-3'>Conclusion</h3>
         <p class='leading-relaxed'>The information presented provides a solid foundation for understanding the topic and can serve as a starting point for further learning and exploration.</p>
         """
-        
-        return expanded_content
-    
-    elif enhancement_type == 'seo':
-        # Add SEO optimization
-        return f"""
+
+_SEO_TEMPLATE = """
         <div class='bg-pink-50 p-4 rounded-lg mb-4'>
             <h4 class='font-semibold text-pink-800 mb-2'>🎯 SEO Optimized</h4>
             <p class='text-sm text-pink-600'>Content has been optimized for search engines.</p>
@@ -1071,7 +1337,7 @@ def apply_content_enhancement(content, enhancement_type, title):
             </div>
             
             <h2 class='text-xl font-semibold mb-3'>Main Content</h2>
-            <p class='mb-4 leading-relaxed'>{clean_content}</p>
+            <p class='mb-4 leading-relaxed'>{content}</p>
             
             <div class='bg-gray-50 p-4 rounded-lg mt-6'>
                 <h3 class='font-semibold mb-2'>🔍 Related Keywords</h3>
@@ -1085,5 +1351,40 @@ def apply_content_enhancement(content, enhancement_type, title):
             </div>
         </article>
         """
+
+def apply_content_enhancement(content, enhancement_type, title):
+    """Apply specific content enhancements"""
+    # Remove existing HTML tags for processing
+    clean_content = _RE_HTML_TAG.sub('', content)
+    clean_content = ' '.join(clean_content.split())
+    
+    if enhancement_type == 'improve':
+        # Improve writing quality. Basic improvements: capitalize each
+        # sentence and make sure it ends with a period.
+        improved_content = ' '.join(
+            sentence[0].upper() + sentence[1:] + ('' if sentence[-1] == '.' else '.')
+            for sentence in map(str.strip, clean_content.split('. '))
+            if sentence
+        )
+        
+        return _IMPROVE_TEMPLATE.format_map({'content': improved_content})
+    
+    elif enhancement_type == 'summarize':
+        # Create a summary
+        sentences = clean_content.split('. ')
+        key_sentences = sentences[:3]  # Take first 3 sentences as summary
+        summary = '. '.join(key_sentences) + '.'
+        
+        return _SUMMARIZE_TEMPLATE.format_map({'summary': summary, 'content': clean_content})
+    
+    elif enhancement_type == 'expand':
+        # Expand content with additional sections
+        expanded_content = _EXPAND_TEMPLATE.format_map({'content': clean_content})
+        
+        return expanded_content
+    
+    elif enhancement_type == 'seo':
+        # Add SEO optimization
+        return _SEO_TEMPLATE.format_map({'title': title, 'content': clean_content})
     
     return content  # Return original if no enhancement type matches
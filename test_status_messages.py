@@ -4,113 +4,217 @@ Test script to verify status messages are properly logged during transcription.
 This script checks that the logging statements are in place.
 """
 
+import argparse
+import atexit
+import hashlib
+import json
 import os
+import re
 import sys
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+VIEWS_PATH = os.path.join(_HERE, 'blog_generator', 'views.py')
+TEMPLATE_PATH = os.path.join(_HERE, 'templates', 'index.html')
+
 # Add the project directory to the path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _HERE)
+
+# Status logging statements expected in views.py
+STATUS_CHECKS = (
+    'STATUS: Downloading audio for transcription',
+    'STATUS: Downloading audio from video',
+    'STATUS: Transcribing audio (this may take a few minutes)',
+)
+
+# Status UI elements expected in the template
+UI_CHECKS = (
+    'id="statusMessages"',
+    'id="statusText"',
+    'id="statusDetail"',
+    'id="progressBar"',
+    'id="progressText"',
+    'showStatus',
+    'hideStatus',
+    'updateProgress',
+    'Downloading audio for transcription',
+    'Transcribing audio (this may take a few minutes)',
+)
+
+# Error handling expected in the template
+ERROR_CHECKS = (
+    'showError',
+    'error_type',
+    'duration_limit',
+    'network_error',
+    'invalid_url',
+    'timeout',
+    'audio_extraction',
+    'model_load',
+)
+
+# Check groups, and the file each group is checked against (see FILE_GROUPS)
+GROUPS = {
+    'status': STATUS_CHECKS,
+    'ui': UI_CHECKS,
+    'error': ERROR_CHECKS,
+}
+
+GROUP_TITLES = {
+    'status': "Checking for status logging statements in views.py...",
+    'ui': "Checking for status UI elements in template...",
+    'error': "Checking for error handling in template...",
+}
+
+FILE_GROUPS = {
+    VIEWS_PATH: ('status',),
+    TEMPLATE_PATH: ('ui', 'error'),
+}
+
+def _literal_pattern(checks):
+    """Compile one pattern that finds every check in a single pass over the content."""
+    # The lookahead keeps matches zero-width, so a check overlapping another still counts
+    return re.compile('(?=(%s))' % '|'.join(re.escape(c) for c in checks))
+
+ALL_CHECKS = tuple(check for checks in GROUPS.values() for check in checks)
+ALL_RE = _literal_pattern(ALL_CHECKS)
+
+# Each file's content, read once and shared by every scan of it
+_FILE_CACHE = {}
+
+def _get(path):
+    """Return the cached content of the file at path."""
+    content = _FILE_CACHE.get(path)
+    if content is None:
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        _FILE_CACHE[path] = content
+    return content
+
+# Results from earlier runs, per file, valid while its mtime and size are unchanged
+RESULT_CACHE_PATH = os.path.join(_HERE, '.status_test_cache.json')
+_CHECKS_DIGEST = hashlib.blake2b('\0'.join(ALL_CHECKS).encode(), digest_size=16).hexdigest()
+
+def _load_result_cache():
+    try:
+        with open(RESULT_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Results recorded against a different set of checks don't apply
+    if not isinstance(cache, dict) or cache.get('checks') != _CHECKS_DIGEST:
+        return {}
+    return cache.get('files', {})
+
+_RESULT_CACHE = _load_result_cache()
+_result_cache_dirty = False
+
+@atexit.register
+def _save_result_cache():
+    if not _result_cache_dirty:
+        return
+    try:
+        with open(RESULT_CACHE_PATH, 'w') as f:
+            json.dump({'checks': _CHECKS_DIGEST, 'files': _RESULT_CACHE}, f)
+    except OSError:
+        pass
+
+def scan_file(path, group_names, fast=False):
+    """Scan a file once for the checks of every named group.
+    
+    Returns a dict mapping each group name to the list of its checks that are missing.
+    Results are reused from the previous run while the file's mtime and size are unchanged.
+    With fast, the file is searched check by check and the result stops at the first
+    missing check.
+    """
+    global _result_cache_dirty
+    
+    st = os.stat(path)
+    cached = _RESULT_CACHE.get(path)
+    if cached and cached['mtime_ns'] == st.st_mtime_ns and cached['size'] == st.st_size:
+        return {name: cached['missing'][name] for name in group_names}
+    
+    content = _get(path)
+    if fast:
+        # Partial results aren't cached, since later runs need every missing check
+        missing = {}
+        for name in group_names:
+            missing[name] = []
+            for check in GROUPS[name]:
+                if check not in content:
+                    missing[name].append(check)
+                    return missing
+        return missing
+    
+    found = {m.group(1) for m in ALL_RE.finditer(content)}
+    
+    # Record every group so a later call for any of them is a hit
+    missing = {name: [check for check in checks if check not in found] for name, checks in GROUPS.items()}
+    _RESULT_CACHE[path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'missing': missing}
+    _result_cache_dirty = True
+    return {name: missing[name] for name in group_names}
+
+def _report(lines, group_name, missing, fast=False):
+    """Append found/missing lines for each check in the group and return True if none are missing.
+    
+    With fast, reporting stops at the first missing check.
+    """
+    missing_set = set(missing)
+    for check in GROUPS[group_name]:
+        if check in missing_set:
+            if fast:
+                lines.append(f"✗ Missing: {check} (aborting)\n")
+                return False
+            lines.append(f"✗ Missing: {check}\n")
+        else:
+            lines.append(f"✓ Found: {check}\n")
+    return not missing
+
+def _check_group(path, group_name):
+    lines = [GROUP_TITLES[group_name] + "\n"]
+    passed = _report(lines, group_name, scan_file(path, (group_name,))[group_name])
+    sys.stdout.write("".join(lines))
+    return passed
 
 def test_status_logging():
     """Test that status messages are logged in views.py"""
-    views_path = os.path.join(os.path.dirname(__file__), 'blog_generator', 'views.py')
-    
-    with open(views_path, 'r') as f:
-        content = f.read()
-    
-    # Check for status logging statements
-    status_checks = [
-        'STATUS: Downloading audio for transcription',
-        'STATUS: Downloading audio from video',
-        'STATUS: Transcribing audio (this may take a few minutes)',
-    ]
-    
-    print("Checking for status logging statements in views.py...")
-    all_found = True
-    
-    for status_msg in status_checks:
-        if status_msg in content:
-            print(f"✓ Found: {status_msg}")
-        else:
-            print(f"✗ Missing: {status_msg}")
-            all_found = False
-    
-    return all_found
+    return _check_group(VIEWS_PATH, 'status')
 
 def test_template_status_ui():
     """Test that status UI elements are in the template"""
-    template_path = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
-    
-    with open(template_path, 'r') as f:
-        content = f.read()
-    
-    # Check for UI elements
-    ui_checks = [
-        'id="statusMessages"',
-        'id="statusText"',
-        'id="statusDetail"',
-        'id="progressBar"',
-        'id="progressText"',
-        'showStatus',
-        'hideStatus',
-        'updateProgress',
-        'Downloading audio for transcription',
-        'Transcribing audio (this may take a few minutes)',
-    ]
-    
-    print("\nChecking for status UI elements in template...")
-    all_found = True
-    
-    for ui_element in ui_checks:
-        if ui_element in content:
-            print(f"✓ Found: {ui_element}")
-        else:
-            print(f"✗ Missing: {ui_element}")
-            all_found = False
-    
-    return all_found
+    return _check_group(TEMPLATE_PATH, 'ui')
 
 def test_error_handling():
     """Test that error messages are properly handled"""
-    template_path = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
-    
-    with open(template_path, 'r') as f:
-        content = f.read()
-    
-    # Check for error handling
-    error_checks = [
-        'showError',
-        'error_type',
-        'duration_limit',
-        'network_error',
-        'invalid_url',
-        'timeout',
-        'audio_extraction',
-        'model_load',
-    ]
-    
-    print("\nChecking for error handling in template...")
-    all_found = True
-    
-    for error_check in error_checks:
-        if error_check in content:
-            print(f"✓ Found: {error_check}")
-        else:
-            print(f"✗ Missing: {error_check}")
-            all_found = False
-    
-    return all_found
+    return _check_group(TEMPLATE_PATH, 'error')
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check that status messages are in place.")
+    parser.add_argument('--fast', action='store_true',
+                        help="stop checking a file at its first missing check")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("Testing Status Messages Implementation")
     print("=" * 60)
     
-    test1 = test_status_logging()
-    test2 = test_template_status_ui()
-    test3 = test_error_handling()
+    # One scan per file covers every group checked against it
+    results = [scan_file(path, group_names, args.fast) for path, group_names in FILE_GROUPS.items()]
+    
+    # Write each file's report in one go
+    all_passed = True
+    for result in results:
+        lines = []
+        for group_name, missing in result.items():
+            lines.append("\n" + GROUP_TITLES[group_name] + "\n")
+            if not _report(lines, group_name, missing, args.fast):
+                all_passed = False
+                if args.fast:
+                    break
+        sys.stdout.write("".join(lines))
     
     print("\n" + "=" * 60)
-    if test1 and test2 and test3:
+    if all_passed:
         print("✓ All tests passed!")
         print("=" * 60)
         sys.exit(0)